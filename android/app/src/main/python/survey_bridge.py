@@ -17,14 +17,15 @@ from cave_sketch.survey.survey import draw_survey
 
 
 def resolve_input(input_path: Optional[str], work_dir: str, stem: str) -> Optional[str]:
-    """Return a CSV path for an input. DXF inputs are parsed to <work_dir>/<stem>.csv;
-    CSV inputs are returned unchanged; None/empty returns None."""
+    """Return a CSV path for an input. DXF inputs are parsed to <work_dir>/<stem>.csv
+    with the streaming (low-memory) reader; CSV inputs are returned unchanged;
+    None/empty returns None."""
     if not input_path:
         return None
     src = Path(input_path)
     if src.suffix.lower() == ".dxf":
         csv_path = Path(work_dir) / f"{stem}.csv"
-        parse_dxf(src, csv_path)
+        parse_dxf(src, csv_path, low_memory=True)
         return str(csv_path)
     return str(src)
 
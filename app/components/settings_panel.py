@@ -28,6 +28,11 @@ def settings_panel_component():
         show_grid = st.checkbox("Show grid", value=st.session_state.get("show_grid", True))
         st.session_state.show_grid = show_grid
 
+        show_stats = st.checkbox(
+            "Show survey statistics", value=st.session_state.get("show_stats", False)
+        )
+        st.session_state.show_stats = show_stats
+
     with col2:
         marker_zoom = st.number_input(
             "🔍 Marker zoom [-1, 1]", min_value=-1.0, max_value=1.0, value=0.0, step=0.1
@@ -45,6 +50,7 @@ def settings_panel_component():
         "show_details": show_details,
         "show_grid": show_grid,
         "show_centerline": show_centerline,
+        "show_stats": show_stats,
         "marker_zoom": marker_zoom,
         "text_zoom": text_zoom,
         "line_width_zoom": line_width_zoom,
@@ -1,6 +1,5 @@
 from pathlib import Path
 
-import pandas as pd
 import streamlit as st
 from components.file_upload import (
     child_file_uploader_component,
@@ -43,8 +42,9 @@ if st.button("✨ Generate Survey Plot"):
     if not merge_valid:
         st.error("⚠️ Please resolve the merging errors before generating the plot.")
     elif st.session_state.map_csv or st.session_state.section_csv:
-        from cave_sketch.survey.merger import SectionProtocol, merge_surveys
+        from cave_sketch.survey.merger import SectionProtocol
         pdf_path = st.session_state.files_dir / "survey.pdf"
+        merge_plan = st.session_state.merge_plan
         with st.spinner("🛠️ Creating survey plot..."):
             fig = draw_survey(
                 title=title,
@@ -59,6 +59,8 @@ if st.button("✨ Generate Survey Plot"):
                 output_path=pdf_path,
                 surveyor_name=surveyor_name,
                 config=settings,
+                merge_plan=merge_plan,
+                render_cache=st.session_state.render_cache,
             )
             st.session_state.cave_survey = fig
             st.session_state.pdf_output_path = pdf_path
@@ -67,16 +69,13 @@ if st.button("✨ Generate Survey Plot"):
                 and st.session_state.parent_station
                 and st.session_state.child_station
             ):
-                _parent_df = pd.read_csv(st.session_state.map_csv)
-                _child_df = pd.read_csv(st.session_state.child_map_csv)
-                _merged_df, _ = merge_surveys(
-                    parent_map=_parent_df,
+                # Same inputs as draw_survey: served from the merge plan, not merged again
+                _merged_df, _ = merge_plan.merge(
+                    parent_map=st.session_state.map_csv,
                     parent_section=None,
-                    child_map=_child_df,
-                    child_section=None,
+                    child_map=st.session_state.child_map_csv,
                     parent_station=st.session_state.parent_station,
                     child_station=st.session_state.child_station,
-                    section_protocol=SectionProtocol(st.session_state.section_protocol),
                 )
                 _merged_path = st.session_state.files_dir / "merged_map.csv"
                 if _merged_df is not None:
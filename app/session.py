@@ -7,6 +7,9 @@ from typing import Any, Dict, List, Optional, TypedDict
 import streamlit as st
 from matplotlib.figure import Figure
 
+from cave_sketch.survey.merge_plan import MergePlan
+from cave_sketch.survey.render_cache import RenderCache
+
 
 class AppState(TypedDict):
     files_dir: Path
@@ -15,6 +18,8 @@ class AppState(TypedDict):
     map_loaded: bool
     map_csv: Optional[Path]
     section_csv: Optional[Path]
+    merge_plan: MergePlan
+    render_cache: RenderCache
     known_points: List[Dict[str, Any]]
     rotation_angle: float
     html_content: Optional[str]
@@ -24,6 +29,7 @@ class AppState(TypedDict):
     survey_name: str
     show_grid: bool
     show_centerline: bool
+    show_stats: bool
 
 
 def init_session() -> None:
@@ -46,6 +52,8 @@ def init_session() -> None:
         "parent_station": "",
         "child_station": "",
         "section_protocol": "simple",
+        "merge_plan": MergePlan(),
+        "render_cache": RenderCache(),
         "child_expander_open": False,
         "known_points": [{"station": "", "lat": 0.0, "lon": 0.0}],
         "rotation_angle": 0.0,
@@ -58,6 +66,7 @@ def init_session() -> None:
         "surveyor_name": "",
         "show_grid": True,
         "show_centerline": True,
+        "show_stats": False,
     }
 
     for key, val in defaults.items():
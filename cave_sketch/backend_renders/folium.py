@@ -1,46 +1,74 @@
-from typing import Dict
+from typing import Dict, List, Optional, Union
 
 import folium
+import numpy as np
 
+from cave_sketch.features.feature_set import FeatureSet
 
-def render_to_folium(features: Dict[str, list], folium_map, layer_name: str):
-    """Render extracted features onto a Folium map."""
+
+def render_to_folium(features: Union[FeatureSet, Dict[str, list]], folium_map, layer_name: str):
+    """
+    Render extracted features onto a Folium map.
+
+    Segments sharing a style and a popup (e.g. all the walls of a JSON map) are
+    drawn as a single multi-polyline.
+    """
+    if not isinstance(features, FeatureSet):
+        features = FeatureSet.from_features(features)
     fg = folium.FeatureGroup(name=layer_name)
 
     # ---- POLYGONS ----
-    for p in features.get("polygons", []):
+    polygon_labels: List[Optional[str]] = [None] * features.n_polygons
+    if features.polygon_labels:
+        polygon_labels = list(features.polygon_labels)
+    for ring, code, label in zip(
+        features.polygon_rings(), features.polygon_styles.tolist(), polygon_labels
+    ):
+        style = features.styles[code]
         folium.Polygon(
-            locations=p["coords"],
-            color=p.get("edge_color", p.get("fill_color", "blue")),
+            locations=ring[:, ::-1].tolist(),
+            color=style.color,
             weight=0,
-            fillColor=p.get("fill_color", "blue"),
-            fillOpacity=p.get("fill_opacity", 0.3),
-            popup=p.get("popup"),
+            fillColor=style.color,
+            fillOpacity=style.fill_opacity,
+            popup=label,
         ).add_to(fg)
 
     # ---- LINES ----
-    for line in features.get("lines", []):
+    segment_labels = features.segment_labels or [""] * len(features.segments)
+    groups: Dict[tuple, list] = {}
+    for code, label, row in zip(
+        features.segment_styles.tolist(), segment_labels, range(len(segment_labels))
+    ):
+        groups.setdefault((code, label), []).append(row)
+    for (code, label), rows in groups.items():
+        style = features.styles[code]
+        locations = features.segments[np.asarray(rows)][:, :, ::-1].tolist()
         kwargs = dict(
-            locations=line["coords"],
-            color=line.get("color", "black"),
-            weight=line.get("weight", 1),
+            locations=locations[0] if len(locations) == 1 else locations,
+            color=style.color,
+            weight=style.weight,
             opacity=0.8,
-            popup=line.get("popup", ""),
+            popup=label,
         )
-        if line.get("dash"):
-            kwargs["dashArray"] = ",".join(map(str, line["dash"]))
+        if style.dash:
+            kwargs["dashArray"] = ",".join(map(str, style.dash))
         folium.PolyLine(**kwargs).add_to(fg)
 
     # ---- POINTS (B_ice, BLOCK, etc.) ----
-    for p in features.get("points", []):
+    point_labels = features.point_labels or [""] * len(features.point_xy)
+    for (x, y), code, label in zip(
+        features.point_xy.tolist(), features.point_styles.tolist(), point_labels
+    ):
+        style = features.styles[code]
         folium.CircleMarker(
-            location=p["coords"],
-            radius=p.get("size", 6),
-            color=p.get("color", "black"),
+            location=[y, x],
+            radius=style.size,
+            color=style.color,
             fill=True,
-            fillColor=p.get("color", "black"),
+            fillColor=style.color,
             fillOpacity=0.9,
-            popup=p.get("popup", ""),
+            popup=label,
         ).add_to(fg)
 
     fg.add_to(folium_map)
@@ -3,8 +3,8 @@ import zipfile
 from typing import Any, Dict, List
 from xml.dom import minidom
 
-from cave_sketch.features.chaining import chain_segments_by_type
-from cave_sketch.features.render_features import extract_features_from_json
+from cave_sketch.features.chaining import chain_feature_segments
+from cave_sketch.features.render_features import extract_feature_set_from_json
 from cave_sketch.style import STYLE_MAP
 
 
@@ -31,7 +31,7 @@ def rgba_to_kml_color(color: str, opacity: float = 1.0) -> str:
 def render_to_kml(map_list: List[Dict[str, Any]], layer_name: str = "All Maps") -> str:
     """
     Convert a list of map JSONs into a single KML string, grouped by map name.
-    Each JSON is processed by `extract_features_from_json` and chained.
+    Each JSON is processed by `extract_feature_set_from_json` and chained.
     """
     # Root KML structure
     kml = ET.Element("kml", xmlns="http://www.opengis.net/kml/2.2")
@@ -72,15 +72,15 @@ def render_to_kml(map_list: List[Dict[str, Any]], layer_name: str = "All Maps")
 
     # Process each JSON
     for map_data in map_list:
-        features = extract_features_from_json(map_data)
+        features = extract_feature_set_from_json(map_data, include_points=True)
         folder = ET.SubElement(doc, "Folder")
         ET.SubElement(folder, "name").text = map_data.get("name", "Unnamed Map")
 
         # --- POLYGONS ---
-        for p in features.get("polygons", []):
+        for ring, label in zip(features.polygon_rings(), features.polygon_labels or []):
             placemark = ET.SubElement(folder, "Placemark")
-            ET.SubElement(placemark, "name").text = p.get("popup", "")
-            
+            ET.SubElement(placemark, "name").text = label
+
             # Use shared style if available, otherwise fallback
             style_id = "#area_A_water" # By default in old code it was water
             ET.SubElement(placemark, "styleUrl").text = style_id
@@ -88,27 +88,26 @@ def render_to_kml(map_list: List[Dict[str, Any]], layer_name: str = "All Maps")
             # ---- GEOMETRY ----
             polygon = ET.SubElement(placemark, "Polygon")
             outer = ET.SubElement(polygon, "outerBoundaryIs")
-            ring = ET.SubElement(outer, "LinearRing")
+            linear_ring = ET.SubElement(outer, "LinearRing")
 
             # Coordinates without altitude
-            coord_str = " ".join([f"{lon},{lat}" for lat, lon in p["coords"]])
-            ET.SubElement(ring, "coordinates").text = coord_str
+            coord_str = " ".join([f"{lon},{lat}" for lon, lat in ring.tolist()])
+            ET.SubElement(linear_ring, "coordinates").text = coord_str
 
         # --- LINES ---
-        # Get raw lines from map_data, chain them by type
-        raw_lines = map_data.get("lines", [])
-        chained = chain_segments_by_type(raw_lines)
-        
+        # Chain the line segments by type
+        chained = chain_feature_segments(features)
+
         for ltype, polylines in chained.items():
             if not polylines:
                 continue
-                
+
             placemark = ET.SubElement(folder, "Placemark")
             ET.SubElement(placemark, "name").text = ltype
-            
+
             # Reference shared style
             ET.SubElement(placemark, "styleUrl").text = f"#line_{ltype}"
-            
+
             multi_geo = ET.SubElement(placemark, "MultiGeometry")
             for polyline in polylines:
                 ls = ET.SubElement(multi_geo, "LineString")
@@ -117,24 +116,17 @@ def render_to_kml(map_list: List[Dict[str, Any]], layer_name: str = "All Maps")
                 ET.SubElement(ls, "coordinates").text = coord_str
 
         # --- POINTS ---
-        nodes_data = map_data.get("nodes", [])
-        nodes_list = nodes_data if isinstance(nodes_data, list) else [
-            {"id": k, **v} for k, v in nodes_data.items()
-        ]
-        
-        for n in nodes_list:
-            ntype = n.get("type", "")
-            style_info = STYLE_MAP.get(ntype)
-            if style_info and style_info.get("type") == "point":
-                placemark = ET.SubElement(folder, "Placemark")
-                ET.SubElement(placemark, "name").text = str(n.get("id", ""))
-                
-                # Reference shared style
-                ET.SubElement(placemark, "styleUrl").text = f"#point_{ntype}"
-                
-                point = ET.SubElement(placemark, "Point")
-                lat, lon = n["lat"], n["lon"]
-                ET.SubElement(point, "coordinates").text = f"{lon},{lat},0"
+        for (lon, lat), code, label in zip(
+            features.point_xy.tolist(), features.point_styles.tolist(), features.point_labels or []
+        ):
+            placemark = ET.SubElement(folder, "Placemark")
+            ET.SubElement(placemark, "name").text = label
+
+            # Reference shared style
+            ET.SubElement(placemark, "styleUrl").text = f"#point_{features.styles[code].name}"
+
+            point = ET.SubElement(placemark, "Point")
+            ET.SubElement(point, "coordinates").text = f"{lon},{lat},0"
 
     # Pretty-print XML
     rough_string = ET.tostring(kml, "utf-8")
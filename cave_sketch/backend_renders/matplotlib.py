@@ -1,121 +1,118 @@
-from typing import Any, Dict, List, Optional
+from typing import Dict, Optional, Union
 
 import numpy as np
-from matplotlib.collections import LineCollection
-from matplotlib.patches import Polygon as MplPolygon
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.colors import to_rgba_array
+
+from cave_sketch.features.feature_set import FeatureSet
 
 
 def render_to_matplotlib(
-    features: Dict[str, list], ax, layer_name: str = "", config: Optional[Dict] = None
+    features: Union[FeatureSet, Dict[str, list]],
+    ax,
+    layer_name: str = "",
+    config: Optional[Dict] = None,
 ):
     """
     Render extracted features onto a Matplotlib Axes with stable line scaling.
+
+    Args:
+        features: FeatureSet, or features in the list-of-dicts layout.
+        ax: Matplotlib Axes to draw on.
+        layer_name: Optional axes title.
+        config: Optional line_width_zoom, ref_scale and show_labels settings. A
+            line_width_pt draws weight * line_width_pt points wide lines instead,
+            whatever the zoom and ref_scale.
     """
     if config is None:
         config = {}
+    if not isinstance(features, FeatureSet):
+        features = FeatureSet.from_features(features)
 
     # Extract parameters
     lz = config.get("line_width_zoom", 10)
     ref_scale = config.get("ref_scale", 1.0)
     zoom_factor = 10 ** (lz - 10)
+    colors = features.style_values("color")
 
     # ---- POLYGONS ----
-    for p in features.get("polygons", []):
-        coords = np.array(p["coords"], dtype=float)
-        xy = np.column_stack((coords[:, 1], coords[:, 0]))
-        poly = MplPolygon(
-            xy,
-            closed=True,
-            facecolor=p.get("fill_color", "blue"),
-            edgecolor=p.get("edge_color", p.get("fill_color", "blue")),
-            alpha=p.get("fill_opacity", 0.3),
-            linewidth=0.5,
-            zorder=p.get("zorder", 1),
+    if features.n_polygons:
+        codes = features.polygon_styles
+        opacities = features.style_values("fill_opacity").astype(float)
+        rgba = to_rgba_array(colors.tolist())
+        rgba[:, 3] = opacities
+        ax.add_collection(
+            PolyCollection(
+                features.polygon_rings(),
+                closed=True,
+                facecolors=rgba[codes],
+                edgecolors=rgba[codes],
+                linewidths=0.5,
+                zorder=1,
+            )
         )
-        ax.add_patch(poly)
+        ax.autoscale_view()
 
     # ---- LINES ----
-    segments = []
-    colors = []
-    linewidths = []
-    linestyles = []
-
-    for line in features.get("lines", []):
-        coords = np.array(line["coords"], dtype=float)
-        # coords is [[y1, x1], [y2, x2]], we need [[x1, y1], [x2, y2]]
-        segment = [(coords[0, 1], coords[0, 0]), (coords[1, 1], coords[1, 0])]
-        segments.append(segment)
-
-        colors.append(line.get("color", "black"))
-
-        base_weight = line.get("weight", 1)
-        lw = base_weight * zoom_factor / ref_scale
-        lw = np.clip(lw, 0.2, 4)
-        linewidths.append(lw)
-
-        dash = line.get("dash")
-        linestyle = (0, tuple(dash)) if dash else "solid"
-        linestyles.append(linestyle)
-
-    if segments:
-        lc = LineCollection(
-            segments,
-            colors=colors,
-            linewidths=linewidths,
-            linestyles=linestyles,
-            alpha=0.9,
-            zorder=2,
-        )
-        ax.add_collection(lc)
+    # One collection per style, in order of first appearance
+    if len(features.segments):
+        weights = features.style_values("weight").astype(float)
+        if "line_width_pt" in config:
+            linewidths = np.clip(weights * config["line_width_pt"], 0.2, 4)
+        else:
+            linewidths = np.clip(weights * zoom_factor / ref_scale, 0.2, 4)
+        codes = features.segment_styles
+        order = np.argsort(codes, kind="stable")
+        sorted_segments = features.segments[order]
+        used, starts = np.unique(codes[order], return_index=True)
+        bounds = np.append(starts, len(order))
+        for i in np.argsort(order[starts], kind="stable"):
+            style = features.styles[used[i]]
+            lc = LineCollection(
+                list(sorted_segments[bounds[i] : bounds[i + 1]]),
+                colors=style.color,
+                linewidths=linewidths[used[i]],
+                linestyles=(0, tuple(style.dash)) if style.dash else "solid",
+                alpha=0.9,
+                zorder=2,
+            )
+            ax.add_collection(lc)
         ax.autoscale_view()
 
     # ---- POINTS (B_ice, BLOCK, etc.) ----
-    points_by_marker: Dict[str, List[Dict[str, Any]]] = {}
-    for p in features.get("points", []):
-        marker = p.get("marker", "o")
-        points_by_marker.setdefault(marker, []).append(p)
-
-    for marker, plist in points_by_marker.items():
-        xs = []
-        ys = []
-        sizes = []
-        colors = []
-        zorder = 3
-        for p in plist:
-            y, x = p["coords"]
-            xs.append(x)
-            ys.append(y)
-            size_pts = p.get("size", 6)
-            s_area = size_pts**2 * 0.5
-            sizes.append(s_area)
-            colors.append(p.get("color", "black"))
-            zorder = p.get("zorder", 3)
-
-        ax.scatter(
-            xs,
-            ys,
-            s=sizes,
-            c=colors,
-            marker=marker,
-            edgecolors="none",
-            alpha=0.9,
-            zorder=zorder,
-        )
-
-        # Optional text label
-        if config.get("show_labels", False):
-            for p in plist:
-                y, x = p["coords"]
-                ax.text(
-                    x,
-                    y,
-                    p.get("popup", ""),
-                    fontsize=5,
-                    ha="left",
-                    va="bottom",
-                    color=p.get("color", "black"),
-                    zorder=4,
-                )
+    if len(features.point_xy):
+        markers = features.style_values("marker")[features.point_styles]
+        sizes = features.style_values("size").astype(float) ** 2 * 0.5
+        _, first = np.unique(markers, return_index=True)
+        for marker in markers[np.sort(first)]:
+            rows = np.flatnonzero(markers == marker)
+            codes = features.point_styles[rows]
+            xy = features.point_xy[rows]
+            ax.scatter(
+                xy[:, 0],
+                xy[:, 1],
+                s=sizes[codes],
+                c=colors[codes].tolist(),
+                marker=marker,
+                edgecolors="none",
+                alpha=0.9,
+                zorder=3,
+            )
+
+            # Optional text label
+            if config.get("show_labels", False):
+                labels = features.point_labels or [""] * len(features.point_xy)
+                for row, (x, y), color in zip(rows, xy.tolist(), colors[codes]):
+                    ax.text(
+                        x,
+                        y,
+                        labels[row],
+                        fontsize=5,
+                        ha="left",
+                        va="bottom",
+                        color=color,
+                        zorder=4,
+                    )
 
     if layer_name:
         ax.set_title(layer_name, fontsize=10)
@@ -2,7 +2,24 @@ from dataclasses import dataclass, field
 from typing import List
 
 
-@dataclass
+class _EmptyLinks(list):
+    """Read-only empty list shared by every point without links."""
+
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("NO_LINKS is shared between points; assign a new list instead.")
+
+    append = extend = insert = remove = pop = clear = sort = reverse = _read_only
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+
+
+# Shared sentinel for points without links (block points, isolated stations, ...),
+# passed explicitly by the bulk constructors; SurveyPoint still defaults to a new list
+NO_LINKS: List[str] = _EmptyLinks()
+
+
+@dataclass(slots=True)
 class SurveyPoint:
     """Represents a single point in the cave survey, such as a station or a detail point."""
 
@@ -14,7 +31,7 @@ class SurveyPoint:
     links: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class SurveyLine:
     """Represents a connection between two survey points with a specific line style."""
 
@@ -1,38 +1,56 @@
+import math
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import ezdxf
 import pandas as pd
+from ezdxf.addons import iterdxf
 
-from cave_sketch.dxf.models import CaveSurvey, SurveyLine, SurveyPoint
+from cave_sketch.dxf.models import NO_LINKS, CaveSurvey, SurveyLine, SurveyPoint
 
+# Entity types read by _scan_modelspace; everything else (splays, hatches, ...) is skipped
+_SCANNED_TYPES = ["TEXT", "LINE", "POLYLINE", "INSERT"]
 
-def parse_dxf(input_path: Path, output_path: Optional[Path] = None) -> CaveSurvey:
+
+def parse_dxf(
+    input_path: Path,
+    output_path: Optional[Path] = None,
+    station_tolerance: float = 0.0,
+    low_memory: bool = False,
+) -> CaveSurvey:
     """
     Parse a TopoDroid DXF file into a CaveSurvey dataclass.
 
     Args:
         input_path: Path to the .dxf file.
         output_path: Optional path to save a CSV representation of the parsed data.
+        station_tolerance: Maximum distance (drawing units) between a leg end and a
+            station for them to be matched. 0 requires exact coordinates.
+        low_memory: Stream the entities straight from the file instead of loading the
+            whole DXF document. Produces the same survey with a much lower peak memory.
 
     Returns:
         A CaveSurvey object containing points and lines.
     """
     input_str = str(input_path)
-    doc = ezdxf.readfile(input_str)
-    msp = doc.modelspace()
+    if low_memory:
+        scan = _scan_modelspace(iterdxf.modelspace(input_str, types=_SCANNED_TYPES))
+    else:
+        doc = ezdxf.readfile(input_str)
+        scan = _scan_modelspace(doc.modelspace())
 
-    stations = _get_stations(msp)
-    all_polylines = _parse_polylines(msp, filter_layers=["SCRAP_0"])
-    offset_x, offset_y = _get_offset(msp, offset_idx=0)
-    blocks = _get_features(msp)
+    stations = _get_stations(scan, tolerance=station_tolerance)
+    all_polylines = _parse_polylines(scan, filter_layers=["SCRAP_0"])
+    offset_x, offset_y = _get_offset(scan, offset_idx=0)
+    blocks = _get_features(scan)
 
     survey = CaveSurvey(name=input_path.stem)
 
     # Process stations
     for idx, item in stations.items():
         links_str = item.get("links", "")
-        links = [link.strip() for link in links_str.split("-") if link.strip()] if links_str else []
+        links = [link.strip() for link in links_str.split("-") if link.strip()] or NO_LINKS
         x, y = item["point"]
         survey.points.append(
             SurveyPoint(
@@ -54,7 +72,7 @@ def parse_dxf(input_path: Path, output_path: Optional[Path] = None) -> CaveSurve
         poly_points = []
         for j, (x, y) in enumerate(pts):
             node_id = f"{i}P{j}"
-            links = []
+            links = NO_LINKS if len(pts) == 1 else []
             if j > 0:
                 links.append(f"{i}P{j - 1}")
             if j < len(pts) - 1:
@@ -78,7 +96,7 @@ def parse_dxf(input_path: Path, output_path: Optional[Path] = None) -> CaveSurve
                 x=block["X"] - offset_x,
                 y=block["Y"] - offset_y,
                 point_type=block["Type"],
-                links=[],
+                links=NO_LINKS,
             )
         )
 
@@ -88,32 +106,70 @@ def parse_dxf(input_path: Path, output_path: Optional[Path] = None) -> CaveSurve
     return survey
 
 
-def _get_stations(msp: Any) -> Dict:
-    idxs, coords, legs = [], [], []
-    for entity in msp:
-        if entity.dxf.layer == "STATION":
-            if entity.dxftype() == "TEXT":
-                station_idx = entity.dxf.text
-                idxs.append(station_idx)
-            elif entity.dxftype() == "LINE":
-                start = entity.dxf.start
-                coords.append((start.x, start.y))
-        elif entity.dxf.layer == "LEG":
-            if entity.dxftype() == "LINE":
+@dataclass
+class _ModelspaceScan:
+    """Primitives collected from the modelspace in a single pass, bucketed per extractor."""
+
+    # ("TEXT", label) and ("LINE", (x, y)) tuples of the STATION layer, in drawing order
+    station: List[Tuple[str, Any]] = field(default_factory=list)
+    # (start, end) of every LINE on the LEG layer
+    legs: List[Tuple[Tuple[float, float], Tuple[float, float]]] = field(default_factory=list)
+    polylines: List[Dict] = field(default_factory=list)
+    # (block name, x, y) of every INSERT
+    inserts: List[Tuple[str, float, float]] = field(default_factory=list)
+
+
+def _scan_modelspace(entities: Iterable[Any]) -> _ModelspaceScan:
+    """
+    Walk the modelspace once and sort the entities needed by the extractors.
+
+    Only plain coordinates and attributes are kept, so the entities themselves can be
+    released as soon as they are visited.
+    """
+    scan = _ModelspaceScan()
+    for entity in entities:
+        layer = entity.dxf.layer
+        dxftype = entity.dxftype()
+        if layer == "STATION":
+            if dxftype == "TEXT":
+                scan.station.append(("TEXT", entity.dxf.text))
+            elif dxftype == "LINE":
                 start = entity.dxf.start
-                end = entity.dxf.end
-                legs.append({"start": (start.x, start.y), "end": (end.x, end.y)})
+                scan.station.append(("LINE", (start.x, start.y)))
+        elif layer == "LEG" and dxftype == "LINE":
+            start = entity.dxf.start
+            end = entity.dxf.end
+            scan.legs.append(((start.x, start.y), (end.x, end.y)))
+
+        if dxftype == "POLYLINE":
+            scan.polylines.append(
+                {
+                    "points": [(pt[0], pt[1]) for pt in entity.points()],
+                    "color": entity.dxf.color,
+                    "linetype": entity.dxf.linetype,
+                    "lineweight": entity.dxf.lineweight,
+                    "layer": layer,
+                }
+            )
+        elif dxftype == "INSERT":
+            insert = entity.dxf.insert
+            scan.inserts.append((entity.dxf.name, insert.x, insert.y))
+    return scan
+
+
+def _get_stations(scan: _ModelspaceScan, tolerance: float = 0.0) -> Dict:
+    idxs = [value for kind, value in scan.station if kind == "TEXT"]
+    coords = [value for kind, value in scan.station if kind == "LINE"]
 
     stations: Dict[str, Dict] = {idx: {"point": coord} for idx, coord in zip(idxs, coords)}
+    index = _build_station_index(stations, tolerance)
 
-    for leg in legs:
-        station_1, station_2 = None, None
-        for station, item in stations.items():
-            coord = item["point"]
-            if leg["start"] == coord:
-                station_1 = station
-            elif leg["end"] == coord:
-                station_2 = station
+    for start, end in scan.legs:
+        station_1 = _match_station(start, stations, index, tolerance)
+        station_2 = _match_station(end, stations, index, tolerance)
+        if station_1 == station_2:
+            # Degenerate leg: both ends resolve to the same station
+            continue
         if station_1 and station_2:
             s1_links = stations[station_1].get("links")
             if s1_links:
@@ -130,50 +186,89 @@ def _get_stations(msp: Any) -> Dict:
     return stations
 
 
-def _parse_polylines(msp: Any, filter_layers: Optional[List[str]] = None) -> List[Dict]:
-    result = []
-    for entity in msp.query("POLYLINE"):
-        # Polyline entities in ezdxf have a different way to access points depending on type
-        # For simplicity in this legacy-port, we cast to any or use the known method
-        layer = entity.dxf.layer
-        if filter_layers and layer not in filter_layers:
-            continue
-        pts = [(pt[0], pt[1]) for pt in entity.points()]  # type: ignore
-        result.append(
-            {
-                "points": pts,
-                "color": entity.dxf.color,
-                "linetype": entity.dxf.linetype,
-                "lineweight": entity.dxf.lineweight,
-                "layer": layer,
-            }
-        )
-    return result
+def _cell_key(point: Tuple[float, float], tolerance: float) -> Tuple[Any, Any]:
+    """Hash key of a point: the exact coordinates, or its grid cell when tolerance > 0."""
+    if tolerance <= 0:
+        return point
+    return (math.floor(point[0] / tolerance), math.floor(point[1] / tolerance))
+
+
+def _build_station_index(
+    stations: Dict[str, Dict], tolerance: float = 0.0
+) -> Dict[Tuple[Any, Any], List[str]]:
+    """
+    Index station IDs by coordinate so each leg end is resolved with a hash lookup.
+
+    With ``tolerance == 0`` stations are keyed on their exact coordinates, otherwise
+    they are bucketed into a uniform grid of ``tolerance``-sized cells.
+    """
+    index: Dict[Tuple[Any, Any], List[str]] = {}
+    for station, item in stations.items():
+        index.setdefault(_cell_key(item["point"], tolerance), []).append(station)
+    return index
+
+
+def _match_station(
+    point: Tuple[float, float],
+    stations: Dict[str, Dict],
+    index: Dict[Tuple[Any, Any], List[str]],
+    tolerance: float = 0.0,
+) -> Optional[str]:
+    """
+    Return the station located at a leg end, or None.
+
+    Exact matching keeps the "last station wins" behaviour for duplicated coordinates.
+    With a tolerance, the nearest station within ``tolerance`` is returned, searching
+    the point's grid cell and its eight neighbours.
+    """
+    if tolerance <= 0:
+        candidates = index.get(point)
+        return candidates[-1] if candidates else None
+
+    cx, cy = _cell_key(point, tolerance)
+    best, best_dist = None, tolerance
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            for station in index.get((cx + dx, cy + dy), []):
+                sx, sy = stations[station]["point"]
+                dist = math.hypot(sx - point[0], sy - point[1])
+                if dist <= best_dist:
+                    best, best_dist = station, dist
+    return best
+
+
+def _parse_polylines(
+    scan: _ModelspaceScan, filter_layers: Optional[List[str]] = None
+) -> List[Dict]:
+    return [
+        polyline
+        for polyline in scan.polylines
+        if not filter_layers or polyline["layer"] in filter_layers
+    ]
 
 
-def _get_offset(msp: Any, offset_idx: int) -> Tuple[float, float]:
+def _get_offset(scan: _ModelspaceScan, offset_idx: int) -> Tuple[float, float]:
     offset_flag = False
-    for entity in msp:
-        if entity.dxf.layer == "STATION":
-            if entity.dxftype() == "TEXT" and entity.dxf.text == str(offset_idx):
-                offset_flag = True
-            elif entity.dxftype() == "LINE" and offset_flag:
-                return entity.dxf.start.x, entity.dxf.start.y
+    for kind, value in scan.station:
+        if kind == "TEXT" and value == str(offset_idx):
+            offset_flag = True
+        elif kind == "LINE" and offset_flag:
+            return value
     return 0.0, 0.0
 
 
-def _get_features(msp: Any) -> List[Dict]:
+def _get_features(scan: _ModelspaceScan) -> List[Dict]:
     valid_block_names = {"B_ice", "BLOCK", "B_snow"}
     blocks: List[Dict] = []
-    for entity in msp.query("INSERT"):
-        if entity.dxf.name in valid_block_names:
+    for name, x, y in scan.inserts:
+        if name in valid_block_names:
             blocks.append(
                 {
-                    "Node_Id": f"{entity.dxf.name}_{len(blocks)}",
+                    "Node_Id": f"{name}_{len(blocks)}",
                     "Links": "-",
-                    "X": entity.dxf.insert.x,
-                    "Y": entity.dxf.insert.y,
-                    "Type": entity.dxf.name,
+                    "X": x,
+                    "Y": y,
+                    "Type": name,
                 }
             )
     return blocks
@@ -1,6 +1,11 @@
 # ruff: noqa: E501
 from typing import Any, Dict, FrozenSet, List, Set
 
+import numpy as np
+import pandas as pd
+
+from cave_sketch.features.feature_set import FeatureSet
+
 
 def chain_segments_by_type(lines: List[Dict[str, Any]]) -> Dict[str, List[List[List[float]]]]:
     # Group by type
@@ -106,3 +111,80 @@ def chain_segments_by_type(lines: List[Dict[str, Any]]) -> Dict[str, List[List[L
         result[t] = polylines
         
     return result
+
+
+def _chain_legs(ends: np.ndarray, points: np.ndarray) -> List[List[List[float]]]:
+    """
+    Walk the maximal chains of one style's segments, as chain_segments_by_type does.
+
+    ``ends`` holds the (from, to) node codes of every segment, numbered in order of
+    first appearance, and ``points`` the (x, y) of every segment end in the same order.
+    """
+    n_nodes = int(ends.max()) + 1
+    # Coordinates of each node from its last occurrence, as [lat, lon]
+    nodes, last = np.unique(ends.ravel()[::-1], return_index=True)
+    latlon = np.empty((n_nodes, 2))
+    latlon[nodes] = points[::-1][last][:, ::-1]
+    coords = latlon.tolist()
+
+    # Undirected legs without duplicates or self-loops
+    low, high = ends.min(axis=1), ends.max(axis=1)
+    keep = low != high
+    legs = np.unique(np.column_stack([low[keep], high[keep]]), axis=0)
+
+    # Adjacency as slots: the neighbours of node i are neighbor[start[i]:start[i + 1]]
+    src = np.concatenate([legs[:, 0], legs[:, 1]])
+    order = np.argsort(src, kind="stable")
+    bounds = np.searchsorted(src[order], np.arange(n_nodes + 1))
+    start = bounds.tolist()
+    degree = np.diff(bounds).tolist()
+    neighbor = np.concatenate([legs[:, 1], legs[:, 0]])[order].tolist()
+    leg = np.tile(np.arange(len(legs)), 2)[order].tolist()
+    used = [False] * len(legs)
+
+    def walk(first: int, slot: int) -> List[List[float]]:
+        chain = [first]
+        while True:
+            used[leg[slot]] = True
+            curr = neighbor[slot]
+            chain.append(curr)
+            if degree[curr] != 2 or curr == first:
+                return [coords[node] for node in chain]
+            # Leave a degree-2 node by its other leg
+            slot = start[curr] if not used[leg[start[curr]]] else start[curr] + 1
+
+    polylines = []
+    # Maximal chains starting at endpoints/junctions (degree != 2)
+    for node in range(n_nodes):
+        if degree[node] != 2:
+            for slot in range(start[node], start[node + 1]):
+                if not used[leg[slot]]:
+                    polylines.append(walk(node, slot))
+    # Leftover all-degree-2 components as closed polylines
+    for node in range(n_nodes):
+        if degree[node] == 2 and not used[leg[start[node]]]:
+            polylines.append(walk(node, start[node]))
+    return polylines
+
+
+def chain_feature_segments(features: FeatureSet) -> Dict[str, List[List[List[float]]]]:
+    """
+    Chain the segments of a FeatureSet into polylines per style name, as
+    chain_segments_by_type does for JSON lines. Needs ``segment_ends``.
+
+    Works on the segment arrays: node IDs are factorized to integer codes per style
+    and the chains are walked over an integer adjacency.
+    """
+    if features.segment_ends is None:
+        raise ValueError("FeatureSet has no segment_ends to chain")
+    names = features.style_values("name")[features.segment_styles]
+    name_codes, unique_names = pd.factorize(names)
+
+    result: Dict[str, List[List[List[float]]]] = {}
+    for code, name in enumerate(unique_names):
+        selected = name_codes == code
+        node_codes, _ = pd.factorize(features.segment_ends[selected].ravel(), use_na_sentinel=False)
+        result[str(name)] = _chain_legs(
+            node_codes.reshape(-1, 2), features.segments[selected].reshape(-1, 2)
+        )
+    return result
@@ -0,0 +1,195 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class FeatureStyle:
+    """Drawing style shared by all the features of one kind (a survey Type)."""
+
+    name: str
+    color: str = "black"
+    weight: float = 1
+    dash: Optional[Tuple[float, ...]] = None
+    fill_opacity: float = 0.3
+    marker: str = "o"
+    size: float = 6
+
+
+def _empty_xy() -> np.ndarray:
+    return np.empty((0, 2), dtype=np.float64)
+
+
+def _empty_codes() -> np.ndarray:
+    return np.empty(0, dtype=np.int32)
+
+
+@dataclass(eq=False)
+class FeatureSet:
+    """
+    Backend-agnostic drawable features backed by NumPy arrays.
+
+    Coordinates are (x, y) pairs, i.e. (lon, lat) for geographic data:
+
+    - lines: ``segments`` (N, 2, 2) with ``segment_styles`` indexing ``styles``;
+    - polygons: the vertices of ring ``i`` are
+      ``polygon_xy[polygon_offsets[i]:polygon_offsets[i + 1]]``;
+    - points: ``point_xy`` (K, 2) with ``point_styles``.
+
+    Labels (popups) are optional since only interactive backends use them, and
+    ``segment_ends`` holds the (from, to) node IDs of each segment when known, for
+    backends that rebuild polylines. to_features/from_features convert from and to
+    the former list-of-dicts layout.
+    """
+
+    styles: List[FeatureStyle] = field(default_factory=list)
+    segments: np.ndarray = field(default_factory=lambda: np.empty((0, 2, 2)))
+    segment_styles: np.ndarray = field(default_factory=_empty_codes)
+    segment_labels: Optional[List[str]] = None
+    segment_ends: Optional[np.ndarray] = None
+    polygon_xy: np.ndarray = field(default_factory=_empty_xy)
+    polygon_offsets: np.ndarray = field(default_factory=lambda: np.zeros(1, dtype=np.int64))
+    polygon_styles: np.ndarray = field(default_factory=_empty_codes)
+    polygon_labels: Optional[List[str]] = None
+    point_xy: np.ndarray = field(default_factory=_empty_xy)
+    point_styles: np.ndarray = field(default_factory=_empty_codes)
+    point_labels: Optional[List[str]] = None
+
+    @property
+    def n_polygons(self) -> int:
+        return len(self.polygon_offsets) - 1
+
+    def polygon_rings(self) -> List[np.ndarray]:
+        """Vertices of every polygon, as (M, 2) views into ``polygon_xy``."""
+        return np.split(self.polygon_xy, self.polygon_offsets[1:-1])
+
+    def style_values(self, attribute: str) -> np.ndarray:
+        """Array of one FeatureStyle attribute per style, to index with style codes."""
+        values = np.empty(len(self.styles), dtype=object)
+        values[:] = [getattr(style, attribute) for style in self.styles]
+        return values
+
+    def to_features(self) -> Dict[str, list]:
+        """Convert to the list-of-dicts layout (coords as [y, x] / [lat, lon])."""
+        styles = self.styles
+        features: Dict[str, list] = {"lines": [], "polygons": [], "points": []}
+
+        polygon_labels: List[Optional[str]] = [None] * self.n_polygons
+        for ring, code, label in zip(
+            self.polygon_rings(),
+            self.polygon_styles.tolist(),
+            self.polygon_labels or polygon_labels,
+        ):
+            style = styles[code]
+            features["polygons"].append(
+                {
+                    "coords": ring[:, ::-1].tolist(),
+                    "fill_color": style.color,
+                    "fill_opacity": style.fill_opacity,
+                    "edge_color": style.color,
+                    "popup": label,
+                }
+            )
+
+        for (p1, p2), code, label in zip(
+            self.segments[:, :, ::-1].tolist(),
+            self.segment_styles.tolist(),
+            self.segment_labels or [""] * len(self.segments),
+        ):
+            style = styles[code]
+            features["lines"].append(
+                {
+                    "coords": [p1, p2],
+                    "color": style.color,
+                    "weight": style.weight,
+                    "dash": list(style.dash) if style.dash else None,
+                    "popup": label,
+                }
+            )
+
+        for (x, y), code, label in zip(
+            self.point_xy.tolist(),
+            self.point_styles.tolist(),
+            self.point_labels or [""] * len(self.point_xy),
+        ):
+            style = styles[code]
+            features["points"].append(
+                {
+                    "coords": [y, x],
+                    "color": style.color,
+                    "marker": style.marker,
+                    "size": style.size,
+                    "popup": label,
+                }
+            )
+        return features
+
+    @classmethod
+    def from_features(cls, features: Dict[str, list]) -> "FeatureSet":
+        """Build a FeatureSet from the list-of-dicts layout."""
+        styles: List[FeatureStyle] = []
+        style_index: Dict[FeatureStyle, int] = {}
+
+        def intern(style: FeatureStyle) -> int:
+            code = style_index.get(style)
+            if code is None:
+                code = style_index[style] = len(styles)
+                styles.append(style)
+            return code
+
+        def codes(items: List[Dict[str, Any]], make_style) -> np.ndarray:
+            return np.fromiter(
+                (intern(make_style(item)) for item in items), dtype=np.int32, count=len(items)
+            )
+
+        lines = features.get("lines", [])
+        polygons = features.get("polygons", [])
+        points = features.get("points", [])
+
+        rings = [
+            np.asarray(p["coords"], dtype=np.float64).reshape(-1, 2)[:, ::-1] for p in polygons
+        ]
+        offsets = np.zeros(len(rings) + 1, dtype=np.int64)
+        np.cumsum([len(ring) for ring in rings], out=offsets[1:])
+
+        return cls(
+            styles=styles,
+            segments=np.asarray([line["coords"] for line in lines], dtype=np.float64).reshape(
+                -1, 2, 2
+            )[:, :, ::-1],
+            segment_styles=codes(
+                lines,
+                lambda line: FeatureStyle(
+                    name="line",
+                    color=line.get("color", "black"),
+                    weight=line.get("weight", 1),
+                    dash=tuple(line["dash"]) if line.get("dash") else None,
+                ),
+            ),
+            segment_labels=[line.get("popup", "") for line in lines],
+            polygon_xy=np.concatenate(rings) if rings else _empty_xy(),
+            polygon_offsets=offsets,
+            polygon_styles=codes(
+                polygons,
+                lambda p: FeatureStyle(
+                    name="area",
+                    color=p.get("fill_color", "blue"),
+                    fill_opacity=p.get("fill_opacity", 0.3),
+                ),
+            ),
+            polygon_labels=[p.get("popup") for p in polygons],
+            point_xy=np.asarray([p["coords"] for p in points], dtype=np.float64).reshape(-1, 2)[
+                :, ::-1
+            ],
+            point_styles=codes(
+                points,
+                lambda p: FeatureStyle(
+                    name="point",
+                    color=p.get("color", "black"),
+                    marker=p.get("marker", "o"),
+                    size=p.get("size", 6),
+                ),
+            ),
+            point_labels=[p.get("popup", "") for p in points],
+        )
@@ -1,58 +1,374 @@
-import re
-from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from itertools import repeat
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
+import numpy as np
 import pandas as pd
 
+from cave_sketch.features.feature_set import FeatureSet, FeatureStyle
 from cave_sketch.style import STYLE_MAP
 
 
-def extract_features_from_json(map_data: Dict[str, Any]) -> Dict[str, list]:
+def _json_line_style(line_type: str) -> FeatureStyle:
+    style = STYLE_MAP.get(line_type, {"color": "black", "type": "line"})
+    linestyle = style.get("linestyle", "solid")
+    dash = None
+    if linestyle == (0, (1, 1)):
+        dash = (5, 5)
+    elif linestyle == (0, (1, 2)):
+        dash = (3, 7)
+    return FeatureStyle(
+        name=line_type,
+        color=str(style.get("color", "black")),
+        weight=float(str(style.get("weight", 1))),
+        dash=dash,
+    )
+
+
+def _point_style(typ: str) -> FeatureStyle:
+    style = STYLE_MAP.get(typ, {"color": "black", "marker": "o", "markersize": 6})
+    return FeatureStyle(
+        name=typ,
+        color=str(style.get("color", "black")),
+        marker=str(style.get("marker", "o")),
+        size=float(str(style.get("markersize", 6))),
+    )
+
+
+def extract_feature_set_from_json(
+    map_data: Dict[str, Any], include_points: bool = False
+) -> FeatureSet:
     """
-    Extract abstract features (lines, polygons) with styles,
-    independent of rendering backend.
+    Extract the drawable features (water polygons, lines and, on request, the point
+    nodes such as blocks) of a georeferenced map JSON as a FeatureSet.
+
+    Coordinates are (lon, lat); styles are interned per line / node type.
     """
-    features: Dict[str, List[Dict[str, Any]]] = {"lines": [], "polygons": []}
+    name = map_data.get("name", "")
+    styles: List[FeatureStyle] = []
+    style_index: Dict[Tuple[str, str], int] = {}
+
+    def intern(role: str, typ: str, make_style) -> int:
+        code = style_index.get((role, typ))
+        if code is None:
+            code = style_index[(role, typ)] = len(styles)
+            styles.append(make_style(typ))
+        return code
 
     # Polygons
+    rings, polygon_labels = [], []
     for water_polygon in map_data.get("water_polygons", []):
-        coords = water_polygon["coordinates"]
-        features["polygons"].append(
-            {
-                "coords": coords,
-                "fill_color": "blue",
-                "fill_opacity": 0.3,
-                "edge_color": "blue",
-                "popup": f"{map_data['name']}: Water Area {water_polygon.get('polygon_id', '')}",
-            }
-        )
+        ring = np.asarray(water_polygon["coordinates"], dtype=np.float64).reshape(-1, 2)
+        rings.append(ring[:, ::-1])
+        polygon_labels.append(f"{name}: Water Area {water_polygon.get('polygon_id', '')}")
+    offsets = np.zeros(len(rings) + 1, dtype=np.int64)
+    np.cumsum([len(ring) for ring in rings], out=offsets[1:])
+    water = (
+        intern("area", "A_water", lambda typ: FeatureStyle(name=typ, color="blue")) if rings else 0
+    )
 
     # Lines
-    for line in map_data.get("lines", []):
-        line_type = line["type"]
-        style = STYLE_MAP.get(line_type, {"color": "black", "type": "line"})
-        color = style.get("color", "black")
-        weight = style.get("weight", 1)
-        linestyle = style.get("linestyle", "solid")
-
-        dash = None
-        if linestyle == (0, (1, 1)):
-            dash = [5, 5]
-        elif linestyle == (0, (1, 2)):
-            dash = [3, 7]
-
-        pt_from = [line["from"]["lat"], line["from"]["lon"]]
-        pt_to = [line["to"]["lat"], line["to"]["lon"]]
-
-        features["lines"].append(
-            {
-                "coords": [pt_from, pt_to],
-                "color": color,
-                "weight": weight,
-                "dash": dash,
-                "popup": f"{map_data['name']}: {line_type}",
-            }
+    lines = map_data.get("lines", [])
+    segments = np.array(
+        [
+            [[line["from"]["lon"], line["from"]["lat"]], [line["to"]["lon"], line["to"]["lat"]]]
+            for line in lines
+        ],
+        dtype=np.float64,
+    ).reshape(-1, 2, 2)
+    segment_styles = np.fromiter(
+        (intern("line", line["type"], _json_line_style) for line in lines),
+        dtype=np.int32,
+        count=len(lines),
+    )
+    segment_ends = np.empty((len(lines), 2), dtype=object)
+    segment_ends[:] = [(line["from"]["id"], line["to"]["id"]) for line in lines]
+
+    # Point nodes (blocks, ice, ...)
+    points = []
+    if include_points:
+        nodes = map_data.get("nodes", [])
+        if isinstance(nodes, dict):
+            nodes = [{"id": k, **v} for k, v in nodes.items()]
+        points = [
+            node for node in nodes if STYLE_MAP.get(node.get("type", ""), {}).get("type") == "point"
+        ]
+
+    return FeatureSet(
+        styles=styles,
+        segments=segments,
+        segment_styles=segment_styles,
+        segment_labels=[f"{name}: {line['type']}" for line in lines],
+        segment_ends=segment_ends,
+        polygon_xy=np.concatenate(rings) if rings else np.empty((0, 2)),
+        polygon_offsets=offsets,
+        polygon_styles=np.full(len(rings), water, dtype=np.int32),
+        polygon_labels=polygon_labels,
+        point_xy=np.array(
+            [[node["lon"], node["lat"]] for node in points], dtype=np.float64
+        ).reshape(-1, 2),
+        point_styles=np.fromiter(
+            (intern("point", node["type"], _point_style) for node in points),
+            dtype=np.int32,
+            count=len(points),
+        ),
+        point_labels=[str(node.get("id", "")) for node in points],
+    )
+
+
+def extract_features_from_json(map_data: Dict[str, Any]) -> Dict[str, list]:
+    """
+    Extract abstract features (lines, polygons) with styles,
+    independent of rendering backend.
+    """
+    features = extract_feature_set_from_json(map_data).to_features()
+    del features["points"]
+    return features
+
+
+@dataclass
+class LineSegments:
+    """
+    Line features of a survey as arrays, one entry per drawn segment.
+
+    ``segments[i]`` is ``[[x1, y1], [x2, y2]]`` (plot order, not lat/lon) and
+    ``style_ids[i]`` indexes ``styles``, the survey Type names, so all the segments of
+    one type can be styled (and drawn) together. ``source_rows`` and ``targets`` give
+    the DataFrame row and the linked Node_Id each segment was built from.
+    """
+
+    segments: np.ndarray
+    style_ids: np.ndarray
+    styles: List[str]
+    source_rows: np.ndarray
+    targets: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.segments)
+
+    def by_style(self) -> Dict[str, np.ndarray]:
+        """Segments of each style present, as (N, 2, 2) arrays keyed by Type name."""
+        return {
+            self.styles[code]: self.segments[self.style_ids == code]
+            for code in np.unique(self.style_ids).tolist()
+        }
+
+
+def _style_types(types: List[str]) -> np.ndarray:
+    """STYLE_MAP drawing type ("line", "point", "area") of each Type name."""
+    return np.array([STYLE_MAP.get(typ, {}).get("type", "line") for typ in types], dtype=object)
+
+
+def _drawn_rows(
+    df: pd.DataFrame, excluded: Set[Any], show_centerline: bool
+) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+    """
+    Type codes of the rows and a mask of the rows drawn as lines or points.
+
+    Excluded nodes and areas (``A_`` types) are dropped, and so are stations when the
+    centerline is hidden. Type-level tests run once per distinct Type.
+    """
+    type_codes, types = pd.factorize(df["Type"])
+    types = [str(typ) for typ in types]
+    drawn_type = np.array(
+        [not typ.startswith("A_") and (show_centerline or typ != "station") for typ in types],
+        dtype=bool,
+    )
+    drawn = np.append(drawn_type, False)[type_codes]
+    if excluded:
+        drawn &= ~df["Node_Id"].isin(excluded).to_numpy(dtype=bool)
+    return type_codes, drawn, types
+
+
+def extract_segments_from_df(
+    df: pd.DataFrame,
+    excluded_nodes: Optional[Iterable[Any]] = None,
+    show_centerline: bool = True,
+) -> LineSegments:
+    """
+    Build the line segments of a survey DataFrame without per-row Python objects.
+
+    Same selection as extract_features_from_df: every link of a drawn line-type row
+    to an existing, non-excluded node gives one segment, in row and link order.
+    Excluded nodes are matched through a hashed set, link targets are resolved with
+    a first-occurrence index of Node_Id and all segments are gathered in one pass.
+
+    Args:
+        df: Survey DataFrame (Node_Id, Links, X, Y, Type).
+        excluded_nodes: Node IDs to leave out, with their links.
+        show_centerline: Whether station legs are drawn.
+
+    Returns:
+        LineSegments with the segments in the order extract_features_from_df emits them.
+    """
+    excluded = set(excluded_nodes or ())
+    return _line_segments(df, excluded, *_drawn_rows(df, excluded, show_centerline))
+
+
+def _line_segments(
+    df: pd.DataFrame,
+    excluded: Set[Any],
+    type_codes: np.ndarray,
+    drawn: np.ndarray,
+    types: List[str],
+) -> LineSegments:
+    """Line segments of the drawn rows (see _drawn_rows) whose Type draws as a line."""
+    drawn = drawn & np.append(_style_types(types) == "line", False)[type_codes]
+
+    links = df["Links"]
+    drawn &= (links.notna() & links.ne("-")).to_numpy(dtype=bool)
+    rows = np.flatnonzero(drawn)
+
+    # Split all links in one go: the "-"-joined rows give exactly their tokens, in order
+    text = [str(value) for value in links.to_numpy(dtype=object)[rows]]
+    raw = np.array("-".join(text).split("-") if text else [], dtype=object)
+    counts = np.fromiter(map(str.count, text, repeat("-")), dtype=np.int64, count=len(text)) + 1
+    token_rows = np.repeat(rows, counts)
+    tokens = np.array([token.strip() for token in raw], dtype=object)
+
+    # First occurrence of each Node_Id wins
+    node_ids = df["Node_Id"]
+    first = ~node_ids.duplicated().to_numpy(dtype=bool)
+    first_rows = np.flatnonzero(first)
+    target_rows = pd.Index(node_ids.to_numpy(dtype=object)[first]).get_indexer(tokens)
+
+    keep = (tokens != "") & (target_rows >= 0)
+    if excluded:
+        keep &= ~pd.Series(raw, dtype=object).isin(excluded).to_numpy(dtype=bool)
+    source_rows = token_rows[keep]
+    target_rows = first_rows[target_rows[keep]]
+
+    xy = df[["X", "Y"]].to_numpy(dtype=np.float64)
+    segments = np.empty((len(source_rows), 2, 2))
+    segments[:, 0] = xy[source_rows]
+    segments[:, 1] = xy[target_rows]
+    return LineSegments(
+        segments=segments,
+        style_ids=type_codes[source_rows].astype(np.int32),
+        styles=types,
+        source_rows=source_rows,
+        targets=tokens[keep],
+    )
+
+
+def _df_style(typ: str, role: str) -> FeatureStyle:
+    """Style of a survey Type drawn as a line, a point or an area."""
+    if role == "point":
+        return _point_style(typ)
+    if role == "area":
+        style = STYLE_MAP.get(typ, {"color": "blue", "alpha": 0.3})
+        return FeatureStyle(
+            name=typ,
+            color=str(style.get("color", "blue")),
+            fill_opacity=float(str(style.get("alpha", 0.3))),
         )
+    style = STYLE_MAP.get(typ, STYLE_MAP["L_wall"])
+    return FeatureStyle(
+        name=typ,
+        color=str(style.get("color", "black")),
+        weight=float(str(style.get("weight", 1))),
+        dash=None if style.get("linestyle", "solid") == "solid" else (3, 7),
+    )
+
 
+def _area_polygons(
+    df: pd.DataFrame, is_area: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
+    """
+    Rings of the area features: the xxPyy vertices of each area xx, ordered by yy.
+
+    Returns:
+        Tuple of (xy, offsets, first_rows, area_ids): ring vertices, ring offsets, the
+        row of the first vertex of each ring (which gives its Type) and the area IDs.
+        Areas are ordered by ID (as strings) and those with fewer than 3 vertices are
+        dropped.
+    """
+    rows = np.flatnonzero(is_area)
+    parts = df["Node_Id"].iloc[rows].astype(str).str.extract(r"^(\d+)P(\d+)")
+    valid = parts[0].notna().to_numpy()
+    vertices = pd.DataFrame(
+        {
+            "area": parts[0][valid].to_numpy(dtype=object),
+            "order": parts[1][valid].astype(float).to_numpy(),
+            "row": rows[valid],
+        }
+    ).sort_values(["area", "order"], kind="mergesort")
+
+    area = vertices["area"].to_numpy(dtype=object)
+    starts = np.flatnonzero(np.r_[True, area[1:] != area[:-1]])[: len(area)]
+    sizes = np.diff(np.append(starts, len(area)))
+    keep = sizes >= 3
+    in_ring = np.repeat(keep, sizes)
+
+    ring_rows = vertices["row"].to_numpy()[in_ring]
+    offsets = np.zeros(int(keep.sum()) + 1, dtype=np.int64)
+    np.cumsum(sizes[keep], out=offsets[1:])
+    xy = df[["X", "Y"]].to_numpy(dtype=np.float64)[ring_rows]
+    first_rows = vertices["row"].to_numpy()[starts[keep]]
+    return xy, offsets, first_rows, area[starts[keep]].tolist()
+
+
+def extract_feature_set_from_df(
+    df: pd.DataFrame,
+    excluded_nodes: Optional[Iterable[Any]] = None,
+    show_centerline: bool = True,
+    labels: bool = False,
+) -> FeatureSet:
+    """
+    Convert a survey DataFrame into an array-backed FeatureSet.
+
+    Same features as extract_features_from_df: point types (blocks, ice, ...) as
+    points, links of the other drawn rows as line segments and ``A_`` areas as
+    polygons, with one style per survey Type. Coordinates are (X, Y).
+
+    Args:
+        df: Survey DataFrame (Node_Id, Links, X, Y, Type).
+        excluded_nodes: Node IDs to leave out, with their links.
+        show_centerline: Whether station legs are drawn.
+        labels: Whether to build the popup label of every feature.
+
+    Returns:
+        FeatureSet of the survey.
+    """
+    excluded = set(excluded_nodes or ())
+    type_codes, drawn, types = _drawn_rows(df, excluded, show_centerline)
+    style_types = _style_types(types)
+    is_area_type = np.array([typ.startswith("A_") for typ in types], dtype=bool)
+    roles = np.where(is_area_type, "area", np.where(style_types == "point", "point", "line"))
+    styles = [_df_style(typ, role) for typ, role in zip(types, roles.tolist())]
+
+    lines = _line_segments(df, excluded, type_codes, drawn, types)
+    point_rows = np.flatnonzero(drawn & np.append(style_types == "point", False)[type_codes])
+    ring_xy, offsets, ring_rows, area_ids = _area_polygons(
+        df, np.append(is_area_type, False)[type_codes]
+    )
+
+    node_ids = df["Node_Id"].to_numpy(dtype=object)
+    segment_ends = np.column_stack([node_ids[lines.source_rows], lines.targets])
+    features = FeatureSet(
+        styles=styles,
+        segments=lines.segments,
+        segment_styles=lines.style_ids,
+        segment_ends=segment_ends.reshape(-1, 2),
+        polygon_xy=ring_xy,
+        polygon_offsets=offsets,
+        polygon_styles=type_codes[ring_rows].astype(np.int32),
+        point_xy=df[["X", "Y"]].to_numpy(dtype=np.float64)[point_rows],
+        point_styles=type_codes[point_rows].astype(np.int32),
+    )
+    if labels:
+        features.segment_labels = [
+            f"{types[code]} ({source}-{target})"
+            for code, (source, target) in zip(lines.style_ids.tolist(), segment_ends.tolist())
+        ]
+        features.point_labels = [
+            f"{types[code]} ({node_id})"
+            for code, node_id in zip(type_codes[point_rows].tolist(), node_ids[point_rows])
+        ]
+        features.polygon_labels = [
+            f"{types[code]} (Area {area_id})"
+            for code, area_id in zip(type_codes[ring_rows].tolist(), area_ids)
+        ]
     return features
 
 
@@ -62,97 +378,6 @@ def extract_features_from_df(
     show_centerline: bool = True,
 ) -> Dict[str, list]:
     """Convert survey DataFrame into backend-agnostic drawable features."""
-    if excluded_nodes is None:
-        excluded_nodes = []
-
-    features: Dict[str, list] = {"lines": [], "polygons": [], "points": []}  # <-- added points
-
-    # Build coordinate index with first-occurrence-wins semantics
-    coord_index: Dict[Any, Tuple[float, float]] = {}
-    for row in df.itertuples(index=False):
-        if row.Node_Id not in coord_index:
-            coord_index[row.Node_Id] = (row.X, row.Y)
-
-    # --- 1️⃣ Handle standard line features (walls, shots, etc.) ---
-    for row in df.itertuples(index=False):
-        nid, x, y, links, typ = row.Node_Id, row.X, row.Y, row.Links, row.Type
-
-        if nid in excluded_nodes or typ.startswith("A_"):
-            continue
-
-        if not show_centerline and typ == "station":
-            continue
-
-        # --- New block: handle standalone point features ---
-        style_type = STYLE_MAP.get(typ, {}).get("type", "line")
-        if style_type == "point":
-            style = STYLE_MAP.get(typ, {"color": "black", "marker": "o", "markersize": 6})
-            features["points"].append(
-                {
-                    "coords": [y, x],  # lat/lon-like
-                    "color": style.get("color", "black"),
-                    "marker": style.get("marker", "o"),
-                    "size": style.get("markersize", 6),
-                    "popup": f"{typ} ({nid})",
-                }
-            )
-            continue  # skip to next row
-
-        # --- Existing line logic ---
-        if pd.notna(links) and links != "-":
-            neighbors = [
-                nbr.strip() for nbr in links.split("-") if nbr.strip() and nbr not in excluded_nodes
-            ]
-            for nbr in neighbors:
-                if nbr not in coord_index:
-                    continue
-                x2, y2 = coord_index[nbr]
-
-                if style_type == "line":
-                    style = STYLE_MAP.get(typ, STYLE_MAP["L_wall"])
-                    features["lines"].append(
-                        {
-                            "coords": [[y, x], [y2, x2]],
-                            "color": style.get("color", "black"),
-                            "weight": style.get("weight", 1),
-                            "dash": None if style.get("linestyle", "solid") == "solid" else [3, 7],
-                            "popup": f"{typ} ({nid}-{nbr})",
-                        }
-                    )
-
-    # --- 2️⃣ Handle area features (A_water, A_sediment, etc.) ---
-    area_rows = df[df["Type"].str.startswith("A_")].copy()
-    if not area_rows.empty:
-
-        def get_area_id(node_id: str) -> Optional[str]:
-            m = re.match(r"(\d+)P\d+", node_id)
-            return m.group(1) if m else None
-
-        area_rows["Area_ID"] = area_rows["Node_Id"].apply(get_area_id)
-
-        for area_id, group in area_rows.groupby("Area_ID"):
-            if len(group) < 3:
-                continue
-
-            group = group.sort_values(
-                by="Node_Id", key=lambda s: s.str.extract(r"P(\d+)", expand=False).astype(float)
-            )
-
-            xs = group["X"].to_numpy()
-            ys = group["Y"].to_numpy()
-            typ = group.iloc[0]["Type"]
-
-            style = STYLE_MAP.get(typ, {"color": "blue", "alpha": 0.3})
-            coords = [[yy, xx] for xx, yy in zip(xs, ys)]
-
-            features["polygons"].append(
-                {
-                    "coords": coords,
-                    "fill_color": style.get("color", "blue"),
-                    "fill_opacity": style.get("alpha", 0.3),
-                    "edge_color": style.get("color", "blue"),
-                    "popup": f"{typ} (Area {area_id})",
-                }
-            )
-
-    return features
+    return extract_feature_set_from_df(
+        df, excluded_nodes, show_centerline, labels=True
+    ).to_features()
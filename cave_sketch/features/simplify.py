@@ -0,0 +1,233 @@
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+
+from cave_sketch.features.feature_set import FeatureSet
+
+# Print resolution the simplification tolerance is derived from
+LOD_DPI = 300
+# Largest allowed deviation, in printed pixels at LOD_DPI. Kept well below one pixel so
+# that anti-aliasing and the overlap of line caps at dropped joints stay invisible.
+LOD_PIXELS = 0.125
+
+
+def lod_tolerance(ax, ref_scale: float, dpi: float = LOD_DPI, pixels: float = LOD_PIXELS):
+    """
+    Data-space simplification tolerance for features drawn on ``ax``.
+
+    The survey extent ``ref_scale`` is fitted into the axes, so one printed pixel is
+    at least ``ref_scale / (largest axes side in inches * dpi)`` data units.
+
+    Args:
+        ax: Matplotlib Axes the features are drawn on.
+        ref_scale: Largest side of the survey bounding box, in data units.
+        dpi: Print resolution.
+        pixels: Allowed deviation, in pixels at ``dpi``.
+
+    Returns:
+        Tolerance in data units (0 when the axes has no size).
+    """
+    fig_w, fig_h = ax.figure.get_size_inches()
+    bbox = ax.get_position()
+    axes_inches = max(bbox.width * fig_w, bbox.height * fig_h)
+    if axes_inches <= 0 or ref_scale <= 0:
+        return 0.0
+    return pixels * ref_scale / (axes_inches * dpi)
+
+
+def douglas_peucker(xy: np.ndarray, offsets: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Douglas-Peucker simplification of many polylines at once.
+
+    Polyline ``i`` is ``xy[offsets[i]:offsets[i + 1]]``. Every pass handles the open
+    intervals of all the polylines together: the vertex farthest from its interval's
+    chord is kept, and the interval split there, while that distance exceeds the
+    tolerance.
+
+    Args:
+        xy: (N, 2) vertices of all the polylines.
+        offsets: (K + 1,) polyline offsets into ``xy``.
+        tolerance: Largest allowed distance of a dropped vertex from the result.
+
+    Returns:
+        (N,) boolean mask of the vertices to keep; polyline ends are always kept.
+    """
+    keep = np.zeros(len(xy), dtype=bool)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    non_empty = offsets[1:] > offsets[:-1]
+    keep[offsets[:-1][non_empty]] = True
+    keep[offsets[1:][non_empty] - 1] = True
+
+    lo = offsets[:-1][non_empty]
+    hi = offsets[1:][non_empty] - 1
+    tol2 = tolerance * tolerance
+    while True:
+        open_ = hi - lo > 1
+        lo, hi = lo[open_], hi[open_]
+        if not len(lo):
+            return keep
+        counts = hi - lo - 1
+        interval = np.repeat(np.arange(len(lo)), counts)
+        starts = np.cumsum(counts) - counts
+        vertex = np.arange(counts.sum()) - np.repeat(starts - lo - 1, counts)
+
+        a = xy[lo][interval]
+        chord = xy[hi][interval] - a
+        rel = xy[vertex] - a
+        length2 = np.einsum("ij,ij->i", chord, chord)
+        t = np.divide(
+            np.einsum("ij,ij->i", rel, chord),
+            length2,
+            out=np.zeros_like(length2),
+            where=length2 > 0,
+        )
+        dist = rel - np.clip(t, 0.0, 1.0)[:, None] * chord
+        dist2 = np.einsum("ij,ij->i", dist, dist)
+
+        worst = np.maximum.reduceat(dist2, starts)
+        at_worst = np.flatnonzero(dist2 == worst[interval])
+        _, first = np.unique(interval[at_worst], return_index=True)
+        mid = vertex[at_worst[first]]
+
+        split = worst > tol2
+        keep[mid[split]] = True
+        lo, hi, mid = lo[split], hi[split], mid[split]
+        lo, hi = np.concatenate([lo, mid]), np.concatenate([mid, hi])
+
+
+def _segment_runs(features: FeatureSet):
+    """
+    Cut the segments into runs that can be simplified as polylines.
+
+    Segments are deduplicated as undirected edges per style (survey links are listed
+    from both ends); ``multiplicity`` tells whether the reverse copy existed. A run
+    is a maximal sequence of consecutive edges, each starting where the previous
+    ends, with the same solid style and multiplicity, through vertices of degree 2.
+    Dashed segments are runs of their own: the dash pattern restarts on every drawn
+    segment, so merging them would shift the dashes.
+
+    Returns:
+        Tuple of (edges, run_starts, multiplicity, node_codes, nodes): the kept
+        segment indices, the start of each run in ``edges``, the multiplicity of
+        each kept edge, the (E, 2) node codes of the kept edges and the node IDs.
+    """
+    assert features.segment_ends is not None
+    node_codes, nodes = pd.factorize(features.segment_ends.ravel())
+    node_codes = node_codes.reshape(-1, 2).astype(np.int64)
+    n_nodes = max(len(nodes), 1)
+    low, high = node_codes.min(axis=1), node_codes.max(axis=1)
+    key = (features.segment_styles.astype(np.int64) * n_nodes + low) * n_nodes + high
+    _, first, inverse, counts = np.unique(
+        key, return_index=True, return_inverse=True, return_counts=True
+    )
+    edges = np.sort(first)
+    multiplicity = np.minimum(counts[inverse[edges]], 2)
+
+    ends = node_codes[edges]
+    degree = np.bincount(ends.ravel(), minlength=n_nodes)
+    styles = features.segment_styles[edges]
+    solid = np.array([style.dash is None for style in features.styles], dtype=bool)
+    src, dst = ends[:, 0], ends[:, 1]
+    continues = (
+        (src[1:] == dst[:-1])
+        & (styles[1:] == styles[:-1])
+        & solid[styles[1:]]
+        & (multiplicity[1:] == multiplicity[:-1])
+        & (degree[dst[:-1]] == 2)
+        & (src[:-1] != dst[:-1])
+    )
+    run_starts = np.flatnonzero(np.r_[True, ~continues])
+    return edges, run_starts, multiplicity, ends, nodes
+
+
+def _simplify_segments(features: FeatureSet, tolerance: float) -> dict:
+    edges, run_starts, multiplicity, ends, nodes = _segment_runs(features)
+    n_edges, n_runs = len(edges), len(run_starts)
+    run_lengths = np.diff(np.append(run_starts, n_edges))
+    run_of_edge = np.repeat(np.arange(n_runs), run_lengths)
+
+    # Run vertices: the start of every edge plus the end of the run's last edge
+    vertex_offsets = np.zeros(n_runs + 1, dtype=np.int64)
+    np.cumsum(run_lengths + 1, out=vertex_offsets[1:])
+    xy = np.empty((n_edges + n_runs, 2))
+    vertex_nodes = np.empty(n_edges + n_runs, dtype=np.int64)
+    edge_slots = np.arange(n_edges) + run_of_edge
+    last_edges = run_starts + run_lengths - 1
+    segments = features.segments[edges]
+    xy[edge_slots] = segments[:, 0]
+    xy[vertex_offsets[1:] - 1] = segments[last_edges, 1]
+    vertex_nodes[edge_slots] = ends[:, 0]
+    vertex_nodes[vertex_offsets[1:] - 1] = ends[last_edges, 1]
+
+    kept = np.flatnonzero(douglas_peucker(xy, vertex_offsets, tolerance))
+    run_of_vertex = np.repeat(np.arange(n_runs), run_lengths + 1)[kept]
+    pairs = np.flatnonzero(run_of_vertex[1:] == run_of_vertex[:-1])
+    start, end = kept[pairs], kept[pairs + 1]
+    runs = run_of_vertex[pairs]
+
+    # Emit the reverse copy of doubly listed segments right after the forward one
+    copies = multiplicity[run_starts][runs]
+    order = np.repeat(np.arange(len(pairs)), copies)
+    reverse = np.zeros(len(order), dtype=bool)
+    reverse[np.cumsum(copies)[copies == 2] - 1] = True
+    a = np.where(reverse, end[order], start[order])
+    b = np.where(reverse, start[order], end[order])
+
+    segment_ends = np.empty((len(order), 2), dtype=object)
+    segment_ends[:, 0] = np.asarray(nodes, dtype=object)[vertex_nodes[a]]
+    segment_ends[:, 1] = np.asarray(nodes, dtype=object)[vertex_nodes[b]]
+    return {
+        "segments": np.stack([xy[a], xy[b]], axis=1),
+        "segment_styles": features.segment_styles[edges][run_starts][runs][order],
+        "segment_ends": segment_ends,
+        "segment_labels": None,
+    }
+
+
+def _simplify_polygons(features: FeatureSet, tolerance: float) -> dict:
+    offsets = features.polygon_offsets
+    sizes = np.diff(offsets)
+    # Close every ring with a copy of its first vertex, kept as a polyline end
+    closed_offsets = offsets + np.arange(len(offsets))
+    closed = np.empty((len(features.polygon_xy) + len(sizes), 2))
+    ring_of_vertex = np.repeat(np.arange(len(sizes)), sizes)
+    closed[np.arange(len(features.polygon_xy)) + ring_of_vertex] = features.polygon_xy
+    closed[closed_offsets[1:] - 1] = features.polygon_xy[offsets[:-1]]
+
+    keep = douglas_peucker(closed, closed_offsets, tolerance)
+    keep[closed_offsets[1:] - 1] = False
+    keep = keep[np.arange(len(features.polygon_xy)) + ring_of_vertex]
+    # Rings that would collapse keep all their vertices
+    keep |= np.repeat(np.add.reduceat(keep, offsets[:-1]) < 3, sizes)
+
+    new_offsets = np.zeros_like(offsets)
+    np.cumsum(np.add.reduceat(keep, offsets[:-1]), out=new_offsets[1:])
+    return {"polygon_xy": features.polygon_xy[keep], "polygon_offsets": new_offsets}
+
+
+def simplify_feature_set(features: FeatureSet, tolerance: float) -> FeatureSet:
+    """
+    Level-of-detail simplification of the lines and polygons of a FeatureSet.
+
+    Segments are chained into runs (see _segment_runs) and both runs and polygon
+    rings are simplified with douglas_peucker, so that no dropped vertex is farther
+    than ``tolerance`` from the drawn geometry. Run ends, junctions, dashed segments,
+    ring closures and points are kept as they are. Segment labels are dropped, since
+    segments are merged.
+
+    Args:
+        features: Features to simplify; lines need ``segment_ends``.
+        tolerance: Largest allowed deviation, in data units.
+
+    Returns:
+        Simplified FeatureSet, or ``features`` itself when there is nothing to do.
+    """
+    if tolerance <= 0:
+        return features
+    changes = {}
+    if features.segment_ends is not None and len(features.segments):
+        changes.update(_simplify_segments(features, tolerance))
+    if features.n_polygons:
+        changes.update(_simplify_polygons(features, tolerance))
+    return replace(features, **changes) if changes else features
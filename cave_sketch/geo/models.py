@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class GpsRef:
     """A known reference point linking a survey station ID to GPS coordinates."""
 
@@ -10,7 +10,7 @@ class GpsRef:
     lon: float
 
 
-@dataclass
+@dataclass(slots=True)
 class GeoPoint:
     """A survey point that has been georeferenced to GPS coordinates."""
 
@@ -8,7 +8,7 @@ from folium import Map
 
 from cave_sketch.backend_renders import render_to_folium, render_to_kmz
 from cave_sketch.features.geometry import rotate_points
-from cave_sketch.features.render_features import extract_features_from_json
+from cave_sketch.features.render_features import extract_feature_set_from_json
 
 # WGS84 constants
 _A = 6378137.0
@@ -263,7 +263,7 @@ def create_html_map(
     # ---- Render each dataset ----
     for i, d in enumerate(all_data):
         # Apply rotation only to the first dataset if requested
-        features = extract_features_from_json(d)
+        features = extract_feature_set_from_json(d)
         render_to_folium(features, fmap, d["name"])
 
     folium.LayerControl().add_to(fmap)
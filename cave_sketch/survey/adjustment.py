@@ -0,0 +1,305 @@
+from enum import Enum
+from typing import List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from cave_sketch.survey.metrics import _station_legs, _union_find
+
+# Reduced systems up to this many unknown junctions are solved directly
+_DENSE_LIMIT = 2000
+
+
+class MergeAdjustment(Enum):
+    """How a child survey is fitted onto the stations it shares with its parent."""
+
+    # Pure translation at the junction station
+    TRANSLATION = "translation"
+    # Least-squares rotation and translation over all the shared stations
+    RIGID = "rigid"
+    # RIGID, then the remaining misclosures are distributed along the child's legs
+    NETWORK = "network"
+
+
+def fit_rigid_transform(source: np.ndarray, target: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Least-squares rotation and translation mapping ``source`` points onto ``target``.
+
+    Args:
+        source: (N, 2) points to move.
+        target: (N, 2) points they should land on.
+
+    Returns:
+        Tuple of (rotation, translation) with ``target ~ source @ rotation.T + translation``.
+        With a single pair (or coincident sources) the rotation is the identity.
+    """
+    source = np.asarray(source, dtype=np.float64)
+    target = np.asarray(target, dtype=np.float64)
+    src_mean, dst_mean = source.mean(axis=0), target.mean(axis=0)
+    cov = (source - src_mean).T @ (target - dst_mean)
+    angle = np.arctan2(cov[0, 1] - cov[1, 0], cov[0, 0] + cov[1, 1])
+    cos, sin = np.cos(angle), np.sin(angle)
+    rotation = np.array([[cos, -sin], [sin, cos]])
+    return rotation, dst_mean - src_mean @ rotation.T
+
+
+def _solve_spd(
+    n: int, rows: np.ndarray, cols: np.ndarray, values: np.ndarray, rhs: np.ndarray
+) -> np.ndarray:
+    """
+    Solve the symmetric positive definite system given as (row, col, value) triplets.
+
+    Small systems are solved densely, larger ones with Jacobi-preconditioned conjugate
+    gradients on the sparse triplets (one right-hand side per column of ``rhs``).
+    """
+    if n <= _DENSE_LIMIT:
+        matrix = np.zeros((n, n))
+        np.add.at(matrix, (rows, cols), values)
+        return np.linalg.solve(matrix, rhs)
+
+    diagonal = np.bincount(rows[rows == cols], weights=values[rows == cols], minlength=n)
+
+    def matvec(v: np.ndarray) -> np.ndarray:
+        columns = [
+            np.bincount(rows, weights=values * v[cols, k], minlength=n) for k in range(v.shape[1])
+        ]
+        return np.stack(columns, axis=1)
+
+    x = rhs / diagonal[:, None]
+    r = rhs - matvec(x)
+    z = r / diagonal[:, None]
+    p = z.copy()
+    rz = (r * z).sum(axis=0)
+    tolerance = 1e-12 * max(float(np.abs(rhs).max()), 1.0)
+    for _ in range(10 * n):
+        if np.abs(r).max() <= tolerance:
+            break
+        q = matvec(p)
+        alpha = rz / np.maximum((p * q).sum(axis=0), np.finfo(float).tiny)
+        x += alpha * p
+        r -= alpha * q
+        z = r / diagonal[:, None]
+        rz_new = (r * z).sum(axis=0)
+        p = z + rz_new / np.maximum(rz, np.finfo(float).tiny) * p
+        rz = rz_new
+    return x
+
+
+def distribute_misclosure(
+    xy: np.ndarray,
+    legs: np.ndarray,
+    anchors: np.ndarray,
+    anchor_corrections: np.ndarray,
+) -> np.ndarray:
+    """
+    Spread the corrections of the anchor stations over a station network.
+
+    Solves the least-squares network adjustment that keeps every leg vector as close
+    as possible to its measured value, each leg weighted by the inverse of its
+    length, while the anchors take the given corrections. The solution is harmonic:
+    along a chain of legs the correction varies linearly with the distance travelled.
+    Chains of degree-2 stations are first reduced to single edges between junctions
+    (the series rule), so only junctions enter the linear system and a cave network
+    of 10k stations adjusts in milliseconds. Stations not connected to an anchor
+    are left uncorrected.
+
+    Args:
+        xy: (N, 2) station coordinates (used for the leg weights).
+        legs: (M, 2) station indices of each undirected leg.
+        anchors: Indices of the stations with a prescribed correction.
+        anchor_corrections: (K, 2) correction of each anchor.
+
+    Returns:
+        (N, 2) correction of every station.
+    """
+    n = len(xy)
+    corrections = np.zeros((n, 2))
+    legs = legs[legs[:, 0] != legs[:, 1]]
+    if not n or not len(anchors):
+        return corrections
+
+    is_anchor = np.zeros(n, dtype=bool)
+    is_anchor[anchors] = True
+    corrections[anchors] = anchor_corrections
+
+    # Components without an anchor keep a zero correction
+    roots = _union_find(n, legs[:, 0], legs[:, 1])
+    anchored = np.isin(roots, roots[anchors])
+    legs = legs[anchored[legs[:, 0]]]
+    if not len(legs):
+        return corrections
+
+    resistance = np.hypot(*(xy[legs[:, 1]] - xy[legs[:, 0]]).T)
+    resistance = np.maximum(resistance, 1e-9 * max(float(resistance.max()), 1.0))
+    degree = np.bincount(legs.ravel(), minlength=n)
+    is_key = is_anchor | (degree != 2)
+
+    # CSR adjacency: the legs at station i are leg_at[start[i]:start[i + 1]]
+    ends = legs.ravel()
+    order = np.argsort(ends, kind="stable")
+    leg_at = (order // 2).tolist()
+    start = np.concatenate([[0], np.cumsum(degree)]).tolist()
+    leg_ends = legs.tolist()
+    leg_resistance = resistance.tolist()
+    key = is_key.tolist()
+
+    # Walk every chain from a key station to the next one (every anchored component
+    # has at least one key station: its anchor)
+    chain_ends: List[Tuple[int, int, float]] = []
+    interior: List[Tuple[int, int, float]] = []  # (station, chain, distance from start)
+    visited = [False] * len(leg_ends)
+    for first in np.flatnonzero(is_key).tolist():
+        for slot in range(start[first], start[first + 1]):
+            leg = leg_at[slot]
+            if visited[leg]:
+                continue
+            chain, node, travelled = len(chain_ends), first, 0.0
+            while True:
+                visited[leg] = True
+                end_a, end_b = leg_ends[leg]
+                node = end_b if end_a == node else end_a
+                travelled += leg_resistance[leg]
+                if key[node]:
+                    break
+                interior.append((node, chain, travelled))
+                s = start[node]
+                leg = leg_at[s] if leg_at[s] != leg else leg_at[s + 1]
+            chain_ends.append((first, node, travelled))
+
+    chain_from, chain_to, chain_length = (np.array(v) for v in zip(*chain_ends))
+
+    # Reduced system over the junctions without a prescribed correction
+    unknown = np.flatnonzero(is_key & ~is_anchor & anchored)
+    if len(unknown):
+        position = np.full(n, -1, dtype=np.int64)
+        position[unknown] = np.arange(len(unknown))
+        conductance = 1.0 / chain_length
+        a, b = position[chain_from], position[chain_to]
+        rhs = np.zeros((len(unknown), 2))
+        rows, cols, values = [], [], []
+        for this, other, other_station in ((a, b, chain_to), (b, a, chain_from)):
+            on = (this >= 0) & (chain_from != chain_to)
+            rows += [this[on]]
+            cols += [this[on]]
+            values += [conductance[on]]
+            coupled = on & (other >= 0)
+            rows += [this[coupled]]
+            cols += [other[coupled]]
+            values += [-conductance[coupled]]
+            fixed = on & (other < 0)
+            np.add.at(
+                rhs,
+                this[fixed],
+                conductance[fixed, None] * corrections[other_station[fixed]],
+            )
+        corrections[unknown] = _solve_spd(
+            len(unknown), np.concatenate(rows), np.concatenate(cols), np.concatenate(values), rhs
+        )
+
+    # Linear interpolation along each chain
+    if interior:
+        inner, inner_chain, inner_travelled = (np.array(v) for v in zip(*interior))
+        t = (inner_travelled / chain_length[inner_chain])[:, None]
+        corrections[inner] = (1 - t) * corrections[chain_from[inner_chain]] + t * corrections[
+            chain_to[inner_chain]
+        ]
+    return corrections
+
+
+def _nearest(points: np.ndarray, sites: np.ndarray) -> np.ndarray:
+    """
+    Index of the nearest site of every point.
+
+    Sites are bucketed into a uniform grid of about one site per cell; each point
+    searches its cell and the eight neighbours, and the few points whose nearest
+    candidate is farther than a cell (so a closer site may lie outside the 3x3
+    block) fall back to a brute-force search.
+    """
+    low = np.minimum(points.min(axis=0), sites.min(axis=0))
+    span = float(np.ptp(sites, axis=0).max())
+    cell = max(span / np.sqrt(len(sites)), 1e-9)
+    site_cells = np.floor((sites - low) / cell).astype(np.int64)
+    point_cells = np.floor((points - low) / cell).astype(np.int64)
+    stride = int(max(site_cells[:, 1].max(), point_cells[:, 1].max())) + 3
+
+    site_keys = (site_cells[:, 0] + 1) * stride + site_cells[:, 1] + 1
+    order = np.argsort(site_keys, kind="stable")
+    sorted_keys = site_keys[order]
+
+    px, py = points[:, 0], points[:, 1]
+    sx, sy = sites[:, 0], sites[:, 1]
+    best = np.full(len(points), -1, dtype=np.int64)
+    best_dist = np.full(len(points), np.inf)
+    for dc in (-1, 0, 1):
+        for dr in (-1, 0, 1):
+            keys = (point_cells[:, 0] + 1 + dc) * stride + point_cells[:, 1] + 1 + dr
+            lo = np.searchsorted(sorted_keys, keys, side="left")
+            count = np.searchsorted(sorted_keys, keys, side="right") - lo
+            # k-th site of each point's cell, for the points whose cell has that many
+            for k in range(int(count.max(initial=0))):
+                owner = np.flatnonzero(count > k)
+                candidate = order[lo[owner] + k]
+                dist = (px[owner] - sx[candidate]) ** 2 + (py[owner] - sy[candidate]) ** 2
+                better = dist < best_dist[owner]
+                best[owner[better]] = candidate[better]
+                best_dist[owner[better]] = dist[better]
+
+    far = np.flatnonzero(best_dist > cell * cell)
+    for chunk in np.array_split(far, len(far) * len(sites) // 1_000_000 + 1):
+        if len(chunk):
+            dist = ((points[chunk, None, :] - sites[None, :, :]) ** 2).sum(axis=2)
+            best[chunk] = dist.argmin(axis=1)
+    return best
+
+
+def adjust_child(
+    child_df: pd.DataFrame,
+    child_stations: Sequence[str],
+    parent_xy: np.ndarray,
+    adjustment: MergeAdjustment,
+) -> pd.DataFrame:
+    """
+    Fit a child survey onto the parent coordinates of the stations they share.
+
+    Args:
+        child_df: Child view, with string Node_Ids (modified in place).
+        child_stations: Shared stations, as named in the child.
+        parent_xy: (K, 2) parent coordinates of the shared stations.
+        adjustment: RIGID or NETWORK.
+
+    Returns:
+        The child view in parent coordinates. With NETWORK every shared station lands
+        exactly on its parent position; other points move with their nearest station.
+    """
+    node_ids = child_df["Node_Id"].to_numpy()
+    xy = child_df[["X", "Y"]].to_numpy(dtype=np.float64)
+    first_row = pd.Series(np.arange(len(node_ids))[::-1], index=node_ids[::-1])
+    first_row = first_row[~first_row.index.duplicated(keep="last")]
+    shared_rows = first_row.loc[list(child_stations)].to_numpy()
+
+    rotation, translation = fit_rigid_transform(xy[shared_rows], parent_xy)
+    xy = xy @ rotation.T + translation
+
+    if adjustment == MergeAdjustment.NETWORK:
+        child_df["X"], child_df["Y"] = xy[:, 0], xy[:, 1]
+        coords, legs = _station_legs(child_df)
+        station_xy = coords.to_numpy(dtype=np.float64)
+        anchor_codes = coords.index.get_indexer(list(child_stations))
+        is_station_anchor = anchor_codes >= 0
+        station_corrections = distribute_misclosure(
+            station_xy,
+            legs,
+            anchor_codes[is_station_anchor],
+            parent_xy[is_station_anchor] - xy[shared_rows[is_station_anchor]],
+        )
+        code = coords.index.get_indexer(node_ids)
+        others = np.flatnonzero(code < 0)
+        if len(others) and len(station_xy):
+            code[others] = _nearest(xy[others], station_xy)
+        if len(station_xy):
+            xy = xy + np.where((code >= 0)[:, None], station_corrections[code], 0.0)
+        # Shared stations that are not numeric stations are snapped directly
+        xy[shared_rows[~is_station_anchor]] = parent_xy[~is_station_anchor]
+
+    child_df["X"], child_df["Y"] = xy[:, 0], xy[:, 1]
+    return child_df
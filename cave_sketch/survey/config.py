@@ -15,3 +15,6 @@ class SurveyConfig:
     show_grid: bool = True
     surveyor_name: str = ""
     show_centerline: bool = True
+    fast_labels: bool = False
+    lod: bool = True
+    free_space_placement: bool = False
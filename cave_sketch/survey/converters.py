@@ -0,0 +1,93 @@
+import io
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from cave_sketch.dxf.models import CaveSurvey
+
+SURVEY_COLUMNS = ["Node_Id", "Links", "X", "Y", "Type"]
+
+# A survey view, either as a model or as a DataFrame with SURVEY_COLUMNS
+SurveyData = Union[CaveSurvey, pd.DataFrame]
+
+# A survey input: path to a survey CSV, a survey DataFrame or a parsed CaveSurvey
+SurveySource = Union[str, Path, pd.DataFrame, CaveSurvey]
+
+
+def load_survey_df(source: Union[SurveySource, bytes, None]) -> Optional[pd.DataFrame]:
+    """
+    Return a survey input as a DataFrame, reading it from disk only when it is a path.
+
+    ``bytes`` are the contents of a survey CSV that was already read, e.g. to hash it.
+    """
+    if source is None:
+        return None
+    if isinstance(source, pd.DataFrame):
+        return source
+    if isinstance(source, CaveSurvey):
+        return survey_to_df(source)
+    if isinstance(source, bytes):
+        return pd.read_csv(io.BytesIO(source))
+    if not source:
+        return None
+    return pd.read_csv(source)
+
+
+def as_survey_df(survey: SurveyData) -> pd.DataFrame:
+    """Return the survey as a DataFrame, converting only CaveSurvey models."""
+    if isinstance(survey, CaveSurvey):
+        return survey_to_df(survey)
+    return normalize_survey_df(survey)
+
+
+def normalize_survey_df(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Coerce a survey DataFrame (e.g. straight from pd.read_csv) to the column types the
+    renderer expects: string IDs, types and links, float coordinates. Links are
+    cleaned the same way as a CaveSurvey round trip would.
+    """
+    return pd.DataFrame(
+        {
+            "Node_Id": df["Node_Id"].astype(str),
+            "Links": clean_links_column(df["Links"]),
+            "X": df["X"].astype(float),
+            "Y": df["Y"].astype(float),
+            "Type": df["Type"].astype(str),
+        }
+    ).reset_index(drop=True)
+
+
+def _clean_links(links_str: str) -> str:
+    links = [link.strip() for link in links_str.split("-") if link.strip()]
+    return "-".join(links) if links else "-"
+
+
+def clean_links_column(links: pd.Series) -> pd.Series:
+    """
+    Column-wise link cleaning: blanks and empty tokens are dropped and rows without
+    links become "-". Well-formed rows ("a-b-c" or "-") are kept as they are; only
+    rows with blanks or empty tokens are cleaned one by one.
+    """
+    links = links.astype(str)
+    dirty = (links == "") | (links.str.contains(r"\s|--|^-.|.-$", regex=True))
+    if dirty.any():
+        links = links.copy()
+        links[dirty] = links[dirty].map(_clean_links)
+    return links
+
+
+def survey_to_df(survey: CaveSurvey) -> pd.DataFrame:
+    """Convert a CaveSurvey model to a survey DataFrame with SURVEY_COLUMNS."""
+    points = survey.points
+    return pd.DataFrame(
+        {
+            "Node_Id": [p.id for p in points],
+            "Links": ["-".join(p.links) or "-" for p in points],
+            "X": np.fromiter((p.x for p in points), dtype=float, count=len(points)),
+            "Y": np.fromiter((p.y for p in points), dtype=float, count=len(points)),
+            "Type": [p.point_type for p in points],
+        },
+        columns=SURVEY_COLUMNS,
+    )
@@ -1,6 +1,45 @@
 import math
+from typing import Optional, Tuple
 
+import numpy as np
 from matplotlib.axes._axes import Axes
+from matplotlib.lines import Line2D
+
+# Most grid lines drawn along one axis: a line every ~4 pt across an A4 page.
+# Past it the spacing is doubled until the grid fits.
+MAX_GRID_LINES = 150
+
+
+def _grid_positions(lo: float, hi: float, grid_spacing: float) -> np.ndarray:
+    """Multiples of ``grid_spacing`` within [lo, hi]."""
+    start = int(math.ceil(lo / grid_spacing))
+    end = int(math.floor(hi / grid_spacing))
+    return np.arange(start, end + 1, dtype=np.float64) * grid_spacing
+
+
+def coarse_grid_spacing(
+    grid_spacing: float, extent: float, max_lines: int = MAX_GRID_LINES
+) -> float:
+    """
+    Spacing of the grid lines drawn over ``extent``.
+
+    The spacing is doubled until at most max_lines lines fit along the extent, so
+    it stays a multiple of grid_spacing.
+
+    Args:
+        grid_spacing: Requested spacing, in data units.
+        extent: Longest side of the gridded area, in data units.
+        max_lines: Most grid lines along one axis.
+
+    Returns:
+        The spacing actually used, ``grid_spacing * 2**k``.
+    """
+    if grid_spacing <= 0:
+        raise ValueError("grid_spacing must be positive and greater than zero.")
+    spacing = grid_spacing
+    while max(extent, 0.0) / spacing + 1 > max_lines:
+        spacing *= 2
+    return spacing
 
 
 def _add_grid(
@@ -10,29 +49,66 @@ def _add_grid(
     y_min: float,
     y_max: float,
     grid_spacing: float,
-) -> None:
+    max_lines: int = MAX_GRID_LINES,
+    extent: Optional[float] = None,
+) -> Tuple[Line2D, Line2D]:
     """
     Draw a regular grid of horizontal and vertical lines on the matplotlib Axes.
     
     Grid lines are aligned to clean multiples of grid_spacing, rendered behind
-    all other features (zorder=0) and style is lightgray dotted.
+    all other features (zorder=0) and style is lightgray dotted. The vertical and
+    the horizontal lines are each a single precomputed Line2D, broken into segments
+    by NaN vertices, spanning the axes like axvline and axhline. When an axis
+    would get more than max_lines lines, the spacing is doubled (on both axes, so
+    cells stay square and aligned to the original multiples) until it does not,
+    see coarse_grid_spacing, and the cell size is written in the lower right corner.
+
+    Args:
+        extent: Length the line cap applies to, the longest side of the extents by
+            default. Callers snapping to the grid pass the extent they coarsened for.
+
+    Returns:
+        The (vertical, horizontal) grid lines.
     """
-    if grid_spacing <= 0:
-        raise ValueError("grid_spacing must be positive and greater than zero.")
+    x_min, x_max, y_min, y_max = map(float, (x_min, x_max, y_min, y_max))
+    longest = max(x_max - x_min, y_max - y_min, 0.0)
+    spacing = coarse_grid_spacing(grid_spacing, longest if extent is None else extent, max_lines)
+
+    # Vertical and horizontal lines (snapped to multiples of the spacing)
+    xs = _grid_positions(x_min, x_max, spacing)
+    ys = _grid_positions(y_min, y_max, spacing)
 
-    # Vertical lines (snapped to multiples of grid_spacing)
-    start_k_x = int(math.ceil(x_min / grid_spacing))
-    end_k_x = int(math.floor(x_max / grid_spacing))
-    for k in range(start_k_x, end_k_x + 1):
-        x = k * grid_spacing
-        ax.axvline(x, color="lightgray", linestyle=":", zorder=0)
-
-    # Horizontal lines (snapped to multiples of grid_spacing)
-    start_k_y = int(math.ceil(y_min / grid_spacing))
-    end_k_y = int(math.floor(y_max / grid_spacing))
-    for k in range(start_k_y, end_k_y + 1):
-        y = k * grid_spacing
-        ax.axhline(y, color="lightgray", linestyle=":", zorder=0)
+    # Each line runs from 0 to 1 in axes coordinates across, as axvline and axhline
+    # do, so it spans the axes whatever the aspect adjustment does to the limits.
+    def lines(positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        along = np.tile([0.0, 1.0, np.nan], len(positions))[:-1]
+        across = np.repeat(positions, 3)[:-1]
+        return across, along
+
+    vx, vy = lines(xs)
+    hy, hx = lines(ys)
+    grid = (
+        Line2D(vx, vy, color="lightgray", linestyle=":", zorder=0, gid="grid"),
+        Line2D(hx, hy, color="lightgray", linestyle=":", zorder=0, gid="grid"),
+    )
+    grid[0].set_transform(ax.get_xaxis_transform())
+    grid[1].set_transform(ax.get_yaxis_transform())
+    # Added as artists rather than lines, so that they do not move the limits
+    for line in grid:
+        ax.add_artist(line)
+    if spacing != grid_spacing:
+        ax.text(
+            0.99,
+            0.01,
+            f"Griglia {spacing:g} m",
+            transform=ax.transAxes,
+            ha="right",
+            va="bottom",
+            fontsize=7,
+            color="gray",
+            gid="grid_spacing",
+        )
+    return grid
 
 
 def snap_rule_to_grid(
@@ -0,0 +1,135 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from matplotlib.artist import Artist, allow_rasterization
+from matplotlib.font_manager import FontProperties
+
+
+def cull_labels(
+    anchors: np.ndarray,
+    widths: np.ndarray,
+    height: float,
+    bounds: Optional[Tuple[float, float, float, float]] = None,
+) -> np.ndarray:
+    """
+    Pick the labels that can be drawn without overlapping, in order of priority.
+
+    Each label box spans ``[x - width, x] x [y, y + height]`` from its anchor (text
+    aligned right / bottom). The anchors are bucketed on a grid of cells as large as
+    the largest box, so two boxes can only overlap when their cells are neighbours:
+    each label is checked only against the labels already accepted in the 3x3
+    neighbouring cells.
+
+    Args:
+        anchors: (N, 2) label anchors, in display units.
+        widths: (N,) box widths, in display units.
+        height: Box height, in display units.
+        bounds: Optional (x0, y0, x1, y1) visible area; labels entirely outside it are
+            dropped.
+
+    Returns:
+        Sorted indices of the labels to draw.
+    """
+    anchors = np.asarray(anchors, dtype=np.float64).reshape(-1, 2)
+    widths = np.asarray(widths, dtype=np.float64)
+    candidates = np.flatnonzero(np.isfinite(anchors).all(axis=1))
+    if bounds is not None:
+        x0, y0, x1, y1 = bounds
+        x, y = anchors[candidates].T
+        visible = (x >= x0) & (x - widths[candidates] <= x1) & (y + height >= y0) & (y <= y1)
+        candidates = candidates[visible]
+    if not len(candidates) or height <= 0:
+        return candidates
+
+    cell = np.array([max(float(widths[candidates].max()), 1e-9), height])
+    cells = np.floor(anchors[candidates] / cell).astype(np.int64)
+
+    accepted: Dict[Tuple[int, int], List[int]] = {}
+    keep = []
+    for index, (cx, cy) in zip(candidates.tolist(), cells.tolist()):
+        x, y = anchors[index]
+        left = x - widths[index]
+        neighbours = (
+            other
+            for nx in (cx - 1, cx, cx + 1)
+            for ny in (cy - 1, cy, cy + 1)
+            for other in accepted.get((nx, ny), ())
+        )
+        if any(
+            left < anchors[other, 0]
+            and anchors[other, 0] - widths[other] < x
+            and abs(anchors[other, 1] - y) < height
+            for other in neighbours
+        ):
+            continue
+        accepted.setdefault((cx, cy), []).append(index)
+        keep.append(index)
+    return np.array(keep, dtype=np.int64)
+
+
+class StationLabels(Artist):
+    """
+    Station labels drawn as a single artist.
+
+    At draw time the labels are projected to display coordinates, culled with
+    cull_labels so that only non-overlapping ones remain, and their strings are
+    passed straight to the renderer, without a Text artist (and its layout) per
+    label. Label widths come from a per-character advance table measured once per
+    draw. Labels are aligned right / bottom on their anchor, like the per-station
+    ax.text labels of create_survey.
+    """
+
+    zorder = 10
+
+    def __init__(
+        self,
+        xy: np.ndarray,
+        labels: Sequence[str],
+        fontsize: float,
+        color: str = "black",
+    ):
+        super().__init__()
+        self._xy = np.asarray(xy, dtype=np.float64).reshape(-1, 2)
+        self._labels = [str(label) for label in labels]
+        self._font = FontProperties(size=fontsize)
+        self._color = color
+        self.drawn = np.empty(0, dtype=np.int64)
+
+    def _label_widths(self, renderer) -> np.ndarray:
+        """Label widths in pixels, as the sum of the advance of their characters."""
+        chars = sorted(set("".join(self._labels)))
+        advance = {
+            char: renderer.get_text_width_height_descent(char * 8, self._font, ismath=False)[0] / 8
+            for char in chars
+        }
+        return np.fromiter(
+            (sum(advance[char] for char in label) for label in self._labels),
+            dtype=np.float64,
+            count=len(self._labels),
+        )
+
+    @allow_rasterization
+    def draw(self, renderer):
+        if not self.get_visible() or self.axes is None or not len(self._xy):
+            return
+        anchors = self.axes.transData.transform(self._xy)
+        widths = self._label_widths(renderer)
+        _, height, descent = renderer.get_text_width_height_descent("lp", self._font, ismath=False)
+        self.drawn = cull_labels(anchors, widths, height, bounds=tuple(self.axes.bbox.extents))
+
+        renderer.open_group("station_labels", gid=self.get_gid())
+        gc = renderer.new_gc()
+        gc.set_foreground(self._color)
+        gc.set_alpha(self.get_alpha())
+        gc.set_url(self.get_url())
+        self._set_gc_clip(gc)
+        canvas_height = renderer.get_canvas_width_height()[1]
+        for index in self.drawn.tolist():
+            x = anchors[index, 0] - widths[index]
+            y = anchors[index, 1] + descent
+            if renderer.flipy():
+                y = canvas_height - y
+            renderer.draw_text(gc, x, y, self._labels[index], self._font, 0.0, ismath=False)
+        gc.restore()
+        renderer.close_group("station_labels")
+        self.stale = False
@@ -1,14 +1,139 @@
 import numpy as np
 
+# Points compared at once against the corner zones by _count_in_rects
+_COUNT_CHUNK = 32768
+# Occupancy grid resolution of find_free_space: largest number of cells per axis
+FREE_SPACE_CELLS = 256
+
 
 def compute_data_bbox(x, y):
     if len(x) == 0:
         return 0, 0, 0, 0
     return float(np.min(x)), float(np.max(x)), float(np.min(y)), float(np.max(y))
 
+def _count_in_rects(x, y, rects):
+    """
+    Number of points in each of the given rectangles, in a single pass over the points.
+
+    Args:
+        x, y: Point coordinates.
+        rects: (K, 4) array of (x0, x1, y0, y1) rectangles, bounds inclusive.
+
+    Returns:
+        (K,) int64 array of counts.
+    """
+    x = np.asarray(x, dtype=np.float64).ravel()
+    y = np.asarray(y, dtype=np.float64).ravel()
+    x0, x1, y0, y1 = np.asarray(rects, dtype=np.float64).T[:, :, None]
+    counts = np.zeros(len(x0), dtype=np.int64)
+    # Chunks keep the (rectangles, points) masks small
+    for start in range(0, len(x), _COUNT_CHUNK):
+        xc = x[start : start + _COUNT_CHUNK]
+        yc = y[start : start + _COUNT_CHUNK]
+        inside = (xc >= x0) & (xc <= x1) & (yc >= y0) & (yc <= y1)
+        counts += np.count_nonzero(inside, axis=1)
+    return counts
+
+def _occupancy_grid(x, y, segments, bounds, cell, shape):
+    """Occupied cells of the points and segments, dilated by one cell."""
+    ny, nx = shape
+    xs = [np.asarray(x, dtype=np.float64).ravel()]
+    ys = [np.asarray(y, dtype=np.float64).ravel()]
+    if segments is not None and len(segments):
+        # Samples at most one cell apart: with the dilation, every crossed cell is set
+        start = segments[:, 0]
+        delta = segments[:, 1] - start
+        lengths = np.hypot(delta[:, 0], delta[:, 1])
+        lengths[~np.isfinite(lengths)] = 0.0
+        steps = np.ceil(lengths / cell).astype(np.int64) + 1
+        t = np.arange(steps.sum()) - np.repeat(np.cumsum(steps) - steps, steps)
+        t = t / np.repeat(np.maximum(steps - 1, 1), steps)
+        samples = np.repeat(start, steps, axis=0) + t[:, None] * np.repeat(delta, steps, axis=0)
+        xs.append(samples[:, 0])
+        ys.append(samples[:, 1])
+    px, py = np.concatenate(xs), np.concatenate(ys)
+    x_min, x_max, y_min, y_max = bounds
+    inside = (px >= x_min) & (px <= x_max) & (py >= y_min) & (py <= y_max)
+    cx = np.clip(np.floor((px[inside] - x_min) / cell), 0, nx - 1).astype(np.int64)
+    cy = np.clip(np.floor((py[inside] - y_min) / cell), 0, ny - 1).astype(np.int64)
+
+    grid = np.zeros((ny + 2, nx + 2), dtype=bool)
+    grid[cy + 1, cx + 1] = True
+    dilated = grid[1:-1, 1:-1].copy()
+    for dy in (0, 1, 2):
+        for dx in (0, 1, 2):
+            dilated |= grid[dy:dy + ny, dx:dx + nx]
+    return dilated
+
+def _empty_windows(sat, height, width):
+    """Boolean (rows, cols) mask of the empty height x width windows, by lower-left cell."""
+    counts = sat[height:, width:] - sat[:-height, width:]
+    counts -= sat[height:, :-width] - sat[:-height, :-width]
+    return counts == 0
+
+def find_free_space(x, y, width, height, segments=None, bounds=None, max_cells=FREE_SPACE_CELLS):
+    """
+    Find the emptiest place for a width x height box among the drawn features.
+
+    The points and segments are rasterized on an occupancy grid over ``bounds`` and
+    every window position is checked at once on its summed-area table. The box is
+    grown cell by cell on all sides (binary search) to the largest empty rectangle
+    of its shape, and placed at the center of the lowest, then leftmost, of those.
+
+    Args:
+        x, y: Drawn points (survey nodes).
+        width, height: Box size, in data units (footprint including its margin).
+        segments: Optional (N, 2, 2) drawn segments.
+        bounds: (x_min, x_max, y_min, y_max) area to search, the data bbox by default.
+        max_cells: Largest number of grid cells per axis.
+
+    Returns:
+        (x0, y0) lower-left corner of the box, or None when no empty place fits it.
+    """
+    if bounds is None:
+        bounds = compute_data_bbox(x, y)
+    x_min, x_max, y_min, y_max = bounds
+    span = max(x_max - x_min, y_max - y_min)
+    if not (width > 0 and height > 0 and width <= x_max - x_min and height <= y_max - y_min):
+        return None
+
+    cell = span / max_cells
+    nx = max(int(np.ceil((x_max - x_min) / cell)), 1)
+    ny = max(int(np.ceil((y_max - y_min) / cell)), 1)
+    box_w = int(np.ceil(width / cell))
+    box_h = int(np.ceil(height / cell))
+    if box_w > nx or box_h > ny:
+        return None
+
+    occupied = _occupancy_grid(x, y, segments, bounds, cell, (ny, nx))
+    sat = np.zeros((ny + 1, nx + 1), dtype=np.int64)
+    sat[1:, 1:] = occupied.cumsum(axis=0).cumsum(axis=1)
+    if not _empty_windows(sat, box_h, box_w).any():
+        return None
+
+    # Largest growth (in cells, on each side) that still leaves an empty window
+    low, high = 0, (min(nx - box_w, ny - box_h)) // 2
+    while low < high:
+        grow = (low + high + 1) // 2
+        if _empty_windows(sat, box_h + 2 * grow, box_w + 2 * grow).any():
+            low = grow
+        else:
+            high = grow - 1
+    rows, cols = np.nonzero(_empty_windows(sat, box_h + 2 * low, box_w + 2 * low))
+    row, col = rows[0], cols[0]  # lowest row first, then leftmost
+
+    center_x = x_min + (col + low + box_w / 2) * cell
+    center_y = y_min + (row + low + box_h / 2) * cell
+    return float(center_x - width / 2), float(center_y - height / 2)
+
 def score_corners(
     x, y, zone_fraction=0.20, padding_fraction=0.0, padding_x_units=None, padding_y_units=None
 ):
+    """
+    Number of points in each corner zone, penalized when its padding is not empty.
+
+    All the zones are counted in one pass over the points.
+    """
     x_min, x_max, y_min, y_max = compute_data_bbox(x, y)
     width = x_max - x_min
     height = y_max - y_min
@@ -47,15 +172,14 @@ def score_corners(
         "top-right": (x_max - padding_x, x_max, y_max - padding_y, y_max),
     }
     
+    # Count points in every zone and padded zone
+    rects = list(zones.values()) + list(padded_zones.values())
+    counts = _count_in_rects(x, y, rects).tolist()
+
     scores = {}
-    for name, (x0, x1, y0, y1) in zones.items():
-        # Count points in zone
-        count = np.sum((x >= x0) & (x <= x1) & (y >= y0) & (y <= y1))
-        
+    for name, count, padded_count in zip(zones, counts, counts[len(zones):]):
         # If padding is requested, significantly penalize if any point is within padding
         if padding_fraction > 0 or padding_x_units is not None or padding_y_units is not None:
-            px0, px1, py0, py1 = padded_zones[name]
-            padded_count = np.sum((x >= px0) & (x <= px1) & (y >= py0) & (y <= py1))
             if padded_count > 0:
                 count += 1000000 # Large penalty
                 
@@ -224,11 +348,16 @@ def get_dual_placement(
 
 def compute_dual_layout(
     x, y, rule_length, arrow_len, ref_scale,
-    rule_orientation="horizontal", north_flag=True
+    rule_orientation="horizontal", north_flag=True, free_space=False, segments=None
 ):
     """
     High-level placement function that handles scaling, footprint calculation,
     corner selection, and fallback expansion.
+
+    The corner zones are counted in one pass over the points (see score_corners).
+    With ``free_space``, when every corner is blocked the rule and arrow go to the
+    largest empty space found by find_free_space among the points and ``segments``,
+    and the axes are only expanded when there is none.
     """
     x_min, x_max, y_min, y_max = compute_data_bbox(x, y)
     x_span = x_max - x_min
@@ -269,7 +398,25 @@ def compute_dual_layout(
     scores = score_corners(x, y, padding_x_units=padding_x_units, padding_y_units=padding_y_units)
     
     # Check if all corners are penalized
-    if all(count >= 1000000 for count in scores.values()):
+    blocked = all(count >= 1000000 for count in scores.values())
+    if blocked and free_space:
+        spot = find_free_space(
+            x, y, padding_x_units, padding_y_units, segments=segments,
+            bounds=(x_min, x_max, y_min, y_max)
+        )
+        if spot is not None:
+            # Footprint box centered in its margin, filled as a bottom-left corner
+            box_x = spot[0] + margin_x / 2
+            box_y = spot[1] + margin_y / 2
+            arrow_pos, rule_pos = get_dual_placement(
+                "bottom-left", box_x, box_x + elem_w, box_y, box_y + elem_h,
+                rule_width=rule_w_param, arrow_height=arrow_h_param,
+                ref_scale=ref_scale, rule_orientation=rule_orientation,
+                north_flag=north_flag
+            )
+            return arrow_pos, rule_pos, None
+
+    if blocked:
         # Fallback needed
         if x_span >= y_span:
             # Wide cave: expand bottom
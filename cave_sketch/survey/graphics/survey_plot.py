@@ -5,8 +5,10 @@ import pandas as pd
 
 from cave_sketch.backend_renders import render_to_matplotlib
 from cave_sketch.features.geometry import rotate_points
-from cave_sketch.features.render_features import extract_features_from_df
-from cave_sketch.survey.graphics.grid import _add_grid, snap_rule_to_grid
+from cave_sketch.features.render_features import extract_feature_set_from_df
+from cave_sketch.features.simplify import lod_tolerance, simplify_feature_set
+from cave_sketch.survey.graphics.grid import _add_grid, coarse_grid_spacing, snap_rule_to_grid
+from cave_sketch.survey.graphics.labels import StationLabels
 from cave_sketch.survey.graphics.north import _add_north_arrow
 from cave_sketch.survey.graphics.placement import (
     compute_data_bbox,
@@ -55,9 +57,12 @@ def create_survey(
     text_size = 300 / ref_scale * 10**tz
 
     # --- Extract features (using your backend-agnostic system) ---
-    features = extract_features_from_df(
+    features = extract_feature_set_from_df(
         df, excluded_nodes, show_centerline=config.get("show_centerline", True)
     )
+    # --- Level of detail: drop vertices closer than LOD_PIXELS printed pixels ---
+    if config.get("lod", True) and (len(features.segments) or features.n_polygons):
+        features = simplify_feature_set(features, lod_tolerance(ax, ref_scale))
 
     # --- Render using Matplotlib backend ---
     render_to_matplotlib(
@@ -71,30 +76,22 @@ def create_survey(
     if config.get("show_centerline", True) and config.get("show_details", True):
         offset = ref_scale * 0.005 if ref_scale > 0 else 0.1
         stations = df[(df["Type"] == "station") & (~df["Node_Id"].isin(excluded_nodes))]
-        if not stations.empty:
-            ax.scatter(stations["X"], stations["Y"], s=marker_size, color="red", zorder=5)
-            for row in stations.itertuples(index=False):
-                ax.text(
-                    row.X - offset,
-                    row.Y + offset,
-                    row.Node_Id,
-                    fontsize=text_size,
-                    ha="right",
-                    va="bottom",
-                    color="black",
-                    zorder=10,
-                )
+        _draw_stations(
+            ax, stations, marker_size, text_size, offset, config.get("fast_labels", False)
+        )
 
     # --- Rule and North arrow ---
     if rule_flag or north_flag:
         arrow_len = ref_scale * 0.07
         arrow_coord, rule_pos, axes_expansion = compute_dual_layout(
             x_coords, y_coords, rule_length, arrow_len, ref_scale,
-            rule_orientation=rule_orientation, north_flag=north_flag
+            rule_orientation=rule_orientation, north_flag=north_flag,
+            free_space=config.get("free_space_placement", False), segments=features.segments
         )
 
         if config.get("show_grid", True):
-            grid_spacing = rule_length / 2
+            # Spacing of the grid drawn below, coarsened on the same extent
+            grid_spacing = coarse_grid_spacing(rule_length / 2, ref_scale)
             rule_pos_snapped = snap_rule_to_grid(rule_pos, grid_spacing, rule_orientation)
             dx = rule_pos_snapped[0] - rule_pos[0]
             dy = rule_pos_snapped[1] - rule_pos[1]
@@ -135,8 +132,36 @@ def create_survey(
     if config.get("show_grid", True):
         xlim = ax.get_xlim()
         ylim = ax.get_ylim()
-        _add_grid(ax, xlim[0], xlim[1], ylim[0], ylim[1], rule_length / 2)
+        _add_grid(ax, xlim[0], xlim[1], ylim[0], ylim[1], rule_length / 2, extent=ref_scale)
 
     return ax
 
 
+def _draw_stations(
+    ax,
+    stations: pd.DataFrame,
+    marker_size: float,
+    text_size: float,
+    offset: float,
+    fast_labels: bool = False,
+) -> None:
+    """Draw station markers and their labels, up-left of each station by ``offset``."""
+    if stations.empty:
+        return
+    ax.scatter(stations["X"], stations["Y"], s=marker_size, color="red", zorder=5)
+    if fast_labels:
+        # Single artist; overlapping labels are culled at draw time
+        anchors = stations[["X", "Y"]].to_numpy(dtype=float) + [-offset, offset]
+        ax.add_artist(StationLabels(anchors, stations["Node_Id"], fontsize=text_size))
+    else:
+        for row in stations.itertuples(index=False):
+            ax.text(
+                row.X - offset,
+                row.Y + offset,
+                row.Node_Id,
+                fontsize=text_size,
+                ha="right",
+                va="bottom",
+                color="black",
+                zorder=10,
+            )
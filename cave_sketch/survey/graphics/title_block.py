@@ -3,6 +3,8 @@ from typing import Optional
 
 from matplotlib.figure import Figure
 
+from cave_sketch.survey.metrics import SurveyStats
+
 
 def wrap_text(text: str, max_chars: int = 35) -> str:
     """
@@ -67,11 +69,13 @@ def draw_title_block(
     surveyor_name: str,
     total_length: float,
     total_depth: Optional[float] = None,
+    stats: Optional[SurveyStats] = None,
 ) -> None:
     """
     Draw a technical title block in the top margin.
     - Cave name is left-aligned, wrapped to max 2 lines if too long.
     - Metadata box is placed on the top right in Italian (vertical layout to prevent overlaps).
+    - With stats, a statistics box is placed left of the metadata box.
 
     Args:
         fig: The matplotlib Figure.
@@ -79,9 +83,10 @@ def draw_title_block(
         surveyor_name: Name of the surveyor.
         total_length: Computed total surveyed length in meters.
         total_depth: Computed total depth in meters, or None to omit.
+        stats: Survey statistics from compute_survey_stats, or None to omit.
     """
-    # 1. Left-aligned wrapped cave name
-    wrapped_name = wrap_text(cave_name, max_chars=35)
+    # 1. Left-aligned wrapped cave name, narrower when the statistics box is shown
+    wrapped_name = wrap_text(cave_name, max_chars=35 if stats is None else 24)
     fig.text(
         0.05,
         0.92,
@@ -147,3 +152,29 @@ def draw_title_block(
             va="center",
             ha="left",
         )
+
+    if stats is not None:
+        _draw_stats_box(fig, stats)
+
+
+def _draw_stats_box(fig: Figure, stats: SurveyStats) -> None:
+    """Draw the survey statistics box left of the metadata box."""
+    # Left: 47%, Bottom: 88%, Width: 20%, Height: 8%
+    ax = fig.add_axes((0.47, 0.88, 0.20, 0.08))
+    ax.set_xticks([])
+    ax.set_yticks([])
+    ax.set_facecolor("white")
+
+    longest = max((branch.length for branch in stats.branches), default=0.0)
+    lines = [
+        f"Sviluppo spaziale: {stats.length:.1f} m",
+        f"Sviluppo verticale: {stats.vertical_length:.1f} m",
+        f"Tratte: {stats.n_legs}",
+        f"Anelli: {stats.n_loops}",
+        f"Rami: {len(stats.branches)} (max {longest:.1f} m)",
+    ]
+
+    y_pos = 0.86
+    for line in lines:
+        ax.text(0.05, y_pos, line, fontsize=7, va="center", ha="left")
+        y_pos -= 0.18
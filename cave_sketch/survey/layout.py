@@ -0,0 +1,126 @@
+from typing import Tuple
+
+import numpy as np
+
+
+class SectionLayout:
+    """
+    Grid index of the area already occupied by the sections laid out on the page.
+
+    Every section added to the layout occupies its bounding box, so that legs between
+    sparse stations are covered too; boxes are kept as (first column, first row, last
+    column, last row) of the square cells of side ``cell_size`` they span. find_slot
+    rasterizes the boxes once into a dense grid with a summed-area table, so testing
+    every candidate position of a new section costs O(1) and a placement costs
+    O(cells) regardless of how many sections were placed before.
+    """
+
+    def __init__(self, cell_size: float = 25.0):
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive.")
+        self.cell_size = float(cell_size)
+        self._boxes = np.empty((0, 4), dtype=np.int64)
+
+    def __len__(self) -> int:
+        """Number of occupied boxes (sections added)."""
+        return len(self._boxes)
+
+    def _to_cells(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        finite = np.isfinite(x) & np.isfinite(y)
+        cols = np.floor(x[finite] / self.cell_size).astype(np.int64)
+        rows = np.floor(y[finite] / self.cell_size).astype(np.int64)
+        return np.column_stack([cols, rows])
+
+    def add(self, x: np.ndarray, y: np.ndarray) -> None:
+        """Mark the cells of the bounding box of the section (x, y) as occupied."""
+        cells = self._to_cells(x, y)
+        if len(cells):
+            box = np.concatenate([cells.min(axis=0), cells.max(axis=0)])
+            self._boxes = np.vstack([self._boxes, box])
+
+    def find_slot(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        delta_x: float,
+        delta_y: float,
+        padding: float,
+    ) -> Tuple[float, float]:
+        """
+        Find the free position nearest to a preferred translation of a section.
+
+        Candidate translations are the preferred one shifted by whole cells, so a
+        section moved straight right or down keeps its alignment with the preferred
+        position. A candidate is free when the bounding box of the translated points,
+        grown by ``padding``, does not touch any occupied cell. Among the free
+        candidates the nearest one wins; ties go to a slot on the right, then below.
+
+        Args:
+            x: X coordinates of the section to place.
+            y: Y coordinates of the section to place.
+            delta_x: Preferred X translation.
+            delta_y: Preferred Y translation.
+            padding: Clearance to keep around the section.
+
+        Returns:
+            The (delta_x, delta_y) translation of the chosen slot.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        finite = np.isfinite(x) & np.isfinite(y)
+        if not len(self._boxes) or not finite.any():
+            return delta_x, delta_y
+
+        c = self.cell_size
+        # Cells spanned by the padded box at the preferred translation
+        first_col = int(np.floor((x[finite].min() + delta_x - padding) / c))
+        last_col = int(np.floor((x[finite].max() + delta_x + padding) / c))
+        first_row = int(np.floor((y[finite].min() + delta_y - padding) / c))
+        last_row = int(np.floor((y[finite].max() + delta_y + padding) / c))
+
+        min_col, min_row = self._boxes[:, :2].min(axis=0)
+        max_col, max_row = self._boxes[:, 2:].max(axis=0)
+        if last_col < min_col or first_col > max_col or last_row < min_row or first_row > max_row:
+            return delta_x, delta_y
+
+        # Shifts (in cells) from just left of/below the occupied cells to just past them
+        shift_cols = np.arange(min_col - last_col - 1, max_col - first_col + 2)
+        shift_rows = np.arange(min_row - last_row - 1, max_row - first_row + 2)
+        width = last_col - first_col + 1
+        height = last_row - first_row + 1
+
+        # Occupancy grid with a free margin of one box size on every side
+        shape = (max_col - min_col + 1 + 2 * width, max_row - min_row + 1 + 2 * height)
+        # Boxes drawn as +1/-1 corners of a difference grid, integrated below
+        lo = self._boxes[:, :2] - (min_col - width, min_row - height)
+        hi = self._boxes[:, 2:] - (min_col - width, min_row - height) + 1
+        diff = np.zeros((shape[0] + 1, shape[1] + 1))
+        np.add.at(diff, (lo[:, 0], lo[:, 1]), 1)
+        np.add.at(diff, (hi[:, 0], lo[:, 1]), -1)
+        np.add.at(diff, (lo[:, 0], hi[:, 1]), -1)
+        np.add.at(diff, (hi[:, 0], hi[:, 1]), 1)
+        grid = diff.cumsum(axis=0).cumsum(axis=1)[:-1, :-1] > 0
+        table = np.zeros((grid.shape[0] + 1, grid.shape[1] + 1))
+        table[1:, 1:] = grid.cumsum(axis=0).cumsum(axis=1)
+
+        # Summed-area lookup of the occupied cells under the box for every shift
+        lo_c = np.arange(len(shift_cols))
+        lo_r = np.arange(len(shift_rows))
+        hi_c, hi_r = lo_c + width, lo_r + height
+        occupied = (
+            table[np.ix_(hi_c, hi_r)]
+            - table[np.ix_(lo_c, hi_r)]
+            - table[np.ix_(hi_c, lo_r)]
+            + table[np.ix_(lo_c, lo_r)]
+        )
+
+        a, b = np.meshgrid(shift_cols, shift_rows, indexing="ij")
+        # Integer ranking: distance first, then right, below and anything else
+        direction = np.where((b == 0) & (a > 0), 0, np.where((a == 0) & (b < 0), 1, 2))
+        rank = (a * a + b * b) * 3 + direction
+        rank[occupied > 0] = np.iinfo(rank.dtype).max
+
+        best = np.unravel_index(np.argmin(rank), rank.shape)
+        return delta_x + shift_cols[best[0]] * c, delta_y + shift_rows[best[1]] * c
@@ -0,0 +1,164 @@
+import hashlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Hashable, Optional, Tuple, Union
+
+import pandas as pd
+
+from cave_sketch.survey.converters import SurveySource, load_survey_df
+from cave_sketch.survey.merger import SectionProtocol, merge_surveys
+
+
+def merge_sources(
+    parent_map: Optional[SurveySource],
+    parent_section: Optional[SurveySource],
+    child_map: Optional[SurveySource] = None,
+    child_section: Optional[SurveySource] = None,
+    parent_station: Optional[str] = None,
+    child_station: Optional[str] = None,
+    section_protocol: SectionProtocol = SectionProtocol.SIMPLE,
+) -> Tuple[Optional[pd.DataFrame], Optional[pd.DataFrame]]:
+    """
+    Load the survey inputs and merge the child survey, if any, into the parent.
+
+    The child is only merged when at least one of its views is given together with
+    both junction stations; otherwise the parent views are returned as loaded.
+    """
+    parent_map_df = load_survey_df(parent_map)
+    parent_section_df = load_survey_df(parent_section)
+    child_map_df = load_survey_df(child_map)
+    child_section_df = load_survey_df(child_section)
+
+    has_child = child_map_df is not None or child_section_df is not None
+    if has_child and parent_station and child_station:
+        return merge_surveys(
+            parent_map=parent_map_df,
+            parent_section=parent_section_df,
+            child_map=child_map_df,
+            child_section=child_section_df,
+            parent_station=parent_station,
+            child_station=child_station,
+            section_protocol=section_protocol,
+        )
+    return parent_map_df, parent_section_df
+
+
+def _read_source(
+    source: Optional[SurveySource],
+) -> Tuple[Optional[str], Union[SurveySource, bytes, None]]:
+    """
+    Content hash of a survey input, with the input to merge if the hash misses.
+
+    Paths are read once: their bytes are hashed and returned, to be parsed by
+    load_survey_df only when needed, instead of reading the file a second time.
+    """
+    if isinstance(source, (str, Path)) and source:
+        data = Path(source).read_bytes()
+        return hashlib.sha256(data).hexdigest(), data
+    return source_key(source), source
+
+
+def source_key(source: Optional[SurveySource]) -> Optional[str]:
+    """Content hash of a survey input (file bytes for paths, cell values for frames)."""
+    if source is None or (isinstance(source, (str, Path)) and not source):
+        return None
+    if isinstance(source, (str, Path)):
+        return hashlib.sha256(Path(source).read_bytes()).hexdigest()
+
+    df = load_survey_df(source)
+    assert df is not None
+    digest = hashlib.sha256(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    digest.update(repr(list(df.columns)).encode())
+    return digest.hexdigest()
+
+
+class MergePlan:
+    """
+    Session cache of merged survey views.
+
+    Each view (map, section) is cached under the content hashes of its parent and
+    child inputs and the junction stations, plus the section protocol for the
+    section view. Re-rendering unchanged inputs therefore reuses the merged frames
+    (with the child translation and ID remapping already applied) instead of reading
+    and merging the CSVs again, and changing only the section protocol re-merges only
+    the section view.
+
+    Returned frames are shared with the cache and must not be modified in place.
+    """
+
+    def __init__(self, max_entries: int = 8):
+        self.max_entries = max_entries
+        self._views: "OrderedDict[Hashable, Optional[pd.DataFrame]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def merge(
+        self,
+        parent_map: Optional[SurveySource],
+        parent_section: Optional[SurveySource],
+        child_map: Optional[SurveySource] = None,
+        child_section: Optional[SurveySource] = None,
+        parent_station: Optional[str] = None,
+        child_station: Optional[str] = None,
+        section_protocol: SectionProtocol = SectionProtocol.SIMPLE,
+    ) -> Tuple[Optional[pd.DataFrame], Optional[pd.DataFrame]]:
+        """
+        Same as merge_sources, served from the cache when the inputs are unchanged.
+        """
+        # merge_sources only merges when a child view and both stations are given
+        with_child = (child_map is not None or child_section is not None) and bool(
+            parent_station and child_station
+        )
+        junction = (str(parent_station), str(child_station)) if with_child else None
+
+        merged_map = self._view(
+            "map", parent_map, child_map if with_child else None, junction, None
+        )
+        merged_section = self._view(
+            "section",
+            parent_section,
+            child_section if with_child else None,
+            junction,
+            section_protocol if with_child else None,
+        )
+        return merged_map, merged_section
+
+    def clear(self) -> None:
+        self._views.clear()
+
+    def _view(
+        self,
+        view: str,
+        parent: Optional[SurveySource],
+        child: Optional[SurveySource],
+        junction: Optional[Tuple[str, str]],
+        section_protocol: Optional[SectionProtocol],
+    ) -> Optional[pd.DataFrame]:
+        parent_key, parent_data = _read_source(parent)
+        child_key, child_data = _read_source(child)
+        key = (view, parent_key, child_key, junction, section_protocol)
+        if key in self._views:
+            self.hits += 1
+            self._views.move_to_end(key)
+            return self._views[key]
+
+        self.misses += 1
+        parent, child = load_survey_df(parent_data), load_survey_df(child_data)
+        parent_station, child_station = junction or (None, None)
+        if view == "map":
+            merged, _ = merge_sources(parent, None, child, None, parent_station, child_station)
+        else:
+            _, merged = merge_sources(
+                None,
+                parent,
+                None,
+                child,
+                parent_station,
+                child_station,
+                section_protocol or SectionProtocol.SIMPLE,
+            )
+
+        self._views[key] = merged
+        while len(self._views) > self.max_entries:
+            self._views.popitem(last=False)
+        return merged
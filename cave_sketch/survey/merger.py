@@ -1,68 +1,258 @@
-import re
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Optional, Set, Tuple
+from itertools import repeat
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
+import numpy as np
 import pandas as pd
 
+from cave_sketch.survey.adjustment import MergeAdjustment, adjust_child
+from cave_sketch.survey.layout import SectionLayout
+
+# Clearance kept around a section moved by the DISPLACEMENT protocol
+DISPLACEMENT_PADDING = 50.0
 
 class SectionProtocol(Enum):
     SIMPLE = "simple"
     MIRROR = "mirror"
     DISPLACEMENT = "displacement"
 
+@dataclass
+class SurveyJunction:
+    """
+    A child survey attached to its parent survey at a shared station.
+
+    ``parent_station`` is a station of the parent survey as named in the parent's own
+    DataFrames (before any ID remapping) and ``child_station`` a station of this
+    child. Surveys attached to this child go in ``children``. Further stations
+    shared with the parent go in ``shared_stations`` as (parent, child) pairs, named
+    the same way; they are used by the RIGID and NETWORK adjustments.
+    """
+
+    parent_station: str
+    child_station: str
+    child_map: Optional[pd.DataFrame] = None
+    child_section: Optional[pd.DataFrame] = None
+    children: List["SurveyJunction"] = field(default_factory=list)
+    shared_stations: List[Tuple[str, str]] = field(default_factory=list)
+
+def _string_values(values: pd.Series) -> pd.Series:
+    """Return the entries of ``values`` that are Python strings."""
+    if pd.api.types.infer_dtype(values, skipna=False) == "string":
+        return values
+    return values[values.map(lambda v: isinstance(v, str))]
+
 def _get_numeric_ids(df: pd.DataFrame) -> Set[int]:
     """Extract numeric IDs from the Node_Id column."""
-    ids = set()
-    for nid in df["Node_Id"]:
-        if isinstance(nid, str) and re.fullmatch(r"\d+", nid):
-            ids.add(int(nid))
-        elif isinstance(nid, (int, float)) and not pd.isna(nid):
-            ids.add(int(nid))
-    return ids
+    nids = df["Node_Id"]
+    strings = _string_values(nids)
+    digits = strings[strings.str.isdecimal()].astype(np.int64)
+
+    others = nids.drop(strings.index)
+    numbers = others[others.map(lambda v: isinstance(v, (int, float)))].dropna()
+    return set(digits.tolist()) | set(numbers.astype(np.int64).tolist())
 
 def _get_mixed_prefixes(df: pd.DataFrame) -> Set[int]:
     """Extract numeric prefixes from xxPyy Node_Ids."""
-    prefixes = set()
-    for nid in df["Node_Id"]:
-        if isinstance(nid, str):
-            m = re.match(r"(\d+)P(\d+)", nid)
-            if m:
-                prefixes.add(int(m.group(1)))
-    return prefixes
+    prefixes = _string_values(df["Node_Id"]).str.extract(r"^(\d+)P\d+", expand=False)
+    return set(prefixes.dropna().astype(np.int64).tolist())
 
-def _merge_single_view(
-    parent_df: pd.DataFrame,
-    child_df: pd.DataFrame,
+def _id_offset(parent_max: Optional[int], child_ids: Set[int]) -> int:
+    """Offset moving the smallest child ID just past the largest parent ID."""
+    if not child_ids:
+        return 0
+    return (parent_max if parent_max is not None else 0) + 1 - min(child_ids)
+
+def _id_array(ids: Set[int]) -> np.ndarray:
+    return np.fromiter(ids, dtype=np.int64, count=len(ids))
+
+def _running_max(current: Optional[int], ids: Set[int]) -> Optional[int]:
+    """Largest of ``current`` and ``ids`` (None if there is neither)."""
+    if current is not None:
+        ids = ids | {current}
+    return max(ids, default=None)
+
+def _strip_float_suffix(values: pd.Series) -> pd.Series:
+    """Drop the trailing ".0" of float-formatted IDs ("12.0" -> "12")."""
+    is_float = values.str.endswith(".0").to_numpy(dtype=bool)
+    if not is_float.any():
+        return values
+    values = values.copy()
+    values[is_float] = values[is_float].str[:-2]
+    return values
+
+def _remap_ids(
+    ids: pd.Series,
+    child_station: str,
     parent_station: str,
+    child_numeric_ids: np.ndarray,
+    offset: int,
+    pref_offset: int,
+) -> pd.Series:
+    """
+    Remap child IDs into the parent's ID space.
+
+    The child junction station becomes the parent station, numeric IDs of the child
+    survey are shifted by ``offset`` and the prefix of xxPyy IDs by ``pref_offset``;
+    anything else is kept. A trailing ".0" (float-formatted IDs) is dropped first.
+
+    Args:
+        ids: String IDs to remap.
+        child_station: Child junction station.
+        parent_station: Parent junction station.
+        child_numeric_ids: Numeric Node_Ids of the child survey.
+        offset: Shift applied to the numeric IDs.
+        pref_offset: Shift applied to the xxPyy prefixes.
+
+    Returns:
+        Series of remapped IDs aligned with ``ids``.
+    """
+    ids = _strip_float_suffix(ids)
+    remapped = ids.to_numpy(dtype=object, copy=True)
+
+    # Numeric IDs: only canonical integers ("7", not "007") belong to the child's ID space
+    is_digits = ids.str.isdecimal().to_numpy(dtype=bool)
+    digits = ids[is_digits]
+    numbers = digits.astype(np.int64)
+    is_child = (numbers.astype(str) == digits) & numbers.isin(child_numeric_ids)
+    remapped[np.flatnonzero(is_digits)[is_child.to_numpy()]] = (
+        (numbers[is_child] + offset).astype(str).to_numpy()
+    )
+
+    # xxPyy IDs: shift the prefix, keep the suffix
+    others = ids[~is_digits]
+    prefix = others.str.extract(r"^(\d+)P\d+", expand=False)
+    is_mixed = prefix.notna().to_numpy()
+    if is_mixed.any():
+        suffix = others[is_mixed].str.extract(r"^\d+P(\d+)", expand=False)
+        shifted = prefix[is_mixed].astype(np.int64) + pref_offset
+        remapped[np.flatnonzero(~is_digits)[is_mixed]] = (
+            shifted.astype(str) + "P" + suffix
+        ).to_numpy()
+
+    remapped[ids.to_numpy() == child_station] = parent_station
+    return pd.Series(remapped, index=ids.index)
+
+def _split_links(links: pd.Series) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Split a Links column into a flat array of link tokens.
+
+    Returns:
+        Tuple of (has_links, tokens, counts): ``has_links`` flags the rows with links,
+        ``tokens`` holds their tokens in row order and ``counts`` the number of tokens
+        of each of those rows.
+    """
+    has_links = ~(links.isna() | links.eq("") | links.eq(0) | links.eq("-")).to_numpy(dtype=bool)
+    text = _strip_float_suffix(links[has_links].astype(str)).tolist()
+    # Splitting the "-"-joined rows yields exactly the tokens of each row, in order
+    tokens = np.array("-".join(text).split("-") if text else [], dtype=object)
+    counts = np.fromiter(map(str.count, text, repeat("-")), dtype=np.int64, count=len(text)) + 1
+    return has_links, tokens, counts
+
+def _join_links(tokens: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Inverse of _split_links: "-"-join the tokens of each row."""
+    starts = np.cumsum(counts) - counts
+    joined = tokens[starts]
+    for k in range(1, int(counts.max(initial=1))):
+        longer = counts > k
+        joined[longer] = joined[longer] + "-" + tokens[starts[longer] + k]
+    return joined
+
+# child_station, parent_station, child numeric IDs, ID offset, prefix offset
+_RemapArgs = Tuple[str, str, np.ndarray, int, int]
+
+def _remap_child_ids(
+    child_df: pd.DataFrame,
     child_station: str,
-    is_section: bool = False,
-    section_protocol: SectionProtocol = SectionProtocol.SIMPLE
+    parent_station: str,
+    child_numeric_ids: np.ndarray,
+    offset: int,
+    pref_offset: int,
 ) -> pd.DataFrame:
-    """Helper to merge a single view (map or section)."""
-    parent_df = parent_df.copy()
+    """Remap the Node_Id and Links columns of a child survey (see _remap_ids)."""
+    node_ids = child_df["Node_Id"].astype(str).to_numpy(dtype=object)
+    has_links, tokens, counts = _split_links(child_df["Links"])
+
+    # Node IDs and link tokens share one vocabulary: remap each distinct ID once
+    codes, vocab = pd.factorize(np.concatenate([node_ids, tokens]))
+    remapped = _remap_ids(
+        pd.Series(vocab, dtype=object),
+        child_station,
+        parent_station,
+        child_numeric_ids,
+        offset,
+        pref_offset,
+    ).to_numpy()[codes]
+
+    links = np.full(len(child_df), "-", dtype=object)
+    links[has_links] = _join_links(remapped[len(node_ids):], counts)
+
     child_df = child_df.copy()
+    child_df["Node_Id"] = remapped[: len(node_ids)]
+    child_df["Links"] = links
+    return child_df
 
-    # Normalize Node_Id as string
-    parent_df["Node_Id"] = parent_df["Node_Id"].astype(str)
-    child_df["Node_Id"] = child_df["Node_Id"].astype(str)
-    parent_station = str(parent_station)
-    child_station = str(child_station)
+def _join_shared_stations(
+    child_df: pd.DataFrame, remap: _RemapArgs, shared_stations: Sequence[Tuple[str, str]]
+) -> pd.DataFrame:
+    """
+    Replace the child's copies of the shared stations by the parent stations.
 
-    # 1. Coordinate translation
-    p_indices = [i for i, nid in enumerate(parent_df["Node_Id"]) if nid == parent_station]
-    c_indices = [i for i, nid in enumerate(child_df["Node_Id"]) if nid == child_station]
-    
-    if not p_indices:
-        raise ValueError(f"Station {parent_station} not found in parent survey.")
-    if not c_indices:
-        raise ValueError(f"Station {child_station} not found in child survey.")
+    The rows of the shared child stations (already remapped with ``remap``) are
+    dropped and the links pointing at them are redirected to the parent stations, so
+    the legs closing a loop end on the parent's station like the junction does.
+    """
+    if not shared_stations:
+        return child_df
+    child_ids = _remap_ids(pd.Series([c for _, c in shared_stations], dtype=object), *remap)
+    rename = dict(zip(child_ids.tolist(), [p for p, _ in shared_stations]))
 
-    p_row = parent_df.iloc[p_indices[0]]
-    c_row = child_df.iloc[c_indices[0]]
+    child_df = child_df[~child_df["Node_Id"].isin(list(rename))].reset_index(drop=True)
+    has_links, tokens, counts = _split_links(child_df["Links"])
+    links = child_df["Links"].to_numpy(dtype=object, copy=True)
+    if has_links.any():
+        renamed = pd.Series(tokens, dtype=object).map(rename)
+        tokens = np.where(renamed.isna(), tokens, renamed)
+        links[has_links] = _join_links(tokens, counts)
+    child_df["Links"] = links
+    return child_df
+
+def _layout_xy(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    X/Y of the rows that take up room on the page: all but the connector nodes, which
+    sit on the parent junction of a displaced section and would stretch its box there.
+    """
+    keep = df["Type"].to_numpy() != "connector"
+    return df["X"].to_numpy()[keep], df["Y"].to_numpy()[keep]
+
+def _place_child(
+    child_df: pd.DataFrame,
+    child_station: str,
+    parent_xy: Tuple[float, float],
+    is_section: bool,
+    section_protocol: SectionProtocol,
+    layout: Optional[SectionLayout] = None,
+) -> pd.DataFrame:
+    """
+    Move the child survey so that child_station lands on the parent station.
+
+    Args:
+        child_df: Child view, with string Node_Ids (modified in place).
+        child_station: Child junction station.
+        parent_xy: Coordinates of the parent junction station.
+        is_section: Whether this is the section view.
+        section_protocol: Protocol to use for the section view.
+        layout: Area already occupied on the page (required by DISPLACEMENT).
+
+    Returns:
+        The translated child view (with a connector node for DISPLACEMENT).
+    """
+    p_x, p_y = parent_xy
+    c_row = child_df.iloc[np.flatnonzero(child_df["Node_Id"].to_numpy() == child_station)[0]]
 
     # Simple translation: align child_station to parent_station
-    delta_x = p_row["X"] - c_row["X"]
-    delta_y = p_row["Y"] - c_row["Y"]
+    delta_x = p_x - c_row["X"]
+    delta_y = p_y - c_row["Y"]
     
     # Apply protocol-specific transformations before translation if needed (e.g. MIRROR)
     # MIRROR: "mirror the child sketch across the vertical axis (y-axis) before being placed"
@@ -71,23 +261,16 @@ def _merge_single_view(
         # Mirror child across its own vertical axis through child_station
         child_df["X"] = 2 * c_row["X"] - child_df["X"]
         # Recalculate delta_x after mirroring (c_row["X"] stays same, but child_df["X"] changed)
-        delta_x = p_row["X"] - c_row["X"]
+        delta_x = p_x - c_row["X"]
 
     if is_section and section_protocol == SectionProtocol.DISPLACEMENT:
-        # Displacement algorithm: search right first, then below
-        p_max_x = parent_df["X"].max()
-        padding = 50.0 # Better padding for displacement
-        
-        # Start by centering child at parent station
-        delta_x = p_row["X"] - c_row["X"]
-        delta_y = p_row["Y"] - c_row["Y"]
-        
-        # Shift child to the right of parent survey
-        # child_df["X"] + delta_x is the position if SIMPLE. 
-        # We want (child_df["X"] + delta_x).min() > p_max_x + padding
-        current_child_min_x = child_df["X"].min() + delta_x
-        additional_shift_x = max(0, (p_max_x + padding) - current_child_min_x)
-        delta_x += additional_shift_x
+        if layout is None:
+            raise ValueError("DISPLACEMENT placement requires the layout of the parent.")
+        # Starting from the child centered at the parent station, move it to the
+        # nearest slot (right, below or in a gap of the page) clear of placed sections
+        delta_x, delta_y = layout.find_slot(
+            *_layout_xy(child_df), delta_x, delta_y, DISPLACEMENT_PADDING
+        )
         
         # Add connector node to child_df
         # This node is at the parent station's absolute coordinates
@@ -96,8 +279,8 @@ def _merge_single_view(
         connector_id = "CONN_1"
         connector_node = pd.DataFrame({
             "Node_Id": [connector_id],
-            "X": [p_row["X"] - delta_x],
-            "Y": [p_row["Y"] - delta_y],
+            "X": [p_x - delta_x],
+            "Y": [p_y - delta_y],
             "Links": [child_station],
             "Type": ["connector"]
         })
@@ -106,62 +289,109 @@ def _merge_single_view(
     child_df["X"] = child_df["X"] + delta_x
     child_df["Y"] = child_df["Y"] + delta_y
 
+    return child_df
+
+def _shared_pairs(
+    shared_stations: Sequence[Tuple[str, str]], child_station: str
+) -> List[Tuple[str, str]]:
+    """Shared (parent, child) station pairs as strings, without the junction itself."""
+    pairs = [(str(p), str(c)) for p, c in shared_stations]
+    return [(p, c) for p, c in pairs if c != child_station]
+
+def _fit_child(
+    child_df: pd.DataFrame,
+    parent_coords: Dict[str, Tuple[float, float]],
+    parent_station: str,
+    child_station: str,
+    shared_stations: Sequence[Tuple[str, str]],
+    adjustment: MergeAdjustment,
+) -> pd.DataFrame:
+    """
+    Fit the child onto the junction and the other shared stations (RIGID / NETWORK).
+
+    Args:
+        child_df: Child view, with string Node_Ids (modified in place).
+        parent_coords: First coordinates of every parent station, by merged ID.
+        parent_station: Parent junction station.
+        child_station: Child junction station.
+        shared_stations: Further (parent station, child station) pairs, as strings.
+        adjustment: Adjustment to apply.
+
+    Returns:
+        The child view in parent coordinates.
+    """
+    pairs = [(parent_station, child_station), *shared_stations]
+    child_ids = set(child_df["Node_Id"])
+    for p, c in pairs:
+        if p not in parent_coords:
+            raise ValueError(f"Station {p} not found in parent survey.")
+        if c not in child_ids:
+            raise ValueError(f"Station {c} not found in child survey.")
+    parent_xy = np.array([parent_coords[p] for p, _ in pairs], dtype=np.float64)
+    return adjust_child(child_df, [c for _, c in pairs], parent_xy, adjustment)
+
+def _merge_single_view(
+    parent_df: pd.DataFrame,
+    child_df: pd.DataFrame,
+    parent_station: str,
+    child_station: str,
+    is_section: bool = False,
+    section_protocol: SectionProtocol = SectionProtocol.SIMPLE,
+    shared_stations: Sequence[Tuple[str, str]] = (),
+    adjustment: MergeAdjustment = MergeAdjustment.TRANSLATION,
+) -> pd.DataFrame:
+    """Helper to merge a single view (map or section)."""
+    parent_df = parent_df.copy()
+    child_df = child_df.copy()
+
+    # Normalize Node_Id as string
+    parent_df["Node_Id"] = parent_df["Node_Id"].astype(str)
+    child_df["Node_Id"] = child_df["Node_Id"].astype(str)
+    parent_station = str(parent_station)
+    child_station = str(child_station)
+
+    # 1. Coordinate translation
+    p_indices = np.flatnonzero(parent_df["Node_Id"].to_numpy() == parent_station)
+    c_indices = np.flatnonzero(child_df["Node_Id"].to_numpy() == child_station)
+    
+    if not len(p_indices):
+        raise ValueError(f"Station {parent_station} not found in parent survey.")
+    if not len(c_indices):
+        raise ValueError(f"Station {child_station} not found in child survey.")
+
+    p_row = parent_df.iloc[p_indices[0]]
+    fitted = not is_section and adjustment != MergeAdjustment.TRANSLATION
+    shared = _shared_pairs(shared_stations, child_station) if fitted else []
+    if fitted:
+        child_df = _fit_child(
+            child_df, _first_coords(parent_df), parent_station, child_station,
+            shared, adjustment,
+        )
+    else:
+        layout = None
+        if is_section and section_protocol == SectionProtocol.DISPLACEMENT:
+            layout = SectionLayout()
+            layout.add(*_layout_xy(parent_df))
+        child_df = _place_child(
+            child_df, child_station, (p_row["X"], p_row["Y"]), is_section, section_protocol, layout
+        )
+
     # 2. ID Remapping
-    parent_numeric_ids = _get_numeric_ids(parent_df)
     child_numeric_ids = _get_numeric_ids(child_df)
-    
-    mapping: Dict[str, str] = {child_station: parent_station}
-    
-    pref_offset = 0
-    if child_numeric_ids:
-        max_parent = max(parent_numeric_ids) if parent_numeric_ids else 0
-        min_child = min(child_numeric_ids)
-        offset = max_parent + 1 - min_child
-        
-        for cid in child_numeric_ids:
-            cid_str = str(cid)
-            if cid_str != child_station:
-                mapping[cid_str] = str(cid + offset)
+    offset = _id_offset(max(_get_numeric_ids(parent_df), default=None), child_numeric_ids)
 
     # Mixed IDs (xxPyy) remapping
-    parent_prefixes = _get_mixed_prefixes(parent_df)
-    child_prefixes = _get_mixed_prefixes(child_df)
-    
-    if child_prefixes:
-        max_p_pref = max(parent_prefixes) if parent_prefixes else 0
-        min_c_pref = min(child_prefixes)
-        pref_offset = max_p_pref + 1 - min_c_pref
-
-    def remap_id(nid) -> str:
-        nid_str = str(nid)
-        if nid_str.endswith(".0"):
-            nid_str = nid_str[:-2]
-        if nid_str in mapping:
-            return mapping[nid_str]
-        m = re.match(r"(\d+)P(\d+)", nid_str)
-        if m:
-            base, suffix = int(m.group(1)), m.group(2)
-            new_base = base + pref_offset
-            return f"{new_base}P{suffix}"
-        return nid_str
+    pref_offset = _id_offset(
+        max(_get_mixed_prefixes(parent_df), default=None), _get_mixed_prefixes(child_df)
+    )
 
     # Remove coincident node from child AFTER computing mapping/offset
-    not_coincident_indices = [
-        i for i, nid in enumerate(child_df["Node_Id"]) if str(nid) != child_station
-    ]
-    child_df = child_df.iloc[not_coincident_indices].reset_index(drop=True)
-    
-    child_df["Node_Id"] = child_df["Node_Id"].apply(remap_id)
-    
-    def remap_links(link_val) -> str:
-        if pd.isna(link_val) or not link_val or link_val == "-":
-            return "-"
-        link_str = str(link_val)
-        if link_str.endswith(".0"):
-            link_str = link_str[:-2]
-        return "-".join(remap_id(link) for link in link_str.split("-"))
-    
-    child_df["Links"] = child_df["Links"].apply(remap_links)
+    child_df = child_df[child_df["Node_Id"] != child_station].reset_index(drop=True)
+    remap: _RemapArgs = (
+        child_station, parent_station, _id_array(child_numeric_ids), offset, pref_offset
+    )
+    child_df = _remap_child_ids(child_df, *remap)
+    child_df = _join_shared_stations(child_df, remap, shared)
 
     return pd.concat([parent_df, child_df], ignore_index=True)
 
@@ -172,10 +402,20 @@ def merge_surveys(
     child_section: Optional[pd.DataFrame],
     parent_station: str,
     child_station: str,
-    section_protocol: SectionProtocol = SectionProtocol.SIMPLE
+    section_protocol: SectionProtocol = SectionProtocol.SIMPLE,
+    shared_stations: Sequence[Tuple[str, str]] = (),
+    adjustment: MergeAdjustment = MergeAdjustment.TRANSLATION,
 ) -> Tuple[Optional[pd.DataFrame], Optional[pd.DataFrame]]:
     """
     Merge two cave surveys (parent and child) into a single survey.
+
+    By default the child map is translated so that child_station lands on
+    parent_station. When the surveys share more stations (a loop closed by the child
+    trip), list them in ``shared_stations`` and pick an ``adjustment``: RIGID fits
+    the least-squares rotation and translation over all shared stations, NETWORK
+    additionally distributes the remaining misclosures along the child's legs so
+    that every shared station coincides with its parent. Adjustments only apply to
+    the map view; the section view is always placed with ``section_protocol``.
     
     Args:
         parent_map: DataFrame for parent map view
@@ -185,6 +425,8 @@ def merge_surveys(
         parent_station: Station ID in parent survey to match
         child_station: Station ID in child survey to match
         section_protocol: Protocol to use for merging section view
+        shared_stations: Further (parent station, child station) pairs of the map
+        adjustment: How the child map is fitted onto the shared stations
         
     Returns:
         Tuple of (merged_map, merged_section) DataFrames
@@ -192,7 +434,8 @@ def merge_surveys(
     merged_map = None
     if parent_map is not None and child_map is not None:
         merged_map = _merge_single_view(
-            parent_map, child_map, parent_station, child_station
+            parent_map, child_map, parent_station, child_station,
+            shared_stations=shared_stations, adjustment=adjustment
         )
     elif parent_map is not None:
         merged_map = parent_map.copy()
@@ -214,3 +457,136 @@ def merge_surveys(
         merged_section = child_section.copy()
         
     return merged_map, merged_section
+
+def _first_coords(df: pd.DataFrame) -> Dict[str, Tuple[float, float]]:
+    """Map each Node_Id to the coordinates of its first occurrence in ``df``."""
+    ids = df["Node_Id"].to_numpy()[::-1]
+    return dict(zip(ids, zip(df["X"].to_numpy()[::-1], df["Y"].to_numpy()[::-1])))
+
+def _merge_view_tree(
+    root_df: pd.DataFrame,
+    junctions: Sequence[SurveyJunction],
+    view: str,
+    section_protocol: SectionProtocol,
+    adjustment: MergeAdjustment = MergeAdjustment.TRANSLATION,
+) -> pd.DataFrame:
+    """
+    Merge the ``view`` ("child_map" or "child_section") of a junction tree into root_df.
+
+    Children are merged in depth-first order against running state (first coordinates
+    of every station, area occupied on the page, largest numeric ID and xxPyy prefix)
+    instead of the growing merged DataFrame, which is concatenated once at the end.
+    """
+    is_section = view == "child_section"
+    root_df = root_df.copy()
+    root_df["Node_Id"] = root_df["Node_Id"].astype(str)
+
+    frames = [root_df]
+    coords = _first_coords(root_df)
+    layout = None
+    if is_section and section_protocol == SectionProtocol.DISPLACEMENT:
+        layout = SectionLayout()
+        layout.add(*_layout_xy(root_df))
+    max_id = max(_get_numeric_ids(root_df), default=None)
+    max_prefix = max(_get_mixed_prefixes(root_df), default=None)
+
+    # (junction, _remap_ids arguments of its parent survey; None for the root)
+    stack: List[Tuple[SurveyJunction, Optional[_RemapArgs]]] = [
+        (junction, None) for junction in reversed(junctions)
+    ]
+    while stack:
+        junction, parent_remap = stack.pop()
+        child_df = getattr(junction, view)
+        if child_df is None:
+            continue
+
+        child_station = str(junction.child_station)
+        fitted = not is_section and adjustment != MergeAdjustment.TRANSLATION
+        shared = _shared_pairs(junction.shared_stations, child_station) if fitted else []
+        parent_ids = pd.Series([str(junction.parent_station)] + [p for p, _ in shared])
+        if parent_remap is not None:
+            parent_ids = _remap_ids(parent_ids, *parent_remap)
+        parent_station = parent_ids.iloc[0]
+        shared = list(zip(parent_ids.iloc[1:], (c for _, c in shared)))
+        if parent_station not in coords:
+            raise ValueError(f"Station {parent_station} not found in parent survey.")
+
+        child_df = child_df.copy()
+        child_df["Node_Id"] = child_df["Node_Id"].astype(str)
+        if not (child_df["Node_Id"] == child_station).any():
+            raise ValueError(f"Station {child_station} not found in child survey.")
+        if fitted:
+            child_df = _fit_child(
+                child_df, coords, parent_station, child_station, shared, adjustment
+            )
+        else:
+            child_df = _place_child(
+                child_df, child_station, coords[parent_station], is_section, section_protocol,
+                layout,
+            )
+
+        child_numeric_ids = _get_numeric_ids(child_df)
+        remap: _RemapArgs = (
+            child_station,
+            parent_station,
+            _id_array(child_numeric_ids),
+            _id_offset(max_id, child_numeric_ids),
+            _id_offset(max_prefix, _get_mixed_prefixes(child_df)),
+        )
+        child_df = child_df[child_df["Node_Id"] != child_station].reset_index(drop=True)
+        child_df = _remap_child_ids(child_df, *remap)
+        child_df = _join_shared_stations(child_df, remap, shared)
+
+        frames.append(child_df)
+        child_coords = _first_coords(child_df)
+        for station in child_coords.keys() - coords.keys():
+            coords[station] = child_coords[station]
+        if layout is not None:
+            layout.add(*_layout_xy(child_df))
+        max_id = _running_max(max_id, _get_numeric_ids(child_df))
+        max_prefix = _running_max(max_prefix, _get_mixed_prefixes(child_df))
+
+        stack.extend((grandchild, remap) for grandchild in reversed(junction.children))
+
+    return pd.concat(frames, ignore_index=True)
+
+def merge_many(
+    parent_map: Optional[pd.DataFrame],
+    parent_section: Optional[pd.DataFrame],
+    junctions: Sequence[SurveyJunction],
+    section_protocol: SectionProtocol = SectionProtocol.SIMPLE,
+    adjustment: MergeAdjustment = MergeAdjustment.TRANSLATION,
+) -> Tuple[Optional[pd.DataFrame], Optional[pd.DataFrame]]:
+    """
+    Merge a tree of child surveys into a parent survey in one pass.
+
+    The result is the same as chaining merge_surveys over the junctions in depth-first
+    order (with each parent_station translated to its merged ID), but every child is
+    remapped and placed exactly once and the merged views are concatenated once, so the
+    cost grows linearly with the number of surveys instead of quadratically.
+
+    Args:
+        parent_map: DataFrame for the root survey map view
+        parent_section: DataFrame for the root survey section view
+        junctions: Child surveys attached to the root survey (each with its own children)
+        section_protocol: Protocol to use for merging section view
+        adjustment: How each child map is fitted onto its shared stations
+
+    Returns:
+        Tuple of (merged_map, merged_section) DataFrames; a view is None if the root
+        survey does not have it. Children without a view are skipped in that view,
+        together with the surveys attached to them.
+    """
+    merged_map = None
+    if parent_map is not None:
+        merged_map = _merge_view_tree(
+            parent_map, junctions, "child_map", section_protocol, adjustment
+        )
+
+    merged_section = None
+    if parent_section is not None:
+        merged_section = _merge_view_tree(
+            parent_section, junctions, "child_section", section_protocol
+        )
+
+    return merged_map, merged_section
@@ -1,10 +1,69 @@
-import math
-import re
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 
+def _numeric_station_mask(df: pd.DataFrame) -> np.ndarray:
+    """Boolean mask of the rows whose Node_Id is numeric-only (survey stations)."""
+    return df["Node_Id"].astype(str).str.fullmatch(r"\d+").to_numpy(dtype=bool)
+
+
+def _station_links(df: pd.DataFrame) -> Tuple[pd.DataFrame, np.ndarray, np.ndarray]:
+    """
+    Extract the numeric stations of a survey DataFrame and their declared links.
+
+    Returns:
+        Tuple of (coords, src, dst): ``coords`` holds the float X/Y of every numeric
+        station indexed by ID (the last occurrence of an ID wins), ``src``/``dst`` are
+        the station ID and link token of every non-empty Links entry.
+    """
+    is_station = _numeric_station_mask(df)
+    stations = df.loc[is_station]
+    station_ids = stations["Node_Id"].astype(str)
+
+    coords = pd.DataFrame(
+        {"X": stations["X"].astype(float).to_numpy(), "Y": stations["Y"].astype(float).to_numpy()},
+        index=station_ids.to_numpy(),
+    )
+    coords = coords[~coords.index.duplicated(keep="last")]
+
+    if "Links" not in df.columns or stations.empty:
+        empty = np.empty(0, dtype=str)
+        return coords, empty, empty
+
+    # One row per (station, link) pair
+    links = stations["Links"].astype(str).str.split("-").explode().str.strip()
+    links = links[links != ""]
+    src = station_ids.loc[links.index].to_numpy(dtype=str)
+    dst = links.to_numpy(dtype=str)
+    return coords, src, dst
+
+
+def _station_legs(df: pd.DataFrame) -> Tuple[pd.DataFrame, np.ndarray]:
+    """
+    Extract the numeric stations of a survey DataFrame and the legs between them.
+
+    Returns:
+        Tuple of (coords, legs): ``coords`` as returned by _station_links and ``legs``,
+        an (M, 2) array of row positions into ``coords``, one row per undirected leg.
+    """
+    coords, src, dst = _station_links(df)
+
+    # Legs between two known numeric stations, as integer codes into coords
+    src_code = coords.index.get_indexer(src)
+    dst_code = coords.index.get_indexer(dst)
+    is_leg = (src_code >= 0) & (dst_code >= 0) & (src_code != dst_code)
+    low = np.minimum(src_code[is_leg], dst_code[is_leg]).astype(np.int64)
+    high = np.maximum(src_code[is_leg], dst_code[is_leg]).astype(np.int64)
+
+    # Count A->B and B->A once: hash-deduplicate canonical (min, max) pairs
+    pair = pd.unique(low * len(coords) + high)
+    legs = np.column_stack(np.divmod(pair, max(len(coords), 1)))
+    return coords, legs
+
+
 def compute_total_length(df: pd.DataFrame) -> float:
     """
     Compute the total surveyed length from the plan (map) view DataFrame.
@@ -14,43 +73,13 @@ def compute_total_length(df: pd.DataFrame) -> float:
     if df is None or df.empty:
         return 0.0
 
-    # Pattern for numeric-only stations
-    numeric_pattern = re.compile(r"^\d+$")
-
-    # Mapping of numeric station ID to coordinates (X, Y)
-    coords = {}
-    for _, row in df.iterrows():
-        node_id = str(row["Node_Id"])
-        if numeric_pattern.match(node_id):
-            coords[node_id] = (float(row["X"]), float(row["Y"]))
-
-    # Parse and deduplicate legs
-    legs = set()
-    for _, row in df.iterrows():
-        node_id = str(row["Node_Id"])
-        if not numeric_pattern.match(node_id):
-            continue
-
-        links_str = row.get("Links")
-        if pd.isna(links_str) or not links_str or links_str == "-":
-            continue
-
-        # Split and filter to numeric links
-        links = [link.strip() for link in str(links_str).split("-") if link.strip()]
-        for link in links:
-            if numeric_pattern.match(link) and link in coords:
-                # Store as a sorted tuple to prevent counting A->B and B->A twice
-                leg = tuple(sorted([node_id, link]))
-                legs.add(leg)
-
-    # Sum distances
-    total_length = 0.0
-    for u, v in legs:
-        xu, yu = coords[u]
-        xv, yv = coords[v]
-        total_length += math.sqrt((xu - xv) ** 2 + (yu - yv) ** 2)
-
-    return total_length
+    coords, legs = _station_legs(df)
+    if not len(legs):
+        return 0.0
+
+    xy = coords.to_numpy()
+    delta = xy[legs[:, 0]] - xy[legs[:, 1]]
+    return float(np.hypot(delta[:, 0], delta[:, 1]).sum())
 
 
 def compute_total_depth(df: Optional[pd.DataFrame]) -> Optional[float]:
@@ -64,17 +93,172 @@ def compute_total_depth(df: Optional[pd.DataFrame]) -> Optional[float]:
     if df.empty:
         return 0.0
 
-    # Pattern for numeric-only stations
-    numeric_pattern = re.compile(r"^\d+$")
+    y_coords = df.loc[_numeric_station_mask(df), "Y"].astype(float)
+    if y_coords.empty:
+        return 0.0
 
-    # Collect Y coordinates for numeric-only stations
-    y_coords = []
-    for _, row in df.iterrows():
-        node_id = str(row["Node_Id"])
-        if numeric_pattern.match(node_id):
-            y_coords.append(float(row["Y"]))
+    return float(y_coords.max() - y_coords.min())
 
-    if not y_coords:
-        return 0.0
 
-    return max(y_coords) - min(y_coords)
+@dataclass
+class BranchStats:
+    """
+    Totals of one branch: a run of legs between two junctions or dead ends.
+
+    ``start``/``end`` are the junction or dead-end stations bounding the branch; both
+    are None for a closed loop without junctions.
+    """
+
+    start: Optional[str]
+    end: Optional[str]
+    n_legs: int
+    length: float
+    horizontal_length: float
+
+
+@dataclass
+class SurveyStats:
+    """
+    Statistics of the station graph of a survey.
+
+    ``length`` is the 3D length of the legs, using the section view Y of each station
+    as its elevation; legs whose stations are missing from the section view only
+    contribute their horizontal length. ``n_loops`` is the cyclomatic number of the
+    station graph (independent loops).
+    """
+
+    length: float = 0.0
+    horizontal_length: float = 0.0
+    vertical_length: float = 0.0
+    depth: Optional[float] = None
+    n_stations: int = 0
+    n_legs: int = 0
+    n_loops: int = 0
+    branches: List[BranchStats] = field(default_factory=list)
+
+
+def _union_find(n: int, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Connected component root of each of ``n`` elements joined by the pairs (a, b)."""
+    parent = list(range(n))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j in zip(a.tolist(), b.tolist()):
+        ri, rj = find(i), find(j)
+        if ri != rj:
+            parent[max(ri, rj)] = min(ri, rj)
+    return np.fromiter((find(i) for i in range(n)), dtype=np.int64, count=n)
+
+
+def _branch_stats(
+    ids: np.ndarray, legs: np.ndarray, length: np.ndarray, horizontal: np.ndarray
+) -> List[BranchStats]:
+    """Split the legs into branches at stations whose degree is not 2 and total them."""
+    n_legs = len(legs)
+    if not n_legs:
+        return []
+
+    ends = legs.ravel()  # leg k has ends 2k and 2k + 1
+    leg_of_end = np.repeat(np.arange(n_legs), 2)
+    degree = np.bincount(ends, minlength=len(ids))
+
+    # Two legs meeting at a station of degree 2 belong to the same branch
+    first_leg = np.full(len(ids), -1, dtype=np.int64)
+    last_leg = np.full(len(ids), -1, dtype=np.int64)
+    first_leg[ends[::-1]] = leg_of_end[::-1]
+    last_leg[ends] = leg_of_end
+    through = np.flatnonzero(degree == 2)
+    roots = _union_find(n_legs, first_leg[through], last_leg[through])
+
+    # Number the branches in order of their first leg
+    _, first, label = np.unique(roots, return_index=True, return_inverse=True)
+    order = np.argsort(first)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    label = rank[label]
+    n_branches = len(order)
+
+    # Junction / dead-end stations touched by each branch give its start and end
+    is_bound = degree[ends] != 2
+    bound_branch, bound_node = label[leg_of_end[is_bound]], ends[is_bound]
+    start = np.full(n_branches, -1, dtype=np.int64)
+    end = np.full(n_branches, -1, dtype=np.int64)
+    start[bound_branch[::-1]] = bound_node[::-1]
+    end[bound_branch] = bound_node
+
+    counts = np.bincount(label, minlength=n_branches)
+    lengths = np.bincount(label, weights=length, minlength=n_branches)
+    horizontals = np.bincount(label, weights=horizontal, minlength=n_branches)
+    return [
+        BranchStats(
+            start=str(ids[s]) if s >= 0 else None,
+            end=str(ids[e]) if e >= 0 else None,
+            n_legs=int(c),
+            length=float(total),
+            horizontal_length=float(h),
+        )
+        for s, e, c, total, h in zip(
+            start.tolist(), end.tolist(), counts.tolist(), lengths.tolist(), horizontals.tolist()
+        )
+    ]
+
+
+def compute_survey_stats(
+    map_df: Optional[pd.DataFrame], section_df: Optional[pd.DataFrame] = None
+) -> SurveyStats:
+    """
+    Compute the survey statistics in a single pass over the station graph.
+
+    Legs and stations come from the plan view, elevations from the section view Y.
+    Runs in linear time in the number of legs (up to the near-constant union-find
+    factor), so it is cheap enough to run on every render.
+
+    Args:
+        map_df: Plan view DataFrame, or None.
+        section_df: Section view DataFrame, or None.
+
+    Returns:
+        SurveyStats; ``horizontal_length`` equals compute_total_length(map_df) and
+        ``depth`` equals compute_total_depth(section_df).
+    """
+    depth = compute_total_depth(section_df)
+    if map_df is None or map_df.empty:
+        return SurveyStats(depth=depth)
+
+    coords, legs = _station_legs(map_df)
+    n_stations, n_legs = len(coords), len(legs)
+
+    # Elevation of each plan station from the section view (NaN when missing)
+    z = np.full(n_stations, np.nan)
+    if section_df is not None and not section_df.empty:
+        section = section_df.loc[_numeric_station_mask(section_df)]
+        elevation = pd.Series(
+            section["Y"].astype(float).to_numpy(), index=section["Node_Id"].astype(str).to_numpy()
+        )
+        elevation = elevation[~elevation.index.duplicated(keep="last")]
+        z = elevation.reindex(coords.index).to_numpy(dtype=float)
+
+    xy = coords.to_numpy()
+    a, b = legs[:, 0], legs[:, 1]
+    horizontal = np.hypot(xy[a, 0] - xy[b, 0], xy[a, 1] - xy[b, 1])
+    vertical = np.nan_to_num(np.abs(z[a] - z[b]), nan=0.0)
+    length = np.hypot(horizontal, vertical)
+
+    # Cyclomatic number: legs - stations + connected components
+    n_components = len(np.unique(_union_find(n_stations, a, b)))
+
+    return SurveyStats(
+        length=float(length.sum()),
+        horizontal_length=float(horizontal.sum()),
+        vertical_length=float(vertical.sum()),
+        depth=depth,
+        n_stations=n_stations,
+        n_legs=n_legs,
+        n_loops=n_legs - n_stations + n_components,
+        branches=_branch_stats(coords.index.to_numpy(), legs, length, horizontal),
+    )
+
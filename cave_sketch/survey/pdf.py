@@ -1,3 +1,4 @@
+import io
 from pathlib import Path
 
 from matplotlib.backends.backend_pdf import PdfPages
@@ -18,3 +19,19 @@ def export_pdf(fig: Figure, output_path: Path) -> Path:
     with PdfPages(output_path) as pdf:
         pdf.savefig(fig)
     return output_path
+
+
+def export_pdf_bytes(fig: Figure) -> bytes:
+    """
+    Export a matplotlib figure to PDF, in memory.
+
+    Args:
+        fig: The matplotlib Figure to export.
+
+    Returns:
+        The PDF file contents, as written by export_pdf.
+    """
+    buffer = io.BytesIO()
+    with PdfPages(buffer) as pdf:
+        pdf.savefig(fig)
+    return buffer.getvalue()
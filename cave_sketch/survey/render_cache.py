@@ -0,0 +1,158 @@
+import datetime
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import matplotlib.pyplot as plt
+from matplotlib.artist import Artist
+from matplotlib.figure import Figure
+
+from cave_sketch.dxf.models import CaveSurvey
+from cave_sketch.survey.config import SurveyConfig
+from cave_sketch.survey.converters import SurveyData
+from cave_sketch.survey.graphics.title_block import draw_title_block
+from cave_sketch.survey.merge_plan import source_key
+from cave_sketch.survey.metrics import SurveyStats
+from cave_sketch.survey.pdf import export_pdf_bytes
+from cave_sketch.survey.renderer import PAGE_SIZE, draw_views
+
+# SurveyConfig fields only shown in the title block, not in the drawing
+TITLE_FIELDS = ("surveyor_name",)
+
+
+def geometry_key(config: SurveyConfig) -> Tuple[Tuple[str, object], ...]:
+    """The SurveyConfig fields that change the drawing, as a hashable tuple."""
+    return tuple(
+        (f.name, getattr(config, f.name)) for f in fields(config) if f.name not in TITLE_FIELDS
+    )
+
+
+@dataclass(eq=False)
+class _Render:
+    fig: Figure
+    title_key: Optional[Hashable] = None
+    title_artists: List[Artist] = field(default_factory=list)
+    pdf: Optional[bytes] = None
+
+
+class RenderCache:
+    """
+    Session cache of rendered survey figures.
+
+    Figures are cached under the content hashes of the map and section views, the
+    excluded nodes and the geometry fields of the SurveyConfig (everything but
+    TITLE_FIELDS). Re-rendering with an unchanged drawing reuses the figure, so
+    feature extraction, layout and drawing are skipped; when only the title block
+    inputs changed (cave name, surveyor, totals, statistics, date), only the title block is
+    redrawn. PDF bytes are kept until the figure changes.
+
+    Returned figures are shared with the cache and must not be modified or closed;
+    evicted figures are closed.
+    """
+
+    def __init__(self, max_entries: int = 4):
+        self.max_entries = max_entries
+        self._renders: "OrderedDict[Hashable, _Render]" = OrderedDict()
+        # The same entries by figure, for pdf_bytes
+        self._by_fig: Dict[Figure, _Render] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def render(
+        self,
+        survey: SurveyData,
+        config: SurveyConfig,
+        section_survey: Optional[SurveyData] = None,
+        excluded_nodes: Optional[List[str]] = None,
+        total_length: float = 0.0,
+        total_depth: Optional[float] = None,
+        title: Optional[str] = None,
+        stats: Optional[SurveyStats] = None,
+    ) -> Figure:
+        """
+        Same as render_survey, served from the cache when the drawing is unchanged.
+        """
+        if title is None:
+            title = survey.name if isinstance(survey, CaveSurvey) else ""
+
+        key = (
+            source_key(survey),
+            source_key(section_survey),
+            frozenset(excluded_nodes or ()),
+            geometry_key(config),
+        )
+        render = self._renders.get(key)
+        if render is not None:
+            self.hits += 1
+            self._renders.move_to_end(key)
+        else:
+            self.misses += 1
+            fig = plt.figure(figsize=PAGE_SIZE)
+            fig.subplots_adjust(top=0.86)
+            render = _Render(fig)
+            # Title block first, in the same drawing order as render_survey
+            self._draw_title(render, title, config, total_length, total_depth, stats)
+            draw_views(fig, survey, config, section_survey, excluded_nodes)
+            self._renders[key] = render
+            self._by_fig[fig] = render
+            while len(self._renders) > self.max_entries:
+                _, evicted = self._renders.popitem(last=False)
+                del self._by_fig[evicted.fig]
+                plt.close(evicted.fig)
+
+        self._draw_title(render, title, config, total_length, total_depth, stats)
+        return render.fig
+
+    def pdf_bytes(self, fig: Figure) -> bytes:
+        """PDF of a figure returned by render, exported once per figure state."""
+        render = self._by_fig.get(fig)
+        if render is None:
+            return export_pdf_bytes(fig)
+        if render.pdf is None:
+            render.pdf = export_pdf_bytes(fig)
+        return render.pdf
+
+    def clear(self) -> None:
+        for render in self._renders.values():
+            plt.close(render.fig)
+        self._renders.clear()
+        self._by_fig.clear()
+
+    @staticmethod
+    def _draw_title(
+        render: _Render,
+        title: str,
+        config: SurveyConfig,
+        total_length: float,
+        total_depth: Optional[float],
+        stats: Optional[SurveyStats],
+    ) -> None:
+        """Draw the title block, replacing the previous one unless it is unchanged."""
+        # The title block shows today's date
+        title_key = (
+            title,
+            config.surveyor_name,
+            total_length,
+            total_depth,
+            stats,
+            datetime.date.today(),
+        )
+        if title_key == render.title_key:
+            return
+
+        for artist in render.title_artists:
+            artist.remove()
+        fig = render.fig
+        texts, axes = list(fig.texts), list(fig.axes)
+        draw_title_block(
+            fig=fig,
+            cave_name=title,
+            surveyor_name=config.surveyor_name,
+            total_length=total_length,
+            total_depth=total_depth,
+            stats=stats,
+        )
+        render.title_artists = [t for t in fig.texts if t not in texts]
+        render.title_artists += [ax for ax in fig.axes if ax not in axes]
+        render.title_key = title_key
+        render.pdf = None
@@ -1,49 +1,74 @@
 from typing import List, Optional
 
 import matplotlib.pyplot as plt
-import pandas as pd
 from matplotlib.figure import Figure
 
 from cave_sketch.dxf.models import CaveSurvey
 from cave_sketch.survey.config import SurveyConfig
+from cave_sketch.survey.converters import SurveyData, as_survey_df
 from cave_sketch.survey.graphics.survey_plot import create_survey
 from cave_sketch.survey.graphics.title_block import draw_title_block
+from cave_sketch.survey.metrics import SurveyStats
+
+# A4 portrait, in inches
+PAGE_SIZE = (8.27, 11.69)
 
 
 def render_survey(
-    survey: CaveSurvey,
+    survey: SurveyData,
     config: SurveyConfig,
-    section_survey: Optional[CaveSurvey] = None,
+    section_survey: Optional[SurveyData] = None,
     excluded_nodes: Optional[List[str]] = None,
     total_length: float = 0.0,
     total_depth: Optional[float] = None,
+    title: Optional[str] = None,
+    stats: Optional[SurveyStats] = None,
 ) -> Figure:
     """
     Render a cave survey plot (plan and optionally section) using matplotlib.
 
+    DataFrame views are drawn directly, without converting them to CaveSurvey first.
+
     Args:
-        survey: The plan view CaveSurvey.
+        survey: The plan view, as a CaveSurvey or a survey DataFrame.
         config: Rendering configuration.
-        section_survey: Optional section view CaveSurvey.
+        section_survey: Optional section view, as a CaveSurvey or a survey DataFrame.
         excluded_nodes: List of node IDs to exclude from rendering.
         total_length: Total length of the cave survey in meters.
         total_depth: Total depth range in meters, or None.
+        title: Cave name for the title block. Defaults to the CaveSurvey name.
+        stats: Survey statistics to print in the title block, or None to omit.
 
     Returns:
         A matplotlib Figure object.
     """
+    if title is None:
+        title = survey.name if isinstance(survey, CaveSurvey) else ""
+
     # Create Fig
-    fig = plt.figure(figsize=(8.27, 11.69))
+    fig = plt.figure(figsize=PAGE_SIZE)
     fig.subplots_adjust(top=0.86)
     draw_title_block(
         fig=fig,
-        cave_name=survey.name,
+        cave_name=title,
         surveyor_name=config.surveyor_name,
         total_length=total_length,
         total_depth=total_depth,
+        stats=stats,
     )
+    draw_views(fig, survey, config, section_survey, excluded_nodes)
+    return fig
+
 
-    n_plots = 1 + (1 if section_survey else 0)
+def draw_views(
+    fig: Figure,
+    survey: SurveyData,
+    config: SurveyConfig,
+    section_survey: Optional[SurveyData],
+    excluded_nodes: Optional[List[str]],
+) -> None:
+    """Draw the section (if any) and map subplots of render_survey on ``fig``."""
+    n_plots = 1 + (1 if section_survey is not None else 0)
     index = 1
 
     # Convert config dataclass to dict for legacy create_survey
@@ -55,12 +80,15 @@ def render_survey(
         "rotation_deg": config.rotation_deg,
         "show_grid": config.show_grid,
         "show_centerline": config.show_centerline,
+        "fast_labels": config.fast_labels,
+        "lod": config.lod,
+        "free_space_placement": config.free_space_placement,
     }
 
     # 1. Section Subplot
-    if section_survey:
-        ax = plt.subplot(n_plots, 1, index)
-        section_df = _survey_to_df(section_survey)
+    if section_survey is not None:
+        ax = fig.add_subplot(n_plots, 1, index)
+        section_df = as_survey_df(section_survey)
         create_survey(
             section_df,
             rule_flag=True,
@@ -75,8 +103,8 @@ def render_survey(
         index += 1
 
     # 2. Map subplot
-    ax = plt.subplot(n_plots, 1, index)
-    map_df = _survey_to_df(survey)
+    ax = fig.add_subplot(n_plots, 1, index)
+    map_df = as_survey_df(survey)
     create_survey(
         map_df,
         rule_flag=True,
@@ -90,14 +118,3 @@ def render_survey(
     )
     title = "Pianta" if config.show_north or section_survey is not None else "Sezione"
     ax.set_title(title)
-
-    return fig
-
-
-def _survey_to_df(survey: CaveSurvey) -> pd.DataFrame:
-    """Helper to convert CaveSurvey model to DataFrame for legacy rendering."""
-    data = []
-    for p in survey.points:
-        links_str = "-".join(p.links) if p.links else "-"
-        data.append([p.id, links_str, p.x, p.y, p.point_type])
-    return pd.DataFrame(data, columns=["Node_Id", "Links", "X", "Y", "Type"])
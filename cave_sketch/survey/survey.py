@@ -1,24 +1,26 @@
 from pathlib import Path
 from typing import Dict, List, Optional
 
-import pandas as pd
 from matplotlib.figure import Figure
 
-from cave_sketch.dxf.models import CaveSurvey, SurveyPoint
 from cave_sketch.survey.config import SurveyConfig
-from cave_sketch.survey.merger import SectionProtocol, merge_surveys
-from cave_sketch.survey.metrics import compute_total_depth, compute_total_length
+from cave_sketch.survey.converters import SurveySource
+from cave_sketch.survey.merge_plan import MergePlan, merge_sources
+from cave_sketch.survey.merger import SectionProtocol
+from cave_sketch.survey.metrics import compute_survey_stats
 from cave_sketch.survey.pdf import export_pdf
+from cave_sketch.survey.render_cache import RenderCache
 from cave_sketch.survey.renderer import render_survey
+from cave_sketch.survey.tiled_pdf import export_tiled_pdf
 
 
 def draw_survey(
     title: str,
     rule_length: float,
-    csv_map_path: Optional[str] = None,
-    csv_section_path: Optional[str] = None,
-    child_csv_map_path: Optional[str] = None,
-    child_csv_section_path: Optional[str] = None,
+    csv_map_path: Optional[SurveySource] = None,
+    csv_section_path: Optional[SurveySource] = None,
+    child_csv_map_path: Optional[SurveySource] = None,
+    child_csv_section_path: Optional[SurveySource] = None,
     parent_station: Optional[str] = None,
     child_station: Optional[str] = None,
     section_protocol: SectionProtocol = SectionProtocol.SIMPLE,
@@ -26,48 +28,48 @@ def draw_survey(
     excluded_nodes: Optional[List] = None,
     surveyor_name: str = "",
     config: Dict = {},
-) -> Figure:
+    merge_plan: Optional[MergePlan] = None,
+    render_cache: Optional[RenderCache] = None,
+    print_scale: Optional[float] = None,
+) -> Optional[Figure]:
     """
     Draw a cave survey, optionally merging a child survey.
-    """
-    parent_map = pd.read_csv(csv_map_path) if csv_map_path else None
-    parent_section = pd.read_csv(csv_section_path) if csv_section_path else None
-    child_map = pd.read_csv(child_csv_map_path) if child_csv_map_path else None
-    child_section = pd.read_csv(child_csv_section_path) if child_csv_section_path else None
-
-    if (child_map is not None or child_section is not None) and parent_station and child_station:
-        merged_map, merged_section = merge_surveys(
-            parent_map=parent_map,
-            parent_section=parent_section,
-            child_map=child_map,
-            child_section=child_section,
-            parent_station=parent_station,
-            child_station=child_station,
-            section_protocol=section_protocol
-        )
-    else:
-        merged_map, merged_section = parent_map, parent_section
-
-    # Compute metrics after merge
-    total_length = compute_total_length(merged_map)
-    total_depth = compute_total_depth(merged_section)
 
-    survey = None
-    if merged_map is not None:
-        survey = _df_to_survey(merged_map, title)
+    Every survey input can be a path to a survey CSV, a survey DataFrame or a
+    CaveSurvey; in-memory inputs are merged and rendered without touching the disk.
+    With a merge_plan, merged views of unchanged inputs are reused across calls, and
+    with a render_cache so are the figure and its PDF when only the title block (or
+    nothing) changed. With a print_scale (e.g. 500 for 1:500), the PDF is a tiled
+    multi-page export at that scale; the single-page figure is then not rendered and
+    None is returned. With
+    ``config["show_stats"]``, the title block also lists the 3D and vertical length,
+    legs, loops and branches of the merged survey.
+    """
+    merge = merge_plan.merge if merge_plan is not None else merge_sources
+    merged_map, merged_section = merge(
+        csv_map_path,
+        csv_section_path,
+        child_csv_map_path,
+        child_csv_section_path,
+        parent_station,
+        child_station,
+        section_protocol,
+    )
 
-    section_survey = None
-    if merged_section is not None:
-        section_survey = _df_to_survey(merged_section, f"{title} Section")
+    # Compute metrics after merge, in one pass over the station graph
+    stats = compute_survey_stats(merged_map, merged_section)
 
-    if not survey and not section_survey:
+    if merged_map is None and merged_section is None:
         raise ValueError("At least one survey path (map or section) must be provided.")
 
+    survey, section_survey = merged_map, merged_section
+    cave_name = title
+
     # If only section is provided, use it as primary for render_survey
     show_north = config.get("show_north", True)
-    if not survey and section_survey:
-        survey = section_survey
-        section_survey = None
+    if survey is None:
+        survey, section_survey = merged_section, None
+        cave_name = f"{title} Section"
         show_north = False
 
     assert survey is not None
@@ -83,36 +85,40 @@ def draw_survey(
         show_grid=config.get("show_grid", True),
         surveyor_name=surveyor_name,
         show_centerline=config.get("show_centerline", True),
+        fast_labels=config.get("fast_labels", False),
+        lod=config.get("lod", True),
+        free_space_placement=config.get("free_space_placement", False),
     )
 
-    fig = render_survey(
+    if output_path and print_scale:
+        export_tiled_pdf(
+            survey,
+            Path(output_path),
+            scale=print_scale,
+            config=render_config,
+            section_survey=section_survey,
+            excluded_nodes=excluded_nodes,
+            title=cave_name,
+        )
+        return None
+
+    render = render_cache.render if render_cache is not None else render_survey
+    fig = render(
         survey=survey,
         config=render_config,
         section_survey=section_survey,
         excluded_nodes=excluded_nodes,
-        total_length=total_length,
-        total_depth=total_depth,
+        total_length=stats.horizontal_length,
+        total_depth=stats.depth,
+        title=cave_name,
+        stats=stats if config.get("show_stats", False) else None,
     )
 
     if output_path:
-        export_pdf(fig, Path(output_path))
+        if render_cache is not None:
+            Path(output_path).write_bytes(render_cache.pdf_bytes(fig))
+        else:
+            export_pdf(fig, Path(output_path))
 
     return fig
 
-
-def _df_to_survey(df: pd.DataFrame, name: str) -> CaveSurvey:
-    """Helper to convert a survey DataFrame back to a CaveSurvey model."""
-    survey = CaveSurvey(name=name)
-    for _, row in df.iterrows():
-        links_str = row["Links"]
-        links = [link.strip() for link in str(links_str).split("-") if link.strip() and link != "-"]
-        survey.points.append(
-            SurveyPoint(
-                id=str(row["Node_Id"]),
-                x=float(row["X"]),
-                y=float(row["Y"]),
-                point_type=str(row["Type"]),
-                links=links,
-            )
-        )
-    return survey
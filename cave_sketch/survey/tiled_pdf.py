@@ -0,0 +1,473 @@
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
+from matplotlib.patches import Rectangle
+
+from cave_sketch.backend_renders import render_to_matplotlib
+from cave_sketch.features.feature_set import FeatureSet
+from cave_sketch.features.geometry import rotate_points
+from cave_sketch.features.render_features import extract_feature_set_from_df
+from cave_sketch.features.simplify import LOD_DPI, LOD_PIXELS, simplify_feature_set
+from cave_sketch.survey.config import SurveyConfig
+from cave_sketch.survey.converters import SurveyData, as_survey_df
+from cave_sketch.survey.graphics.grid import _add_grid
+from cave_sketch.survey.graphics.survey_plot import _draw_stations
+from cave_sketch.survey.renderer import PAGE_SIZE
+
+MM_PER_INCH = 25.4
+# Page margins and height of the page header, in millimetres
+PAGE_MARGIN_MM = 10.0
+HEADER_MM = 12.0
+# Drawing shared by neighbouring tiles, in millimetres on paper
+TILE_OVERLAP_MM = 15.0
+# Printed sizes on tile pages at zero zoom, each scaled by 10**zoom: station label
+# font and marker diameter in points, label offset in millimetres, and line width
+# in points per unit of style weight
+STATION_LABEL_PT = 6.0
+STATION_MARKER_PT = 3.0
+STATION_OFFSET_MM = 1.0
+LINE_WIDTH_PT = 0.5
+
+
+@dataclass(frozen=True)
+class TileGrid:
+    """
+    Regular grid of overlapping page tiles covering a drawing.
+
+    Tile ``(row, col)`` spans ``[x0 + col * step_x, x0 + col * step_x + tile_w]``
+    horizontally and likewise vertically; rows are numbered from the top, in
+    reading order. bucket is a spatial index of the features over the tiles.
+    """
+
+    x0: float
+    y0: float
+    tile_w: float
+    tile_h: float
+    step_x: float
+    step_y: float
+    n_cols: int
+    n_rows: int
+
+    @classmethod
+    def cover(
+        cls,
+        bounds: Tuple[float, float, float, float],
+        tile_w: float,
+        tile_h: float,
+        overlap: float,
+    ) -> "TileGrid":
+        """
+        Fewest tiles of the given size covering ``bounds``, centered on them.
+
+        Args:
+            bounds: (x_min, x_max, y_min, y_max) to cover.
+            tile_w, tile_h: Tile size, in data units.
+            overlap: Width of the strip shared by neighbouring tiles, in data units.
+        """
+        x_min, x_max, y_min, y_max = bounds
+        step_x, step_y = tile_w - overlap, tile_h - overlap
+
+        def count(span: float, size: float, step: float) -> int:
+            return max(int(np.ceil((span - size) / step)) + 1, 1)
+
+        n_cols = count(x_max - x_min, tile_w, step_x)
+        n_rows = count(y_max - y_min, tile_h, step_y)
+        covered_w = (n_cols - 1) * step_x + tile_w
+        covered_h = (n_rows - 1) * step_y + tile_h
+        return cls(
+            x0=x_min - (covered_w - (x_max - x_min)) / 2,
+            y0=y_min - (covered_h - (y_max - y_min)) / 2,
+            tile_w=tile_w,
+            tile_h=tile_h,
+            step_x=step_x,
+            step_y=step_y,
+            n_cols=n_cols,
+            n_rows=n_rows,
+        )
+
+    @property
+    def n_tiles(self) -> int:
+        return self.n_cols * self.n_rows
+
+    @property
+    def extent(self) -> Tuple[float, float, float, float]:
+        """(x_min, x_max, y_min, y_max) covered by all the tiles."""
+        return (
+            self.x0,
+            self.x0 + (self.n_cols - 1) * self.step_x + self.tile_w,
+            self.y0,
+            self.y0 + (self.n_rows - 1) * self.step_y + self.tile_h,
+        )
+
+    def tile_bounds(self, tile: int) -> Tuple[float, float, float, float]:
+        """(x_min, x_max, y_min, y_max) of a tile."""
+        row, col = divmod(tile, self.n_cols)
+        x = self.x0 + col * self.step_x
+        y = self.y0 + (self.n_rows - 1 - row) * self.step_y
+        return x, x + self.tile_w, y, y + self.tile_h
+
+    def bucket(self, lo: np.ndarray, hi: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Spatial index of items over the tiles, from their bounding boxes.
+
+        Each item goes to every tile its box intersects, found from the box corners
+        in O(1) per (item, tile) pair.
+
+        Args:
+            lo: (N, 2) lower-left corners of the item boxes.
+            hi: (N, 2) upper-right corners of the item boxes.
+
+        Returns:
+            Tuple of (items, offsets): the items of tile ``t`` are
+            ``items[offsets[t]:offsets[t + 1]]``, in increasing order.
+        """
+        lo = np.asarray(lo, dtype=np.float64).reshape(-1, 2)
+        hi = np.asarray(hi, dtype=np.float64).reshape(-1, 2)
+        # Columns (and rows from the bottom) whose range meets [lo, hi]
+        col_lo = np.ceil((lo[:, 0] - self.x0 - self.tile_w) / self.step_x)
+        col_hi = np.floor((hi[:, 0] - self.x0) / self.step_x)
+        up_lo = np.ceil((lo[:, 1] - self.y0 - self.tile_h) / self.step_y)
+        up_hi = np.floor((hi[:, 1] - self.y0) / self.step_y)
+        col_lo = np.clip(np.nan_to_num(col_lo, nan=self.n_cols), 0, self.n_cols).astype(np.int64)
+        col_hi = np.clip(np.nan_to_num(col_hi, nan=-1), -1, self.n_cols - 1).astype(np.int64)
+        up_lo = np.clip(np.nan_to_num(up_lo, nan=self.n_rows), 0, self.n_rows).astype(np.int64)
+        up_hi = np.clip(np.nan_to_num(up_hi, nan=-1), -1, self.n_rows - 1).astype(np.int64)
+
+        n_cols = np.maximum(col_hi - col_lo + 1, 0)
+        counts = n_cols * np.maximum(up_hi - up_lo + 1, 0)
+        item = np.repeat(np.arange(len(lo)), counts)
+        k = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        col = col_lo[item] + k % n_cols[item]
+        row = self.n_rows - 1 - (up_lo[item] + k // n_cols[item])
+        tiles = row * self.n_cols + col
+
+        order = np.argsort(tiles, kind="stable")
+        offsets = np.zeros(self.n_tiles + 1, dtype=np.int64)
+        np.cumsum(np.bincount(tiles, minlength=self.n_tiles), out=offsets[1:])
+        return item[order], offsets
+
+
+@dataclass
+class _TiledView:
+    """A survey view prepared for tiling: features, stations and their tile buckets."""
+
+    name: str
+    features: FeatureSet
+    stations: pd.DataFrame
+    ref_scale: float
+    grid: TileGrid
+    segments: Tuple[np.ndarray, np.ndarray]
+    polygons: Tuple[np.ndarray, np.ndarray]
+    points: Tuple[np.ndarray, np.ndarray]
+    station_rows: Tuple[np.ndarray, np.ndarray]
+
+    def tile_items(self, tile: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        def take(bucket: Tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+            items, offsets = bucket
+            return items[offsets[tile] : offsets[tile + 1]]
+
+        return (
+            take(self.segments),
+            take(self.polygons),
+            take(self.points),
+            take(self.station_rows),
+        )
+
+    def non_empty_tiles(self) -> List[int]:
+        sizes = sum(
+            np.diff(offsets)
+            for _, offsets in (self.segments, self.polygons, self.points, self.station_rows)
+        )
+        return np.flatnonzero(sizes).tolist()
+
+
+def print_tolerance(scale: float) -> float:
+    """LOD tolerance, in metres, of a drawing printed at 1:scale (see lod_tolerance)."""
+    return LOD_PIXELS * MM_PER_INCH / LOD_DPI / 1000 * scale
+
+
+def _subset(
+    features: FeatureSet, segments: np.ndarray, polygons: np.ndarray, points: np.ndarray
+) -> FeatureSet:
+    """The given segments, polygons and points of a FeatureSet, keeping its styles."""
+    offsets = features.polygon_offsets
+    sizes = offsets[polygons + 1] - offsets[polygons]
+    shift = offsets[polygons] - (np.cumsum(sizes) - sizes)
+    vertex = np.arange(sizes.sum()) + np.repeat(shift, sizes)
+    new_offsets = np.zeros(len(polygons) + 1, dtype=np.int64)
+    np.cumsum(sizes, out=new_offsets[1:])
+    return replace(
+        features,
+        segments=features.segments[segments],
+        segment_styles=features.segment_styles[segments],
+        segment_labels=None,
+        segment_ends=None,
+        polygon_xy=features.polygon_xy[vertex],
+        polygon_offsets=new_offsets,
+        polygon_styles=features.polygon_styles[polygons],
+        polygon_labels=None,
+        point_xy=features.point_xy[points],
+        point_styles=features.point_styles[points],
+        point_labels=None,
+    )
+
+
+def _prepare_view(
+    name: str,
+    survey: SurveyData,
+    config: SurveyConfig,
+    excluded_nodes: List[str],
+    rotation_deg: float,
+    tile_w: float,
+    tile_h: float,
+    overlap: float,
+    scale: float,
+) -> _TiledView:
+    df = as_survey_df(survey)
+    if rotation_deg != 0 and len(df):
+        center = (float(df["X"].mean()), float(df["Y"].mean()))
+        df[["X", "Y"]] = rotate_points(df[["X", "Y"]].values, center, rotation_deg)
+
+    features = extract_feature_set_from_df(df, excluded_nodes, config.show_centerline)
+    if config.lod:
+        features = simplify_feature_set(features, print_tolerance(scale))
+    stations = df.iloc[0:0]
+    if config.show_centerline and config.show_details:
+        stations = df[(df["Type"] == "station") & (~df["Node_Id"].isin(excluded_nodes))]
+    stations = stations.reset_index(drop=True)
+
+    xy = df[["X", "Y"]].to_numpy(dtype=np.float64)
+    bounds = (
+        (float(xy[:, 0].min()), float(xy[:, 0].max()), float(xy[:, 1].min()), float(xy[:, 1].max()))
+        if len(xy)
+        else (0.0, 0.0, 0.0, 0.0)
+    )
+    grid = TileGrid.cover(bounds, tile_w, tile_h, overlap)
+
+    segments = features.segments
+    if features.n_polygons:
+        starts = features.polygon_offsets[:-1]
+        poly_lo = np.minimum.reduceat(features.polygon_xy, starts, axis=0)
+        poly_hi = np.maximum.reduceat(features.polygon_xy, starts, axis=0)
+    else:
+        poly_lo = poly_hi = np.empty((0, 2))
+    station_xy = stations[["X", "Y"]].to_numpy(dtype=np.float64)
+    return _TiledView(
+        name=name,
+        features=features,
+        stations=stations,
+        ref_scale=max(bounds[1] - bounds[0], bounds[3] - bounds[2]) or 1.0,
+        grid=grid,
+        segments=grid.bucket(segments.min(axis=1), segments.max(axis=1)),
+        polygons=grid.bucket(poly_lo, poly_hi),
+        points=grid.bucket(features.point_xy, features.point_xy),
+        station_rows=grid.bucket(station_xy, station_xy),
+    )
+
+
+def _page(page_size: Tuple[float, float], header: str, scale_text: str) -> Figure:
+    fig = Figure(figsize=page_size)
+    page_w, page_h = page_size
+    top = 1 - PAGE_MARGIN_MM / MM_PER_INCH / page_h
+    left = PAGE_MARGIN_MM / MM_PER_INCH / page_w
+    fig.text(left, top, header, fontsize=11, weight="bold", ha="left", va="top")
+    fig.text(1 - left, top, scale_text, fontsize=9, ha="right", va="top")
+    return fig
+
+
+def _drawing_axes(fig: Figure, width_in: float, height_in: float):
+    """Axes of the given size in inches, centered in the drawing area below the header."""
+    page_w, page_h = fig.get_size_inches()
+    margin = PAGE_MARGIN_MM / MM_PER_INCH
+    area_h = page_h - 2 * margin - HEADER_MM / MM_PER_INCH
+    left = (page_w - width_in) / 2
+    bottom = margin + (area_h - height_in) / 2
+    ax = fig.add_axes((left / page_w, bottom / page_h, width_in / page_w, height_in / page_h))
+    ax.set_xticks([])
+    ax.set_yticks([])
+    return ax
+
+
+def _drawing_area(page_size: Tuple[float, float]) -> Tuple[float, float]:
+    """Width and height, in inches, of the drawing area of a page."""
+    margin = PAGE_MARGIN_MM / MM_PER_INCH
+    return (
+        page_size[0] - 2 * margin,
+        page_size[1] - 2 * margin - HEADER_MM / MM_PER_INCH,
+    )
+
+
+def _index_page(
+    view: _TiledView, tiles: List[int], title: str, page_size: Tuple[float, float]
+) -> Figure:
+    """Whole view, fitted to the page, with the outline and number of every tile."""
+    grid = view.grid
+    x_min, x_max, y_min, y_max = grid.extent
+    area_w, area_h = _drawing_area(page_size)
+    inches_per_unit = min(area_w / (x_max - x_min), area_h / (y_max - y_min))
+    index_scale = 1000 / MM_PER_INCH / inches_per_unit
+
+    fig = _page(page_size, f"{title} – {view.name}: quadro d'unione", f"Scala 1:{index_scale:.0f}")
+    ax = _drawing_axes(fig, (x_max - x_min) * inches_per_unit, (y_max - y_min) * inches_per_unit)
+    features = simplify_feature_set(view.features, print_tolerance(index_scale))
+    render_to_matplotlib(features, ax, config={"ref_scale": view.ref_scale})
+    for number, tile in enumerate(tiles, start=1):
+        tx0, tx1, ty0, ty1 = grid.tile_bounds(tile)
+        ax.add_patch(
+            Rectangle((tx0, ty0), tx1 - tx0, ty1 - ty0, fill=False, edgecolor="gray", lw=0.6)
+        )
+        ax.text(
+            (tx0 + tx1) / 2,
+            (ty0 + ty1) / 2,
+            str(number),
+            fontsize=14,
+            color="gray",
+            ha="center",
+            va="center",
+            zorder=20,
+        )
+    ax.set_aspect("auto")
+    ax.set_xlim(x_min, x_max)
+    ax.set_ylim(y_min, y_max)
+    return fig
+
+
+def _tile_page(
+    view: _TiledView,
+    tile: int,
+    number: int,
+    n_pages: int,
+    title: str,
+    config: SurveyConfig,
+    scale: float,
+    page_size: Tuple[float, float],
+    inches_per_unit: float,
+) -> Figure:
+    """One tile at 1:scale, drawing only the features bucketed to it."""
+    grid = view.grid
+    row, col = divmod(tile, grid.n_cols)
+    fig = _page(
+        page_size,
+        f"{title} – {view.name} – Tavola {number}/{n_pages} (riga {row + 1}, colonna {col + 1})",
+        f"Scala 1:{scale:g}",
+    )
+    ax = _drawing_axes(fig, grid.tile_w * inches_per_unit, grid.tile_h * inches_per_unit)
+    segments, polygons, points, station_rows = view.tile_items(tile)
+
+    # Symbol sizes and line widths are fixed on paper, whatever the size of the view
+    render_to_matplotlib(
+        _subset(view.features, segments, polygons, points),
+        ax,
+        config={"line_width_pt": LINE_WIDTH_PT * 10**config.line_width_zoom},
+    )
+    _draw_stations(
+        ax,
+        view.stations.iloc[station_rows],
+        marker_size=STATION_MARKER_PT**2 * 10**config.marker_zoom,
+        text_size=STATION_LABEL_PT * 10**config.text_zoom,
+        offset=STATION_OFFSET_MM / 1000 * scale,
+        fast_labels=config.fast_labels,
+    )
+    for text in ax.texts:
+        text.set_clip_on(True)
+
+    x0, x1, y0, y1 = grid.tile_bounds(tile)
+    if config.show_grid:
+        _add_grid(ax, x0, x1, y0, y1, config.rule_length / 2)
+    # Limits match the axes size exactly, so that the drawing is at 1:scale
+    ax.set_aspect("auto")
+    ax.set_xlim(x0, x1)
+    ax.set_ylim(y0, y1)
+    return fig
+
+
+def _pages(
+    views: List[_TiledView],
+    title: str,
+    config: SurveyConfig,
+    scale: float,
+    page_size: Tuple[float, float],
+    inches_per_unit: float,
+) -> Iterator[Figure]:
+    for view in views:
+        tiles = view.non_empty_tiles()
+        yield _index_page(view, tiles, title, page_size)
+        for number, tile in enumerate(tiles, start=1):
+            yield _tile_page(
+                view, tile, number, len(tiles), title, config, scale, page_size, inches_per_unit
+            )
+
+
+def export_tiled_pdf(
+    survey: SurveyData,
+    output_path: Path,
+    scale: float = 500,
+    config: Optional[SurveyConfig] = None,
+    section_survey: Optional[SurveyData] = None,
+    excluded_nodes: Optional[List[str]] = None,
+    title: str = "",
+    overlap_mm: float = TILE_OVERLAP_MM,
+    page_size: Tuple[float, float] = PAGE_SIZE,
+) -> Path:
+    """
+    Export a survey to a multi-page PDF at a true print scale.
+
+    Every view (map, then section) is cut into overlapping page tiles at 1:scale,
+    preceded by an index page showing the whole view with the tile numbers. Only
+    the tiles holding some feature are printed, and each draws only the features
+    the TileGrid spatial index assigns to it. Pages are streamed one at a time into
+    PdfPages and discarded once written, so memory does not grow with the number
+    of pages.
+
+    Args:
+        survey: The plan view, as a CaveSurvey or a survey DataFrame (metres).
+        output_path: The filesystem path where the PDF will be saved.
+        scale: Print scale denominator, e.g. 500 for 1:500.
+        config: Rendering configuration (zooms, show_* flags, rotation, LOD).
+        section_survey: Optional section view, tiled after the plan.
+        excluded_nodes: List of node IDs to exclude from rendering.
+        title: Cave name, printed in the page headers.
+        overlap_mm: Drawing shared by neighbouring tiles, in millimetres on paper.
+        page_size: Page size in inches.
+
+    Returns:
+        The output path.
+    """
+    if config is None:
+        config = SurveyConfig()
+    excluded = list(excluded_nodes or [])
+    area_w, area_h = _drawing_area(page_size)
+    # Data units (metres) per inch of paper at 1:scale
+    units_per_inch = MM_PER_INCH / 1000 * scale
+    tile_w, tile_h = area_w * units_per_inch, area_h * units_per_inch
+    overlap = overlap_mm / 1000 * scale
+
+    views = [
+        _prepare_view(
+            "Pianta" if config.show_north or section_survey is not None else "Sezione",
+            survey,
+            config,
+            excluded,
+            config.rotation_deg,
+            tile_w,
+            tile_h,
+            overlap,
+            scale,
+        )
+    ]
+    if section_survey is not None:
+        views.append(
+            _prepare_view(
+                "Sezione", section_survey, config, excluded, 0.0, tile_w, tile_h, overlap, scale
+            )
+        )
+
+    with PdfPages(output_path) as pdf:
+        for fig in _pages(views, title, config, scale, page_size, 1 / units_per_inch):
+            pdf.savefig(fig)
+    return output_path
@@ -0,0 +1,47 @@
+import numpy as np
+
+from cave_sketch.survey.graphics import placement
+from cave_sketch.survey.graphics.placement import score_corners
+
+
+def _brute_count(x, y, x0, x1, y0, y1):
+    return int(np.sum((x >= x0) & (x <= x1) & (y >= y0) & (y <= y1)))
+
+
+def test_count_in_rects_matches_masks():
+    rng = np.random.default_rng(0)
+    # Rounded coordinates so that many points lie exactly on the rectangle bounds
+    x = np.round(rng.normal(size=3000), 1)
+    y = np.round(rng.normal(size=3000) * 5, 1)
+    rects = [(*np.sort(rng.choice(x, 2)), *np.sort(rng.choice(y, 2))) for _ in range(50)]
+    rects += [(-np.inf, np.inf, -np.inf, np.inf), (2.0, 2.0, 1.0, 1.0), (1.0, 0.0, 0.0, 10.0)]
+    expected = [_brute_count(x, y, *rect) for rect in rects]
+    assert placement._count_in_rects(x, y, rects).tolist() == expected
+    assert placement._count_in_rects(np.array([]), np.array([]), rects).tolist() == [0] * len(rects)
+
+
+def test_count_in_rects_across_chunks(monkeypatch):
+    monkeypatch.setattr(placement, "_COUNT_CHUNK", 64)
+    rng = np.random.default_rng(2)
+    x = np.round(rng.normal(size=1000), 1)
+    y = np.round(rng.normal(size=1000), 1)
+    rects = [(-1.0, 0.5, -0.3, 2.0), (0.0, 0.0, -5.0, 5.0), (1.0, -1.0, 0.0, 1.0)]
+    expected = [_brute_count(x, y, *rect) for rect in rects]
+    assert placement._count_in_rects(x, y, rects).tolist() == expected
+
+
+def test_score_corners_matches_masks():
+    rng = np.random.default_rng(1)
+    x, y = rng.random(500) * 100, rng.random(500) * 40
+    scores = score_corners(x, y, padding_x_units=5.0, padding_y_units=3.0)
+
+    x_min, x_max, y_min, y_max = x.min(), x.max(), y.min(), y.max()
+    zone_w, zone_h = (x_max - x_min) * 0.2, (y_max - y_min) * 0.2
+    bottom_left = _brute_count(x, y, x_min, x_min + zone_w, y_min, y_min + zone_h)
+    if _brute_count(x, y, x_min, x_min + 5.0, y_min, y_min + 3.0):
+        bottom_left += 1000000
+    top_right = _brute_count(x, y, x_max - zone_w, x_max, y_max - zone_h, y_max)
+    if _brute_count(x, y, x_max - 5.0, x_max, y_max - 3.0, y_max):
+        top_right += 1000000
+    assert scores["bottom-left"] == bottom_left
+    assert scores["top-right"] == top_right
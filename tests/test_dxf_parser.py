@@ -36,3 +36,51 @@ def test_parse_writes_csv(tmp_path):
     df = pd.read_csv(csv_path)
     assert len(df) == len(survey.points)
     assert set(df.columns) == {"Node_Id", "Links", "X", "Y", "Type"}
+
+
+def _station_msp(jitter: float = 0.0):
+    import ezdxf
+
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for idx, (x, y) in enumerate([(0.0, 0.0), (10.0, 0.0), (10.0, 5.0)]):
+        msp.add_text(str(idx), dxfattribs={"layer": "STATION"})
+        msp.add_line((x, y), (x + 1.0, y), dxfattribs={"layer": "STATION"})
+    msp.add_line((0.0, 0.0), (10.0 + jitter, 0.0), dxfattribs={"layer": "LEG"})
+    msp.add_line((10.0 - jitter, 0.0), (10.0, 5.0 + jitter), dxfattribs={"layer": "LEG"})
+    return msp
+
+
+def test_get_stations_exact_matching():
+    from cave_sketch.dxf.parser import _get_stations, _scan_modelspace
+
+    stations = _get_stations(_scan_modelspace(_station_msp()))
+    assert stations["0"]["links"] == "1"
+    assert stations["1"]["links"] == "0-2"
+    assert stations["2"]["links"] == "1"
+
+
+def test_get_stations_tolerance_matches_jittered_legs():
+    from cave_sketch.dxf.parser import _get_stations, _scan_modelspace
+
+    scan = _scan_modelspace(_station_msp(jitter=1e-4))
+    assert "links" not in _get_stations(scan)["2"]
+
+    stations = _get_stations(scan, tolerance=1e-3)
+    assert stations["0"]["links"] == "1"
+    assert stations["1"]["links"] == "0-2"
+    assert stations["2"]["links"] == "1"
+
+
+@pytest.mark.parametrize("fixture", ["sample.dxf", "sample_v9.dxf", "sample_v14.dxf"])
+def test_low_memory_matches_full_document(fixture):
+    dxf_path = Path("tests/fixtures") / fixture
+    full = parse_dxf(dxf_path)
+    streamed = parse_dxf(dxf_path, low_memory=True)
+
+    assert streamed == full
+
+
+def test_low_memory_missing_file():
+    with pytest.raises(FileNotFoundError):
+        parse_dxf(Path("non_existent.dxf"), low_memory=True)
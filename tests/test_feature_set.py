@@ -0,0 +1,142 @@
+import folium
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+
+from cave_sketch.backend_renders import render_to_folium, render_to_matplotlib
+from cave_sketch.features.chaining import chain_feature_segments, chain_segments_by_type
+from cave_sketch.features.feature_set import FeatureSet
+from cave_sketch.features.render_features import (
+    extract_feature_set_from_df,
+    extract_feature_set_from_json,
+    extract_features_from_df,
+)
+
+
+def _survey_df():
+    return pd.DataFrame(
+        [
+            {"Node_Id": "1", "X": 0.0, "Y": 0.0, "Links": "2", "Type": "station"},
+            {"Node_Id": "2", "X": 10.0, "Y": 0.0, "Links": "1", "Type": "station"},
+            {"Node_Id": "A", "X": 0.0, "Y": 1.0, "Links": "B", "Type": "L_wall"},
+            {"Node_Id": "B", "X": 10.0, "Y": 1.0, "Links": "A", "Type": "L_pit"},
+            {"Node_Id": "K", "X": 5.0, "Y": 5.0, "Links": "-", "Type": "BLOCK"},
+            {"Node_Id": "1P2", "X": 1.0, "Y": 0.0, "Links": "-", "Type": "A_water"},
+            {"Node_Id": "1P1", "X": 0.0, "Y": 0.0, "Links": "-", "Type": "A_water"},
+            {"Node_Id": "1P3", "X": 1.0, "Y": 1.0, "Links": "-", "Type": "A_water"},
+        ]
+    )
+
+
+def test_feature_set_from_df_arrays():
+    features = extract_feature_set_from_df(_survey_df())
+
+    assert [style.name for style in features.styles] == [
+        "station",
+        "L_wall",
+        "L_pit",
+        "BLOCK",
+        "A_water",
+    ]
+    names = features.style_values("name")
+    assert names[features.segment_styles].tolist() == ["station", "station", "L_wall", "L_pit"]
+    assert features.segment_ends.tolist() == [["1", "2"], ["2", "1"], ["A", "B"], ["B", "A"]]
+    assert features.styles[2].dash == (3, 7)
+    # Area vertices are ordered by their P suffix
+    np.testing.assert_array_equal(features.polygon_rings()[0], [[0, 0], [1, 0], [1, 1]])
+    assert names[features.polygon_styles].tolist() == ["A_water"]
+    np.testing.assert_array_equal(features.point_xy, [[5.0, 5.0]])
+    assert features.segment_labels is None
+
+
+def test_feature_set_roundtrip():
+    legacy = extract_features_from_df(_survey_df())
+    features = FeatureSet.from_features(legacy)
+
+    assert features.to_features() == legacy
+    # Styles are interned by value, without the survey Type names
+    assert len(features.styles) == 5
+
+
+def test_backends_accept_feature_set():
+    map_data = {
+        "name": "M",
+        "lines": [
+            {
+                "from": {"id": "1", "lat": 1.0, "lon": 2.0},
+                "to": {"id": "2", "lat": 3.0, "lon": 4.0},
+                "type": "L_wall",
+            },
+            {
+                "from": {"id": "2", "lat": 3.0, "lon": 4.0},
+                "to": {"id": "3", "lat": 5.0, "lon": 6.0},
+                "type": "L_wall",
+            },
+        ],
+        "nodes": {"9": {"lat": 1.0, "lon": 1.0, "type": "BLOCK"}},
+        "water_polygons": [{"polygon_id": "7", "coordinates": [[0, 0], [0, 1], [1, 1]]}],
+    }
+    features = extract_feature_set_from_json(map_data, include_points=True)
+    np.testing.assert_array_equal(features.segments[0], [[2.0, 1.0], [4.0, 3.0]])
+    assert features.point_labels == ["9"]
+    assert chain_feature_segments(features) == {"L_wall": [[[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]]}
+
+    # Both walls share style and popup: one multi-polyline
+    fmap = folium.Map()
+    render_to_folium(features, fmap, "M")
+    group = next(
+        child for child in fmap._children.values() if isinstance(child, folium.FeatureGroup)
+    )
+    kinds = [type(child).__name__ for child in group._children.values()]
+    assert kinds == ["Polygon", "PolyLine", "CircleMarker"]
+
+    fig, ax = plt.subplots()
+    render_to_matplotlib(features, ax)
+    # One PolyCollection, one LineCollection per style and one scatter per marker
+    assert len(ax.collections) == 3 and not ax.patches
+    plt.close(fig)
+
+
+def _json_line(a, b, line_type="L_wall"):
+    return {
+        "from": {"id": a, "lat": float(a), "lon": 0.0},
+        "to": {"id": b, "lat": float(b), "lon": 0.0},
+        "type": line_type,
+    }
+
+
+def test_chain_feature_segments_matches_json_chaining():
+    # A junction at 2, a duplicate leg, a self-loop, a closed loop and a second type
+    lines = [
+        _json_line("1", "2"),
+        _json_line("2", "3"),
+        _json_line("3", "2"),
+        _json_line("2", "4"),
+        _json_line("4", "5"),
+        _json_line("5", "5"),
+        _json_line("6", "7"),
+        _json_line("7", "8"),
+        _json_line("8", "6"),
+        _json_line("1", "9", "station"),
+    ]
+    features = extract_feature_set_from_json({"name": "M", "lines": lines})
+
+    chained = chain_feature_segments(features)
+
+    def canonical(polylines):
+        return sorted(min(p, p[::-1]) for p in polylines)
+
+    expected = chain_segments_by_type(lines)
+    assert chained.keys() == expected.keys()
+    for name, polylines in expected.items():
+        assert canonical(chained[name]) == canonical(polylines)
+    # 1-2, 2-3 and 2-4-5 end at the junction, plus the closed loop 6-7-8-6
+    assert len(chained["L_wall"]) == 4
+
+
+def test_feature_set_from_json_requires_line_ids():
+    line = _json_line("1", "2")
+    del line["to"]["id"]
+    with pytest.raises(KeyError):
+        extract_feature_set_from_json({"name": "M", "lines": [line]})
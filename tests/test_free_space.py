@@ -0,0 +1,57 @@
+import numpy as np
+
+from cave_sketch.survey.graphics.placement import compute_dual_layout, find_free_space
+
+
+def _square_outline(n=400, size=100.0):
+    """Points along the sides of a size x size square, leaving its inside empty."""
+    t = np.linspace(0, size, n)
+    x = np.concatenate([t, t, np.zeros(n), np.full(n, size)])
+    y = np.concatenate([np.zeros(n), np.full(n, size), t, t])
+    return x, y
+
+
+def _points_in(x, y, x0, y0, width, height):
+    return int(np.sum((x >= x0) & (x <= x0 + width) & (y >= y0) & (y <= y0 + height)))
+
+
+def test_free_space_finds_empty_inside():
+    x, y = _square_outline()
+    spot = find_free_space(x, y, 20.0, 10.0)
+    assert spot is not None
+    x0, y0 = spot
+    assert _points_in(x, y, x0, y0, 20.0, 10.0) == 0
+    # Grown to the largest empty rectangle: centered across the square, and as far
+    # from the bottom side as from the left one
+    assert abs(x0 + 10.0 - 50.0) < 2.0
+    assert y0 > 35.0
+
+
+def test_free_space_avoids_segments():
+    x, y = _square_outline()
+    # A horizontal wall across the middle of the square
+    segments = np.array([[[0.0, 50.0], [100.0, 50.0]]])
+    spot = find_free_space(x, y, 20.0, 10.0, segments=segments)
+    assert spot is not None
+    _, y0 = spot
+    assert y0 > 50.0 or y0 + 10.0 < 50.0
+
+
+def test_free_space_none_when_nothing_fits():
+    x, y = _square_outline()
+    assert find_free_space(x, y, 150.0, 10.0) is None
+
+    rng = np.random.default_rng(0)
+    x, y = rng.random(20000) * 100, rng.random(20000) * 100
+    assert find_free_space(x, y, 20.0, 20.0) is None
+
+
+def test_compute_dual_layout_free_space_avoids_expansion():
+    x, y = _square_outline()
+    _, _, expansion = compute_dual_layout(x, y, 20, 7, 100)
+    assert expansion is not None
+
+    arrow_pos, rule_pos, expansion = compute_dual_layout(x, y, 20, 7, 100, free_space=True)
+    assert expansion is None
+    assert 0 < rule_pos[0] < rule_pos[0] + 20 < 100
+    assert 0 < rule_pos[1] < arrow_pos[1] < 100
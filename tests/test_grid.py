@@ -1,9 +1,31 @@
 from unittest.mock import patch
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pytest
 
-from cave_sketch.survey.graphics.grid import _add_grid
+from cave_sketch.survey.graphics.grid import _add_grid, coarse_grid_spacing
+
+
+def _grid_lines(ax):
+    """(vertical x positions, horizontal y positions) of the grid Line2Ds of ax."""
+    grids = [
+        line for line in ax.lines
+        if line.get_color() == "lightgray" and line.get_linestyle() == ":"
+    ]
+    if not grids:
+        return [], []
+    assert len(grids) == 2, "The grid should be one vertical and one horizontal Line2D"
+    vertical, horizontal = [], []
+    for grid in grids:
+        xy = grid.get_xydata()
+        starts = np.r_[0, np.flatnonzero(np.isnan(xy).any(axis=1)) + 1]
+        for (x1, y1), (x2, y2) in zip(xy[starts], xy[starts + 1]):
+            if x1 == x2:
+                vertical.append(x1)
+            elif y1 == y2:
+                horizontal.append(y1)
+    return vertical, horizontal
 
 
 def test_add_grid_creates_lines():
@@ -12,46 +34,67 @@ def test_add_grid_creates_lines():
     # We pass data extents: x in [5, 25], y in [12, 38], and spacing = 10
     # Clean multiples of 10 in [5, 25] are 10, 20.
     # Clean multiples of 10 in [12, 38] are 20, 30.
-    _add_grid(ax, x_min=5, x_max=25, y_min=12, y_max=38, grid_spacing=10)
-    
-    # We should have vertical lines at x = 10, 20
-    # And horizontal lines at y = 20, 30
-    
-    # Matplotlib stores lines added via axvline/axhline in ax.lines
-    lines = ax.lines
-    assert len(lines) == 4, f"Expected 4 grid lines, got {len(lines)}"
-    
-    # Verify properties
-    v_lines = []
-    h_lines = []
-    for line in lines:
-        assert line.get_color() == "lightgray"
-        assert line.get_linestyle() == ":"
-        assert line.get_zorder() == 0
-        
-        # In matplotlib, axvline has xdata as [x, x] and ydata as [0, 1]
-        # (or in data coords [5, 25] if drawn differently, but typically
-        # axvline uses transform ax.get_xaxis_transform() where x is in
-        # data coords and y in axes coords).
-        # We can distinguish axvline and axhline by checking their transforms or xdata/ydata.
-        # Alternatively, we can check their properties. Let's see how they are defined.
-        # axvline sets xdata to [x, x] and ydata to [0, 1] (in axes coords).
-        # Let's inspect xdata/ydata or get_xdata()/get_ydata().
-        xdata = line.get_xdata()
-        ydata = line.get_ydata()
-        
-        # If xdata has two identical values (and not [0, 1] which is the
-        # default axes coordinate for ydata in axvline), then it is a vertical line.
-        if len(xdata) == 2 and xdata[0] == xdata[1]:
-            v_lines.append(xdata[0])
-        elif len(ydata) == 2 and ydata[0] == ydata[1]:
-            h_lines.append(ydata[0])
-            
+    grid = _add_grid(ax, x_min=5, x_max=25, y_min=12, y_max=38, grid_spacing=10)
+
+    # The vertical and the horizontal lines are one artist each, drawn behind the survey
+    assert ax.lines[:] == list(grid)
+    assert all(line.get_zorder() == 0 for line in grid)
+    # The grid does not change the limits
+    assert ax.get_xlim() == (0.0, 1.0)
+
+    v_lines, h_lines = _grid_lines(ax)
     assert sorted(v_lines) == [10.0, 20.0]
     assert sorted(h_lines) == [20.0, 30.0]
     
     plt.close(fig)
 
+
+def test_add_grid_coarsens_dense_grids():
+    fig, ax = plt.subplots()
+
+    # 2 km at 1 m spacing: doubled until at most 150 lines per axis
+    _add_grid(ax, x_min=0, x_max=2000, y_min=0, y_max=500, grid_spacing=1)
+
+    v_lines, h_lines = _grid_lines(ax)
+    assert len(v_lines) == 126 and v_lines[1] - v_lines[0] == 16
+    assert h_lines[:2] == [0.0, 16.0]
+    # The coarser cell size is written on the drawing
+    assert [text.get_text() for text in ax.texts] == ["Griglia 16 m"]
+    plt.close(fig)
+
+
+def test_coarse_grid_spacing():
+    assert coarse_grid_spacing(10, extent=100) == 10
+    assert coarse_grid_spacing(1, extent=2000) == 16
+    assert coarse_grid_spacing(1, extent=2000, max_lines=3000) == 1
+    with pytest.raises(ValueError):
+        coarse_grid_spacing(0, extent=10)
+
+
+def test_create_survey_snaps_rule_to_coarsened_grid():
+    import pandas as pd
+
+    from cave_sketch.survey.graphics import survey_plot
+
+    # 10 km survey with a 10 m rule: 5 m grid cells, coarsened to 80 m
+    df = pd.DataFrame({
+        "X": [0.0, 5000.0, 10000.0],
+        "Y": [0.0, 1500.0, 2500.0],
+        "Type": ["station"] * 3,
+        "Node_Id": ["A", "B", "C"],
+        "Links": ["B", "A-C", "B"],
+    })
+    fig, ax = plt.subplots()
+    with patch.object(survey_plot, "_add_rule", wraps=survey_plot._add_rule) as add_rule:
+        survey_plot.create_survey(
+            df=df, rule_flag=True, north_flag=False, config={}, rule_length=10, ax=ax
+        )
+    x_start = add_rule.call_args.kwargs["x_start"]
+    v_lines, _ = _grid_lines(ax)
+    assert v_lines[1] - v_lines[0] == 80
+    assert x_start % 80 == 0 and v_lines[0] <= x_start <= v_lines[-1]
+    plt.close(fig)
+
 def test_add_grid_invalid_spacing():
     fig, ax = plt.subplots()
     with pytest.raises(ValueError):
@@ -84,10 +127,8 @@ def test_create_survey_shows_grid_by_default(sample_df):
         rule_length=20,
         ax=ax
     )
-    lines = [
-        line for line in ax.lines
-        if line.get_color() == "lightgray" and line.get_linestyle() == ":"
-    ]
+    v_lines, h_lines = _grid_lines(ax)
+    lines = v_lines + h_lines
     assert len(lines) == 6, f"Expected 6 grid lines, got {len(lines)}"
     plt.close(fig)
 
@@ -103,10 +144,8 @@ def test_create_survey_no_grid_when_disabled(sample_df):
         rule_length=20,
         ax=ax
     )
-    lines = [
-        line for line in ax.lines
-        if line.get_color() == "lightgray" and line.get_linestyle() == ":"
-    ]
+    v_lines, h_lines = _grid_lines(ax)
+    lines = v_lines + h_lines
     assert len(lines) == 0, f"Expected 0 grid lines, got {len(lines)}"
     plt.close(fig)
 
@@ -122,10 +161,8 @@ def test_create_survey_grid_spacing_adapts(sample_df):
         rule_length=40,
         ax=ax
     )
-    lines = [
-        line for line in ax.lines
-        if line.get_color() == "lightgray" and line.get_linestyle() == ":"
-    ]
+    v_lines, h_lines = _grid_lines(ax)
+    lines = v_lines + h_lines
     assert len(lines) == 4, f"Expected 4 grid lines, got {len(lines)}"
     plt.close(fig)
 
@@ -0,0 +1,130 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from cave_sketch.survey import draw_survey, merge_plan
+from cave_sketch.survey.merge_plan import MergePlan
+from cave_sketch.survey.merger import SectionProtocol, merge_surveys
+
+
+def _survey(x0):
+    return pd.DataFrame(
+        {
+            "Node_Id": ["1", "2", "1P1"],
+            "X": [x0, x0 + 10.0, x0 + 1.0],
+            "Y": [0.0, -5.0, 1.0],
+            "Links": ["2", "1", "-"],
+            "Type": ["station", "station", "L_wall"],
+        }
+    )
+
+
+@pytest.fixture
+def csv_paths(tmp_path):
+    paths = {}
+    for name, x0 in (("map", 0.0), ("section", 0.0), ("child_map", 50.0), ("child_section", 50.0)):
+        paths[name] = tmp_path / f"{name}.csv"
+        _survey(x0).to_csv(paths[name], index=False)
+    return paths
+
+
+@pytest.fixture
+def merge_calls(monkeypatch):
+    calls = []
+
+    def counting_merge_surveys(**kwargs):
+        calls.append(kwargs)
+        return merge_surveys(**kwargs)
+
+    monkeypatch.setattr(merge_plan, "merge_surveys", counting_merge_surveys)
+    return calls
+
+
+def _merge(plan, paths, protocol=SectionProtocol.SIMPLE):
+    return plan.merge(
+        paths["map"],
+        paths["section"],
+        paths["child_map"],
+        paths["child_section"],
+        "2",
+        "1",
+        protocol,
+    )
+
+
+def test_merge_plan_matches_merge_surveys(csv_paths):
+    merged_map, merged_section = _merge(MergePlan(), csv_paths, SectionProtocol.DISPLACEMENT)
+    views = ("map", "section", "child_map", "child_section")
+    expected_map, expected_section = merge_surveys(
+        *(pd.read_csv(csv_paths[name]) for name in views),
+        parent_station="2",
+        child_station="1",
+        section_protocol=SectionProtocol.DISPLACEMENT,
+    )
+    pd.testing.assert_frame_equal(merged_map, expected_map)
+    pd.testing.assert_frame_equal(merged_section, expected_section)
+
+
+def test_merge_plan_reuses_unchanged_inputs(csv_paths, merge_calls):
+    plan = MergePlan()
+    first = _merge(plan, csv_paths)
+    assert len(merge_calls) == 2  # one per view
+
+    second = _merge(plan, csv_paths)
+    assert len(merge_calls) == 2
+    assert second[0] is first[0] and second[1] is first[1]
+
+    # A new protocol only re-merges the section view
+    _merge(plan, csv_paths, SectionProtocol.MIRROR)
+    assert len(merge_calls) == 3
+    assert merge_calls[-1]["child_map"] is None
+
+    # Editing a file invalidates the views built from it, whatever its path
+    child_map = _survey(50.0)
+    child_map.loc[1, "X"] = 90.0
+    child_map.to_csv(csv_paths["child_map"], index=False)
+    merged_map, _ = _merge(plan, csv_paths, SectionProtocol.MIRROR)
+    assert len(merge_calls) == 4
+    # Child station 1 lands on parent station 2 (X=10), child station 2 is 40 m further
+    assert merged_map["X"].max() == pytest.approx(50.0)
+
+
+def test_draw_survey_with_merge_plan(csv_paths, merge_calls):
+    plan = MergePlan()
+    for _ in range(2):
+        fig = draw_survey(
+            title="Plan",
+            rule_length=10,
+            csv_map_path=csv_paths["map"],
+            csv_section_path=csv_paths["section"],
+            child_csv_map_path=csv_paths["child_map"],
+            child_csv_section_path=csv_paths["child_section"],
+            parent_station="2",
+            child_station="1",
+            merge_plan=plan,
+        )
+        assert fig is not None
+    assert len(merge_calls) == 2
+    assert plan.hits == 2
+
+
+def test_merge_plan_reads_each_file_once(csv_paths, monkeypatch):
+    reads = []
+    read_bytes = Path.read_bytes
+    read_csv = pd.read_csv
+
+    def counting_read_bytes(path):
+        reads.append(path.name)
+        return read_bytes(path)
+
+    def counting_read_csv(source, *args, **kwargs):
+        reads.append(source)
+        return read_csv(source, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_bytes", counting_read_bytes)
+    monkeypatch.setattr(pd, "read_csv", counting_read_csv)
+    _merge(MergePlan(), csv_paths)
+    # Each file is read once, hashed, then parsed from the bytes already in memory
+    file_reads = [Path(read).name for read in reads if isinstance(read, (str, Path))]
+    assert sorted(file_reads) == sorted(path.name for path in csv_paths.values())
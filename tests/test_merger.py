@@ -1,8 +1,9 @@
 
 import pandas as pd
+import pytest
 
 from cave_sketch.survey import draw_survey
-from cave_sketch.survey.merger import SectionProtocol, merge_surveys
+from cave_sketch.survey.merger import SectionProtocol, SurveyJunction, merge_many, merge_surveys
 
 
 def test_merge_surveys_id_remapping():
@@ -120,6 +121,39 @@ def test_merge_surveys_mixed_ids():
     assert "2P1" in node_ids
 
 
+
+def test_merge_surveys_remaps_links_and_float_ids():
+    parent_map = pd.DataFrame({
+        "Node_Id": ["1", "2", "3P1"],
+        "X": [0.0, 10.0, 5.0],
+        "Y": [0.0, 0.0, 1.0],
+        "Links": ["2", "1", "-"],
+        "Type": ["station", "station", "L_wall"]
+    })
+
+    # Float-formatted links (as read back from CSV), NaN links and several prefixes
+    child_map = pd.DataFrame({
+        "Node_Id": ["1", "2", "3", "1P1", "2P1", "BLOCK_1"],
+        "X": [0.0, 5.0, 5.0, 1.0, 6.0, 2.0],
+        "Y": [0.0, 0.0, 5.0, 1.0, 1.0, 2.0],
+        "Links": ["2-1P1", "1.0-3", 2.0, "2P1", "1P1-", float("nan")],
+        "Type": ["station", "station", "station", "L_wall", "L_wall", "BLOCK"]
+    })
+
+    merged_map, _ = merge_surveys(
+        parent_map=parent_map,
+        parent_section=None,
+        child_map=child_map,
+        child_section=None,
+        parent_station="2",
+        child_station="1"
+    )
+
+    child_rows = merged_map.iloc[len(parent_map):]
+    # Numeric offset: 2 + 1 - 1 = 2; prefix offset: 3 + 1 - 1 = 3
+    assert child_rows["Node_Id"].tolist() == ["4", "5", "4P1", "5P1", "BLOCK_1"]
+    assert child_rows["Links"].tolist() == ["2-5", "4", "5P1", "4P1-", "-"]
+
 def test_merge_surveys_mirror_protocol():
     parent_section = pd.DataFrame({
         "Node_Id": ["1", "2"],
@@ -157,6 +191,57 @@ def test_merge_surveys_mirror_protocol():
     assert row_4["Y"] == 0.0
 
 
+
+def _trip(n_stations, x0=0.0):
+    ids = [str(i) for i in range(1, n_stations + 1)]
+    links = [
+        "-".join(str(j) for j in (i - 1, i + 1) if 1 <= j <= n_stations)
+        for i in range(1, n_stations + 1)
+    ]
+    return pd.DataFrame({
+        "Node_Id": ids + ["1P1", "1P2"],
+        "X": [x0 + 10.0 * i for i in range(n_stations)] + [x0, x0 + 5.0],
+        "Y": [float(i) for i in range(n_stations)] + [1.0, 1.0],
+        "Links": links + ["1P2", "1P1"],
+        "Type": ["station"] * n_stations + ["L_wall", "L_wall"]
+    })
+
+
+def test_merge_many_matches_chained_merges():
+    root, trip_a, trip_b, trip_c = _trip(3), _trip(3, 100.0), _trip(2, -50.0), _trip(4, 7.0)
+    # Trip B hangs off station 3 of trip A (merged as station 6)
+    junction_b = SurveyJunction("3", "1", trip_b, trip_b)
+    junctions = [
+        SurveyJunction("3", "1", trip_a, trip_a, children=[junction_b]),
+        SurveyJunction("2", "1", trip_c, trip_c),
+    ]
+
+    for protocol in SectionProtocol:
+        merged_map, merged_section = merge_many(root, root, junctions, section_protocol=protocol)
+
+        expected_map, expected_section = root, root
+        for child, parent_station in ((trip_a, "3"), (trip_b, "6"), (trip_c, "2")):
+            expected_map, expected_section = merge_surveys(
+                expected_map, expected_section, child, child, parent_station, "1", protocol
+            )
+
+        pd.testing.assert_frame_equal(merged_map, expected_map)
+        pd.testing.assert_frame_equal(merged_section, expected_section)
+
+
+def test_merge_many_missing_view_and_station():
+    root, trip = _trip(3), _trip(2)
+    merged_map, merged_section = merge_many(root, None, [SurveyJunction("2", "1", child_map=trip)])
+    assert merged_section is None
+    assert len(merged_map) == len(root) + len(trip) - 1
+
+    # A child without a section view is skipped (with its children) in the section view
+    _, merged_section = merge_many(root, root, [SurveyJunction("2", "1", child_map=trip)])
+    pd.testing.assert_frame_equal(merged_section, root)
+
+    with pytest.raises(ValueError, match="Station 9 not found in parent survey"):
+        merge_many(root, None, [SurveyJunction("9", "1", child_map=trip)])
+
 def test_draw_survey_no_child(tmp_path):
     csv_path = "tests/fixtures/test_survey.csv"
     output_pdf = tmp_path / "output.pdf"
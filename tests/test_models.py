@@ -0,0 +1,47 @@
+from pathlib import Path
+
+import pytest
+
+from cave_sketch.dxf.models import NO_LINKS, SurveyLine, SurveyPoint
+from cave_sketch.dxf.parser import parse_dxf
+from cave_sketch.geo.models import GeoPoint, GpsRef
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        SurveyPoint(id="1", x=0.0, y=0.0),
+        SurveyLine(from_id="1", to_id="2"),
+        GpsRef(station_id="1", lat=45.0, lon=11.0),
+        GeoPoint(station_id="1", lat=45.0, lon=11.0, x=0.0, y=0.0),
+    ],
+)
+def test_models_are_slotted(obj):
+    assert not hasattr(obj, "__dict__")
+
+
+def test_default_links_stay_mutable():
+    a = SurveyPoint(id="1", x=0.0, y=0.0)
+    b = SurveyPoint(id="2", x=1.0, y=1.0)
+
+    assert a.links is not b.links
+    a.links.append("2")
+    assert b.links == []
+    assert SurveyPoint(id="3", x=0.0, y=0.0, links=NO_LINKS) == SurveyPoint(id="3", x=0.0, y=0.0)
+
+
+def test_no_links_sentinel_is_read_only():
+    with pytest.raises(TypeError):
+        NO_LINKS.append("1")
+    links = NO_LINKS
+    with pytest.raises(TypeError):
+        links += ["1"]
+    assert NO_LINKS == []
+
+
+def test_parsed_blocks_use_sentinel():
+    survey = parse_dxf(Path("tests/fixtures/sample_v9.dxf"))
+    unlinked = [p for p in survey.points if not p.links]
+
+    assert unlinked
+    assert all(p.links is NO_LINKS for p in unlinked)
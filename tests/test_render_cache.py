@@ -0,0 +1,130 @@
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+
+from cave_sketch.survey import draw_survey, render_cache
+from cave_sketch.survey.config import SurveyConfig
+from cave_sketch.survey.render_cache import RenderCache
+from cave_sketch.survey.renderer import render_survey
+
+
+@pytest.fixture
+def survey_df():
+    return pd.DataFrame(
+        {
+            "Node_Id": ["1", "2", "3", "1P1"],
+            "Links": ["2", "1-3", "2", "-"],
+            "X": [0.0, 10.0, 15.0, 1.0],
+            "Y": [0.0, -5.0, 3.0, 1.0],
+            "Type": ["station", "station", "station", "L_wall"],
+        }
+    )
+
+
+@pytest.fixture
+def view_calls(monkeypatch):
+    calls = []
+    draw_views = render_cache.draw_views
+
+    def counting_draw_views(*args, **kwargs):
+        calls.append(args)
+        return draw_views(*args, **kwargs)
+
+    monkeypatch.setattr(render_cache, "draw_views", counting_draw_views)
+    return calls
+
+
+def _pixels(fig):
+    fig.canvas.draw()
+    return np.asarray(fig.canvas.buffer_rgba()).copy()
+
+
+def test_render_cache_matches_render_survey(survey_df):
+    config = SurveyConfig(rule_length=20, surveyor_name="Ada")
+    expected = render_survey(survey_df, config, total_length=12.0, title="Grotta")
+    cache = RenderCache()
+    fig = cache.render(survey_df, config, total_length=12.0, title="Grotta")
+    assert np.array_equal(_pixels(fig), _pixels(expected))
+    plt.close(expected)
+    cache.clear()
+
+
+def test_render_cache_reuses_unchanged_drawing(survey_df, view_calls):
+    cache = RenderCache()
+    config = SurveyConfig(rule_length=20)
+    fig = cache.render(survey_df, config, title="Grotta")
+    assert cache.render(survey_df.copy(), SurveyConfig(rule_length=20), title="Grotta") is fig
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert len(view_calls) == 1
+
+    # Geometry changes draw a new figure
+    assert cache.render(survey_df, SurveyConfig(rule_length=20, rotation_deg=30)) is not fig
+    assert cache.render(survey_df, config, excluded_nodes=["3"]) is not fig
+    assert len(view_calls) == 3
+    cache.clear()
+
+
+def test_render_cache_redraws_only_title_block(survey_df, view_calls):
+    cache = RenderCache()
+    fig = cache.render(survey_df, SurveyConfig(rule_length=20, surveyor_name="Ada"), title="Old")
+    n_axes = len(fig.axes)
+
+    config = SurveyConfig(rule_length=20, surveyor_name="Bea")
+    assert cache.render(survey_df, config, total_length=7.0, title="New") is fig
+    assert len(view_calls) == 1
+    assert len(fig.axes) == n_axes
+    assert [t.get_text() for t in fig.texts] == ["New"]
+    meta = [t.get_text() for ax in fig.axes for t in ax.texts if t.get_text().startswith("Ril")]
+    assert meta == ["Rilevatore: Bea"]
+
+    expected = render_survey(survey_df, config, total_length=7.0, title="New")
+    assert np.array_equal(_pixels(fig), _pixels(expected))
+    plt.close(expected)
+    cache.clear()
+
+
+def test_render_cache_reuses_pdf_bytes(survey_df, monkeypatch):
+    exports = []
+    export = render_cache.export_pdf_bytes
+    monkeypatch.setattr(
+        render_cache, "export_pdf_bytes", lambda fig: exports.append(fig) or export(fig)
+    )
+    cache = RenderCache()
+    config = SurveyConfig(rule_length=20)
+    fig = cache.render(survey_df, config, title="Grotta")
+    pdf = cache.pdf_bytes(fig)
+    assert pdf.startswith(b"%PDF")
+    assert cache.pdf_bytes(cache.render(survey_df, config, title="Grotta")) is pdf
+    assert len(exports) == 1
+
+    cache.render(survey_df, config, title="Renamed")
+    assert cache.pdf_bytes(fig) is not pdf
+    assert len(exports) == 2
+    cache.clear()
+
+
+def test_render_cache_evicts_and_closes(survey_df):
+    cache = RenderCache(max_entries=1)
+    fig = cache.render(survey_df, SurveyConfig(rule_length=20))
+    kept = cache.render(survey_df, SurveyConfig(rule_length=40))
+    assert not plt.fignum_exists(fig.number)
+    assert list(cache._by_fig) == [kept]
+    cache.clear()
+
+
+def test_draw_survey_with_render_cache(survey_df, tmp_path, view_calls):
+    cache = RenderCache()
+    output = tmp_path / "survey.pdf"
+    for surveyor in ("Ada", "Bea"):
+        fig = draw_survey(
+            title="Grotta",
+            rule_length=20,
+            csv_map_path=survey_df,
+            output_path=str(output),
+            surveyor_name=surveyor,
+            render_cache=cache,
+        )
+        assert output.read_bytes() == cache.pdf_bytes(fig)
+    assert len(view_calls) == 1
+    cache.clear()
@@ -1,6 +1,10 @@
+import numpy as np
 import pandas as pd
 
-from cave_sketch.features.render_features import extract_features_from_df
+from cave_sketch.features.render_features import (
+    extract_features_from_df,
+    extract_segments_from_df,
+)
 
 
 def test_extract_features_basic():
@@ -51,3 +55,32 @@ def test_extract_features_missing_neighbor():
     features = extract_features_from_df(df)
     # Z is missing, so no line should be generated
     assert len(features["lines"]) == 0
+
+
+def test_extract_segments_arrays():
+    df = pd.DataFrame([
+        {"Node_Id": "A", "X": 0.0, "Y": 0.0, "Links": "B", "Type": "L_wall"},
+        {"Node_Id": "B", "X": 10.0, "Y": 0.0, "Links": "A-C", "Type": "station"},
+        {"Node_Id": "C", "X": 10.0, "Y": 10.0, "Links": "B-Z", "Type": "L_wall"},
+        {"Node_Id": "A", "X": 99.0, "Y": 99.0, "Links": "-", "Type": "L_wall"},
+        {"Node_Id": "K", "X": 5.0, "Y": 5.0, "Links": "A", "Type": "BLOCK"},
+    ])
+
+    lines = extract_segments_from_df(df)
+
+    # Same segments as the dict features, in (x, y) order; the first "A" wins
+    assert lines.segments.shape == (4, 2, 2)
+    assert lines.segments[0].tolist() == [[0.0, 0.0], [10.0, 0.0]]
+    assert [lines.styles[code] for code in lines.style_ids] == [
+        "L_wall", "station", "station", "L_wall"
+    ]
+    assert lines.targets.tolist() == ["B", "A", "C", "B"]
+    by_style = lines.by_style()
+    assert set(by_style) == {"L_wall", "station"}
+    assert by_style["station"].shape == (2, 2, 2)
+
+    # Exclusions accept any iterable and drop the node and the links to it
+    lines = extract_segments_from_df(df, excluded_nodes={"C"}, show_centerline=False)
+    assert lines.source_rows.tolist() == [0]
+    np.testing.assert_array_equal(lines.segments[0], [[0.0, 0.0], [10.0, 0.0]])
+
@@ -0,0 +1,142 @@
+import numpy as np
+import pandas as pd
+
+from cave_sketch.survey.layout import SectionLayout
+from cave_sketch.survey.merger import (
+    DISPLACEMENT_PADDING,
+    SectionProtocol,
+    SurveyJunction,
+    merge_many,
+    merge_surveys,
+)
+
+
+def _line(n_stations, length, x0=0.0, y0=0.0):
+    xs = np.linspace(x0, x0 + length, n_stations)
+    ids = [str(i) for i in range(1, n_stations + 1)]
+    links = [
+        "-".join(str(j) for j in (i - 1, i + 1) if 1 <= j <= n_stations)
+        for i in range(1, n_stations + 1)
+    ]
+    return pd.DataFrame(
+        {
+            "Node_Id": ids,
+            "X": xs,
+            "Y": np.full(n_stations, y0),
+            "Links": links,
+            "Type": ["station"] * n_stations,
+        }
+    )
+
+
+def _bbox(df):
+    return df["X"].min(), df["X"].max(), df["Y"].min(), df["Y"].max()
+
+
+def _clear(a, b, padding):
+    return (
+        a[1] + padding <= b[0]
+        or b[1] + padding <= a[0]
+        or a[3] + padding <= b[2]
+        or b[3] + padding <= a[2]
+    )
+
+
+def test_find_slot_keeps_free_position():
+    layout = SectionLayout()
+    assert layout.find_slot(np.array([0.0]), np.array([0.0]), 3.0, 4.0, 50.0) == (3.0, 4.0)
+
+    layout.add(np.array([0.0, np.nan]), np.array([0.0, 1.0]))
+    assert len(layout) == 1
+    # Far away from the only occupied cell
+    assert layout.find_slot(np.array([500.0]), np.array([0.0]), 0.0, 0.0, 50.0) == (0.0, 0.0)
+
+
+def test_displacement_places_child_right_of_parent_end():
+    parent, child = _line(11, 1000.0), _line(3, 100.0)
+
+    _, merged = merge_surveys(None, parent, None, child, "11", "1", SectionProtocol.DISPLACEMENT)
+
+    placed = merged.iloc[len(parent) :]
+    connector = placed[placed["Node_Id"] == "CONN_1"].iloc[0]
+    assert (connector["X"], connector["Y"]) == (1000.0, 0.0)
+    stations = placed[placed["Type"] == "station"]
+    # Moved straight right: same row as the parent station, clear of the parent
+    assert (stations["Y"] == 0.0).all()
+    assert stations["X"].min() >= 1000.0 + DISPLACEMENT_PADDING
+    assert stations["X"].min() < 1000.0 + 3 * DISPLACEMENT_PADDING
+
+
+def test_displacement_places_child_below_parent_middle():
+    parent, child = _line(11, 1000.0), _line(3, 100.0)
+
+    _, merged = merge_surveys(None, parent, None, child, "6", "1", SectionProtocol.DISPLACEMENT)
+
+    stations = merged.iloc[len(parent) :]
+    stations = stations[stations["Type"] == "station"]
+    # Going right would mean a 500 m jump: the nearest free slot is just below
+    assert stations["X"].min() == 550.0
+    assert -3 * DISPLACEMENT_PADDING < stations["Y"].max() <= -DISPLACEMENT_PADDING
+
+
+def test_displacement_packs_many_children_without_overlap():
+    root = _line(21, 2000.0)
+    children = [_line(5, 80.0 + 10.0 * i) for i in range(30)]
+    junctions = [
+        SurveyJunction(str(1 + i % 21), "1", child_section=child)
+        for i, child in enumerate(children)
+    ]
+
+    _, merged = merge_many(None, root, junctions, SectionProtocol.DISPLACEMENT)
+
+    boxes = [_bbox(root)]
+    start = len(root)
+    for child in children:
+        frame = merged.iloc[start : start + len(child)]  # child minus its station plus connector
+        start += len(child)
+        boxes.append(_bbox(frame[frame["Type"] != "connector"]))
+    for i, a in enumerate(boxes):
+        for b in boxes[i + 1 :]:
+            assert _clear(a, b, DISPLACEMENT_PADDING)
+
+    # Sections are packed around the parent rather than lined up to the right
+    width = merged["X"].max() - merged["X"].min()
+    assert width < 2000.0 + sum(child["X"].max() for child in children)
+
+
+def test_displacement_keeps_clear_of_long_legs():
+    # Sparse stations: the 300 m legs cross cells without any vertex in them
+    parent, child = _line(3, 600.0), _line(2, 10.0)
+
+    _, merged = merge_surveys(None, parent, None, child, "2", "1", SectionProtocol.DISPLACEMENT)
+
+    placed = merged.iloc[len(parent) :]
+    placed = placed[placed["Type"] != "connector"]
+    assert _clear(_bbox(parent), _bbox(placed), DISPLACEMENT_PADDING)
+
+
+def test_displacement_ignores_connector_rows():
+    # The first child is pushed far right; its connector stays on the parent end
+    root, far, near = _line(11, 1000.0), _line(3, 500.0), _line(3, 100.0)
+    junctions = [
+        SurveyJunction("11", "1", child_section=far),
+        SurveyJunction("11", "1", child_section=near),
+    ]
+
+    _, merged = merge_many(None, root, junctions, SectionProtocol.DISPLACEMENT)
+
+    stations = merged[merged["Type"] == "station"].iloc[len(root) :]
+    far_placed, near_placed = stations.iloc[:2], stations.iloc[2:]
+    # The gap between the parent end and the first child is free for the second one
+    assert (near_placed["Y"] == 0.0).all()
+    assert 1000.0 < near_placed["X"].min()
+    assert near_placed["X"].max() + DISPLACEMENT_PADDING <= far_placed["X"].min()
+
+
+def test_layout_occupies_bounding_box():
+    layout = SectionLayout()
+    layout.add(np.array([0.0, 600.0]), np.array([0.0, 0.0]))
+    # A point-sized section on the leg, away from both vertices, must move
+    dx, dy = layout.find_slot(np.array([300.0]), np.array([0.0]), 0.0, 0.0, 10.0)
+    assert (dx, dy) != (0.0, 0.0)
+    assert abs(dy) >= 10.0 or not 0.0 <= 300.0 + dx <= 600.0
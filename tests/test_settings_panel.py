@@ -26,7 +26,7 @@ def test_settings_panel_centerline_enabled(mock_st):
     )
 
     # Setup checkbox mock values
-    mock_st.checkbox.side_effect = [True, True, True]
+    mock_st.checkbox.side_effect = [True, True, True, False]
 
     # Setup number_input mock values
     mock_st.number_input.side_effect = [100, 0, 0.0, 0.0, 0.0]
@@ -41,6 +41,7 @@ def test_settings_panel_centerline_enabled(mock_st):
 
     assert res["show_centerline"] is True
     assert res["show_details"] is True
+    assert res["show_stats"] is False
 
 
 @patch("app.components.settings_panel.st")
@@ -58,7 +59,7 @@ def test_settings_panel_centerline_disabled(mock_st):
     )
 
     # Setup checkbox mock values
-    mock_st.checkbox.side_effect = [False, True, True]
+    mock_st.checkbox.side_effect = [False, True, True, False]
 
     # Setup number_input mock values
     mock_st.number_input.side_effect = [100, 0, 0.0, 0.0, 0.0]
@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+
+from cave_sketch.features.render_features import extract_feature_set_from_df
+from cave_sketch.features.simplify import douglas_peucker, simplify_feature_set
+
+
+def _wall(ids, xy, typ="L_wall"):
+    n = len(ids)
+    links = ["-".join(ids[j] for j in (i - 1, i + 1) if 0 <= j < n) for i in range(n)]
+    return pd.DataFrame({"Node_Id": ids, "Links": links, "X": xy[:, 0], "Y": xy[:, 1], "Type": typ})
+
+
+def test_douglas_peucker_many_polylines():
+    xy = np.array(
+        [
+            [0, 0],
+            [1, 0.01],
+            [2, 0],
+            [3, 1],
+            [4, 0],  # zig-zag: 3 is kept
+            [0, 5],
+            [1, 5],
+            [2, 5],
+        ],  # straight: only the ends
+        dtype=float,
+    )
+    keep = douglas_peucker(xy, np.array([0, 5, 8]), tolerance=0.1)
+
+    assert np.flatnonzero(keep).tolist() == [0, 2, 3, 4, 5, 7]
+    # With no tolerance only exactly collinear vertices go
+    keep = douglas_peucker(xy, np.array([0, 5, 8]), tolerance=0.0)
+    assert np.flatnonzero(~keep).tolist() == [6]
+
+
+def test_simplify_feature_set_keeps_ends_and_junctions():
+    # A straight wall through a junction (W5) with a branch, and a dashed pit
+    t = np.linspace(0, 10, 11)
+    wall = _wall([f"W{i}" for i in range(11)], np.column_stack([t, 0.001 * np.sin(t)]))
+    wall.loc[5, "Links"] = "B1-" + wall.loc[5, "Links"]
+    branch = _wall(["B1", "B2", "B3"], np.array([[5, 1], [5, 2], [5, 3]], float))
+    branch.loc[0, "Links"] = "W5-B2"
+    pit = _wall(["P1", "P2", "P3"], np.array([[0, 9], [1, 9], [2, 9]], float), "L_pit")
+    features = extract_feature_set_from_df(pd.concat([wall, branch, pit], ignore_index=True))
+
+    simple = simplify_feature_set(features, tolerance=0.01)
+
+    ends = sorted(map(tuple, simple.segment_ends.tolist()))
+    assert ends == sorted(
+        [
+            ("W0", "W5"),
+            ("W5", "W0"),
+            ("W5", "W10"),
+            ("W10", "W5"),
+            ("W5", "B1"),
+            ("B1", "W5"),
+            ("B1", "B3"),
+            ("B3", "B1"),
+            # Dashed segments are not merged, so the dash pattern stays put
+            ("P1", "P2"),
+            ("P2", "P1"),
+            ("P2", "P3"),
+            ("P3", "P2"),
+        ]
+    )
+    assert simple.segment_labels is None
+    assert simplify_feature_set(features, tolerance=0.0) is features
+
+
+def test_simplify_feature_set_polygons():
+    angles = np.linspace(0, 2 * np.pi, 200, endpoint=False)
+    circle = np.column_stack([np.cos(angles), np.sin(angles)]) * 10
+    df = pd.DataFrame(
+        {
+            "Node_Id": [f"1P{i}" for i in range(200)] + ["2P1", "2P2", "2P3"],
+            "Links": "-",
+            "X": np.r_[circle[:, 0], 0, 0.001, 0],
+            "Y": np.r_[circle[:, 1], 0, 0, 0.001],
+            "Type": "A_water",
+        }
+    )
+    features = extract_feature_set_from_df(df)
+
+    simple = simplify_feature_set(features, tolerance=0.1)
+
+    rings = simple.polygon_rings()
+    assert 10 < len(rings[0]) < 50
+    np.testing.assert_array_equal(rings[0][0], circle[0])
+    # A ring that would collapse is kept whole
+    assert len(rings[1]) == 3
+
+
+def test_create_survey_lod_is_on_by_default():
+    import matplotlib.pyplot as plt
+
+    from cave_sketch.survey.graphics.survey_plot import create_survey
+
+    t = np.linspace(0, 100, 1001)
+    df = _wall([f"W{i}" for i in range(len(t))], np.column_stack([t, 0.001 * np.sin(t)]))
+
+    def n_segments(config):
+        fig, ax = plt.subplots()
+        create_survey(df=df, rule_flag=False, north_flag=False, config=config, ax=ax)
+        n = sum(len(collection.get_segments()) for collection in ax.collections)
+        plt.close(fig)
+        return n
+
+    assert n_segments({"lod": False}) == 2 * 1000
+    assert n_segments({}) < 10
@@ -0,0 +1,86 @@
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from cave_sketch.survey.graphics.labels import StationLabels, cull_labels
+from cave_sketch.survey.graphics.survey_plot import create_survey
+
+
+def test_cull_labels_drops_overlaps_in_priority_order():
+    anchors = np.array([[10, 0], [12, 1], [30, 0], [10, 20], [500, 500], [40, 3]], float)
+    widths = np.array([8, 8, 8, 8, 8, 20], float)
+
+    keep = cull_labels(anchors, widths, height=5, bounds=(0, 0, 100, 100))
+
+    # 1 overlaps 0, 5 overlaps 2, 4 is off the page
+    assert keep.tolist() == [0, 2, 3]
+
+
+def test_cull_labels_matches_brute_force():
+    rng = np.random.default_rng(0)
+    anchors = rng.random((400, 2)) * 200
+    widths = rng.uniform(2, 15, size=400)
+
+    keep = cull_labels(anchors, widths, height=4)
+
+    boxes = np.column_stack(
+        [anchors[keep, 0] - widths[keep], anchors[keep, 0], anchors[keep, 1], anchors[keep, 1] + 4]
+    )
+    overlap = (
+        (boxes[:, None, 0] < boxes[None, :, 1])
+        & (boxes[None, :, 0] < boxes[:, None, 1])
+        & (boxes[:, None, 2] < boxes[None, :, 3])
+        & (boxes[None, :, 2] < boxes[:, None, 3])
+    )
+    assert overlap.sum() == len(keep)  # only the diagonal
+    assert 0 < len(keep) < 400
+
+
+def test_cull_labels_keeps_short_labels_next_to_each_other():
+    # Cells are as wide as the long label: the two short ones share a cell but do not touch
+    anchors = np.array([[10, 0], [30, 0], [300, 50]], float)
+    widths = np.array([8, 8, 100], float)
+
+    assert cull_labels(anchors, widths, height=5).tolist() == [0, 1, 2]
+
+    # Same result as accepting every label that does not overlap an earlier one
+    rng = np.random.default_rng(1)
+    anchors = rng.random((300, 2)) * [400, 100]
+    widths = np.where(rng.random(300) < 0.1, 60.0, 6.0)
+    greedy = []
+    for i, ((x, y), w) in enumerate(zip(anchors, widths)):
+        if not any(
+            x - w < anchors[j, 0] and anchors[j, 0] - widths[j] < x and abs(anchors[j, 1] - y) < 4
+            for j in greedy
+        ):
+            greedy.append(i)
+    assert cull_labels(anchors, widths, height=4).tolist() == greedy
+
+
+def test_create_survey_fast_labels():
+    n = 200
+    df = pd.DataFrame(
+        {
+            "Node_Id": [str(i) for i in range(n)],
+            "Links": ["-"] * n,
+            "X": np.arange(n, dtype=float),
+            "Y": np.zeros(n),
+            "Type": ["station"] * n,
+        }
+    )
+    fig, ax = plt.subplots()
+    create_survey(
+        df,
+        rule_flag=False,
+        north_flag=False,
+        config={"text_zoom": 1.0, "fast_labels": True},
+        ax=ax,
+    )
+    labels = [artist for artist in ax.artists if isinstance(artist, StationLabels)]
+    assert len(labels) == 1 and not ax.texts
+
+    fig.canvas.draw()
+    # Stations 1 m apart on a line: only some labels fit
+    assert 0 < len(labels[0].drawn) < n
+    assert labels[0].drawn[0] == 0
+    plt.close(fig)
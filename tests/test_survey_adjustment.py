@@ -0,0 +1,141 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from cave_sketch.survey.adjustment import (
+    MergeAdjustment,
+    distribute_misclosure,
+    fit_rigid_transform,
+)
+from cave_sketch.survey.merger import SurveyJunction, merge_many, merge_surveys
+
+
+def _rotate(xy, degrees):
+    angle = np.radians(degrees)
+    rotation = np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+    return xy @ rotation.T
+
+
+def _chain(ids, xy, walls=()):
+    n = len(ids)
+    links = ["-".join(ids[j] for j in (i - 1, i + 1) if 0 <= j < n) for i in range(n)]
+    return pd.DataFrame(
+        {
+            "Node_Id": list(ids) + [w for w, _ in walls],
+            "X": [x for x, _ in xy] + [p[0] for _, p in walls],
+            "Y": [y for _, y in xy] + [p[1] for _, p in walls],
+            "Links": links + ["-"] * len(walls),
+            "Type": ["station"] * n + ["L_wall"] * len(walls),
+        }
+    )
+
+
+def _xy(df, node_id):
+    row = df[df["Node_Id"] == node_id].iloc[0]
+    return row["X"], row["Y"]
+
+
+def test_fit_rigid_transform_recovers_rotation():
+    rng = np.random.default_rng(0)
+    source = rng.normal(size=(6, 2))
+    target = _rotate(source, 30.0) + [5.0, -2.0]
+
+    rotation, translation = fit_rigid_transform(source, target)
+
+    np.testing.assert_allclose(source @ rotation.T + translation, target, atol=1e-12)
+    # A single pair is a pure translation
+    rotation, translation = fit_rigid_transform(source[:1], target[:1])
+    np.testing.assert_allclose(rotation, np.eye(2))
+
+
+def test_distribute_misclosure_along_legs():
+    # Chain 0-1-2-3-4 with unequal legs, a dead end 2-5 and a separate leg 6-7
+    xy = np.array([[0, 0], [1, 0], [3, 0], [4, 0], [6, 0], [3, 5], [9, 9], [9, 8]], float)
+    legs = np.array([[0, 1], [1, 2], [2, 3], [3, 4], [2, 5], [6, 7]])
+
+    corrections = distribute_misclosure(xy, legs, np.array([0, 4]), np.array([[0, 0], [6, 12]]))
+
+    # Linear in the distance travelled between the anchors
+    np.testing.assert_allclose(corrections[:5], xy[:5, :1] * [1, 2])
+    np.testing.assert_allclose(corrections[5], corrections[2])
+    np.testing.assert_allclose(corrections[6:], 0.0)
+
+
+def test_merge_surveys_network_closes_loop():
+    parent = _chain(["1", "2", "3"], [(0, 0), (10, 0), (20, 0)])
+    # Child loop from parent station 1 back to parent station 3, surveyed with a
+    # rotated frame and a 1 m misclosure
+    loop = np.array([(0, 0), (0, 10), (20, 10), (21, 0)], float)
+    child = _chain(["1", "2", "3", "4"], _rotate(loop, 40.0), walls=[("1P1", (1.0, 1.0))])
+
+    merged_map, _ = merge_surveys(
+        parent,
+        None,
+        child,
+        None,
+        "1",
+        "1",
+        shared_stations=[("3", "4")],
+        adjustment=MergeAdjustment.NETWORK,
+    )
+
+    # The closing station is merged into the parent one, whose position is kept
+    assert merged_map["Node_Id"].tolist() == ["1", "2", "3", "5", "6", "1P1"]
+    assert merged_map["Links"].tolist()[3:5] == ["1-6", "5-3"]
+    # The 1 m misclosure is spread along the 40 m loop in proportion to the distance
+    assert _xy(merged_map, "5") == pytest.approx((-0.25, 10.0), abs=1e-3)
+    assert _xy(merged_map, "6") == pytest.approx((19.25, 10.0), abs=1e-3)
+
+    rigid_map, _ = merge_surveys(
+        parent,
+        None,
+        child,
+        None,
+        "1",
+        "1",
+        shared_stations=[("3", "4")],
+        adjustment=MergeAdjustment.RIGID,
+    )
+    # RIGID splits the misclosure between the two shared stations
+    rigid_end = rigid_map[rigid_map["Node_Id"] == "1P1"][["X", "Y"]].to_numpy()
+    network_end = merged_map[merged_map["Node_Id"] == "1P1"][["X", "Y"]].to_numpy()
+    assert not np.allclose(rigid_end, network_end)
+
+
+def test_merge_many_adjustment_matches_chained_merges():
+    root = _chain(["1", "2", "3"], [(0, 0), (10, 0), (20, 0)])
+    loop = _chain(["1", "2", "3"], _rotate(np.array([(0, 0), (10, 8), (21, 1)], float), 15.0))
+    spur = _chain(["1", "2"], [(0, 0), (3, 4)])
+    junctions = [
+        SurveyJunction(
+            "1", "1", loop, children=[SurveyJunction("2", "1", spur)], shared_stations=[("3", "3")]
+        ),
+    ]
+
+    for adjustment in MergeAdjustment:
+        merged_map, _ = merge_many(root, None, junctions, adjustment=adjustment)
+
+        expected, _ = merge_surveys(
+            root,
+            None,
+            loop,
+            None,
+            "1",
+            "1",
+            shared_stations=[("3", "3")],
+            adjustment=adjustment,
+        )
+        expected, _ = merge_surveys(expected, None, spur, None, "5", "1", adjustment=adjustment)
+        pd.testing.assert_frame_equal(merged_map, expected)
+
+    with pytest.raises(ValueError, match="Station 9 not found in child survey"):
+        merge_surveys(
+            root,
+            None,
+            loop,
+            None,
+            "1",
+            "1",
+            shared_stations=[("3", "9")],
+            adjustment=MergeAdjustment.RIGID,
+        )
@@ -0,0 +1,65 @@
+import pandas as pd
+
+from cave_sketch.dxf.models import CaveSurvey, SurveyPoint
+from cave_sketch.survey.converters import (
+    as_survey_df,
+    load_survey_df,
+    normalize_survey_df,
+    survey_to_df,
+)
+
+
+def test_survey_to_df():
+    survey = CaveSurvey(
+        name="s",
+        points=[
+            SurveyPoint(id="1", x=0.0, y=0.0, links=["2"]),
+            SurveyPoint(id="2", x=3.0, y=4.0, links=["1", "0P0"]),
+            SurveyPoint(id="BLOCK_0", x=1.0, y=1.0, point_type="BLOCK"),
+        ],
+    )
+
+    df = survey_to_df(survey)
+
+    assert list(df.columns) == ["Node_Id", "Links", "X", "Y", "Type"]
+    assert df["Links"].tolist() == ["2", "1-0P0", "-"]
+    assert df["Y"].tolist() == [0.0, 4.0, 1.0]
+    pd.testing.assert_frame_equal(as_survey_df(survey), df)
+
+
+def test_normalize_survey_df_cleans_links():
+    df = pd.DataFrame(
+        {
+            "Node_Id": [1, 2, "0P0", "BLOCK_0", 5],
+            "Links": ["2", " 1 - 0P0 ", "2-", "-", float("nan")],
+            "X": [0, 1.5, 2, 3, 4],
+            "Y": [0, 0, 1, 1, 1],
+            "Type": ["station", "station", "L_wall", "BLOCK", "station"],
+        },
+        index=[4, 3, 2, 1, 0],
+    )
+
+    normalized = normalize_survey_df(df)
+
+    assert normalized["Node_Id"].tolist() == ["1", "2", "0P0", "BLOCK_0", "5"]
+    assert normalized["Links"].tolist() == ["2", "1-0P0", "2", "-", "nan"]
+    assert normalized["X"].dtype == float
+    assert normalized.index.tolist() == [0, 1, 2, 3, 4]
+
+
+def test_load_survey_df_sources(tmp_path):
+    df = pd.DataFrame(
+        {"Node_Id": ["1", "2"], "Links": ["2", "1"], "X": [0.0, 3.0], "Y": [0.0, 4.0]}
+    )
+    df["Type"] = "station"
+    csv_path = tmp_path / "survey.csv"
+    df.to_csv(csv_path, index=False)
+
+    expected = pd.read_csv(csv_path)
+
+    assert load_survey_df(df) is df
+    assert load_survey_df(None) is None
+    assert load_survey_df("") is None
+    pd.testing.assert_frame_equal(load_survey_df(csv_path), expected)
+    pd.testing.assert_frame_equal(load_survey_df(str(csv_path)), expected)
+    pd.testing.assert_frame_equal(load_survey_df(csv_path.read_bytes()), expected)
@@ -1,7 +1,11 @@
 import pandas as pd
 import pytest
 
-from cave_sketch.survey.metrics import compute_total_depth, compute_total_length
+from cave_sketch.survey.metrics import (
+    compute_survey_stats,
+    compute_total_depth,
+    compute_total_length,
+)
 
 
 def test_compute_total_length_two_connected():
@@ -118,3 +122,84 @@ def test_compute_total_depth_empty_or_single_station():
 
 def test_compute_total_depth_none_when_no_section():
     assert compute_total_depth(None) is None
+
+
+def test_compute_total_length_messy_links_and_duplicates():
+    df = pd.DataFrame({
+        "Node_Id": [1, "2", "3", "3", "4"],
+        "X": [0.0, 3.0, 100.0, 3.0, 0.0],
+        "Y": [0.0, 4.0, 100.0, 10.0, 0.0],
+        "Links": [" 2 -", "1--3", "2", "2", float("nan")],
+        "Type": ["station"] * 5,
+    })
+    # Legs 1-2 (5.0) and 2-3 (6.0, the last occurrence of "3" wins); "4" has no links
+    assert compute_total_length(df) == pytest.approx(11.0)
+
+
+def test_compute_total_length_ignores_unknown_links():
+    df = pd.DataFrame({
+        "Node_Id": ["1", "2"],
+        "X": [0.0, 3.0],
+        "Y": [0.0, 4.0],
+        "Links": ["2-7-1P0", "1"],
+        "Type": ["station", "station"],
+    })
+    assert compute_total_length(df) == pytest.approx(5.0)
+
+
+def _stations_df(coords, links):
+    return pd.DataFrame({
+        "Node_Id": list(coords),
+        "Links": [links.get(node, "-") for node in coords],
+        "X": [xy[0] for xy in coords.values()],
+        "Y": [xy[1] for xy in coords.values()],
+        "Type": ["station"] * len(coords),
+    })
+
+
+def test_compute_survey_stats_3d_length():
+    map_df = _stations_df({"1": (0.0, 0.0), "2": (3.0, 4.0), "3": (3.0, 4.0)}, {"2": "1-3"})
+    section_df = _stations_df({"1": (0.0, 0.0), "2": (5.0, 0.0), "3": (5.0, -12.0)}, {})
+
+    stats = compute_survey_stats(map_df, section_df)
+    assert stats.horizontal_length == pytest.approx(compute_total_length(map_df))
+    assert stats.vertical_length == pytest.approx(12.0)
+    assert stats.length == pytest.approx(17.0)
+    assert stats.depth == pytest.approx(compute_total_depth(section_df))
+    assert (stats.n_stations, stats.n_legs, stats.n_loops) == (3, 2, 0)
+
+    # Without a section view the 3D length falls back to the plan length
+    plan_only = compute_survey_stats(map_df)
+    assert plan_only.length == pytest.approx(5.0)
+    assert plan_only.vertical_length == 0.0
+    assert plan_only.depth is None
+
+
+def test_compute_survey_stats_loops_and_branches():
+    # Junction at 2: dead end 1, a loop 2-3-4-2 and a branch 2-5-6
+    coords = {
+        "1": (0.0, 0.0), "2": (1.0, 0.0), "3": (2.0, 0.0),
+        "4": (2.0, 1.0), "5": (1.0, -1.0), "6": (1.0, -3.0),
+    }
+    map_df = _stations_df(coords, {"1": "2", "2": "3-5", "3": "4", "4": "2", "5": "6"})
+
+    stats = compute_survey_stats(map_df)
+    assert stats.n_legs == 6
+    assert stats.n_loops == 1
+    branches = {(b.start, b.end): b for b in stats.branches}
+    assert set(branches) == {("1", "2"), ("2", "2"), ("2", "6")}
+    assert branches[("2", "2")].n_legs == 3
+    assert branches[("2", "6")].length == pytest.approx(3.0)
+    assert sum(b.length for b in stats.branches) == pytest.approx(stats.length)
+
+
+def test_compute_survey_stats_closed_loop_and_empty():
+    coords = {"1": (0.0, 0.0), "2": (1.0, 0.0), "3": (0.0, 1.0)}
+    map_df = _stations_df(coords, {"1": "2", "2": "3", "3": "1"})
+    stats = compute_survey_stats(map_df)
+    assert stats.n_loops == 1
+    assert [(b.start, b.end, b.n_legs) for b in stats.branches] == [(None, None, 3)]
+
+    empty = compute_survey_stats(pd.DataFrame(columns=["Node_Id", "Links", "X", "Y", "Type"]))
+    assert empty.length == 0.0
+    assert empty.branches == []
@@ -80,3 +80,51 @@ def test_render_survey_config_show_north(sample_survey):
     with patch("cave_sketch.survey.graphics.survey_plot._add_north_arrow") as mock_north:
         render_survey(survey=sample_survey, config=config, section_survey=None)
         mock_north.assert_not_called()
+
+
+def test_draw_survey_accepts_in_memory_surveys(sample_survey):
+    """DataFrame and CaveSurvey inputs are rendered without reading any CSV."""
+    import matplotlib.pyplot as plt
+    import pandas as pd
+
+    section_df = pd.DataFrame({
+        "Node_Id": [1, 2],
+        "Links": [2, 1],
+        "X": [0, 10],
+        "Y": [0, -5],
+        "Type": ["station", "station"],
+    })
+
+    with patch("pandas.read_csv") as mock_read:
+        fig = draw_survey(
+            title="In Memory",
+            rule_length=20,
+            csv_map_path=sample_survey,
+            csv_section_path=section_df,
+        )
+        mock_read.assert_not_called()
+
+    axes = [ax for ax in fig.get_axes() if ax.get_position().y0 < 0.8]
+    assert [ax.get_title() for ax in axes] == ["Sezione", "Pianta"]
+    plt.close(fig)
+
+
+def test_render_survey_accepts_dataframe():
+    import matplotlib.pyplot as plt
+    import pandas as pd
+
+    df = pd.DataFrame({
+        "Node_Id": ["1", "2"],
+        "Links": ["2", "1"],
+        "X": [0.0, 10.0],
+        "Y": [0.0, 0.0],
+        "Type": ["station", "station"],
+    })
+    config = SurveyConfig(rule_length=20)
+
+    with patch("cave_sketch.survey.converters.survey_to_df") as mock_convert:
+        fig = render_survey(survey=df, config=config, title="From DataFrame")
+        mock_convert.assert_not_called()
+
+    assert "From DataFrame" in [t.get_text() for t in fig.texts]
+    plt.close(fig)
@@ -0,0 +1,164 @@
+import re
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+from matplotlib.collections import LineCollection
+
+from cave_sketch.features.feature_set import FeatureSet
+from cave_sketch.survey import draw_survey, tiled_pdf
+from cave_sketch.survey.config import SurveyConfig
+from cave_sketch.survey.tiled_pdf import TileGrid, _subset, export_tiled_pdf
+
+
+def _n_pages(path):
+    return len(re.findall(rb"/Type /Page\b(?!s)", path.read_bytes()))
+
+
+def _gallery(length):
+    """A straight gallery with walls on both sides and a station every 10 m."""
+    x = np.arange(0.0, length + 1.0, 10.0)
+    ids = [str(i) for i in range(len(x))]
+    rows = []
+    for i, (node, xi) in enumerate(zip(ids, x)):
+        links = "-".join(ids[j] for j in (i - 1, i + 1) if 0 <= j < len(ids))
+        rows.append((node, links, xi, 0.0, "station"))
+    for side, y in (("L", 3.0), ("R", -3.0)):
+        for i, xi in enumerate(x):
+            links = "-".join(f"{side}{j}" for j in (i - 1, i + 1) if 0 <= j < len(x))
+            rows.append((f"{side}{i}", links, xi, y, "L_wall"))
+    return pd.DataFrame(rows, columns=["Node_Id", "Links", "X", "Y", "Type"])
+
+
+@pytest.fixture
+def long_survey():
+    """A 300 m gallery."""
+    return _gallery(300.0)
+
+
+def _tile_pages(survey, scale, config=None):
+    config = config or SurveyConfig()
+    area_w, area_h = tiled_pdf._drawing_area(tiled_pdf.PAGE_SIZE)
+    units_per_inch = tiled_pdf.MM_PER_INCH / 1000 * scale
+    view = tiled_pdf._prepare_view(
+        "Pianta",
+        survey,
+        config,
+        [],
+        0.0,
+        area_w * units_per_inch,
+        area_h * units_per_inch,
+        7.5,
+        scale,
+    )
+    pages = tiled_pdf._pages(
+        [view], "Grotta", config, scale, tiled_pdf.PAGE_SIZE, 1 / units_per_inch
+    )
+    next(pages)  # index page
+    return pages
+
+
+def test_tile_grid_covers_bounds():
+    grid = TileGrid.cover((0.0, 100.0, 0.0, 10.0), tile_w=30.0, tile_h=40.0, overlap=5.0)
+    assert (grid.n_cols, grid.n_rows) == (4, 1)
+    x_min, x_max, y_min, y_max = grid.extent
+    assert x_min <= 0.0 and x_max >= 100.0 and y_min <= 0.0 and y_max >= 10.0
+    # Neighbouring tiles share the overlap
+    assert grid.tile_bounds(0)[1] - grid.tile_bounds(1)[0] == pytest.approx(5.0)
+
+
+def test_tile_grid_rows_from_top():
+    grid = TileGrid.cover((0.0, 10.0, 0.0, 100.0), tile_w=20.0, tile_h=30.0, overlap=5.0)
+    assert grid.n_rows > 1
+    assert grid.tile_bounds(0)[2] > grid.tile_bounds(grid.n_cols)[2]
+
+
+def test_bucket_matches_brute_force():
+    rng = np.random.default_rng(0)
+    grid = TileGrid.cover((0.0, 100.0, 0.0, 70.0), tile_w=25.0, tile_h=20.0, overlap=4.0)
+    lo = rng.uniform(-10, 100, size=(500, 2))
+    hi = lo + rng.exponential(5, size=(500, 2))
+    items, offsets = grid.bucket(lo, hi)
+    for tile in range(grid.n_tiles):
+        x0, x1, y0, y1 = grid.tile_bounds(tile)
+        expected = np.flatnonzero(
+            (lo[:, 0] <= x1) & (hi[:, 0] >= x0) & (lo[:, 1] <= y1) & (hi[:, 1] >= y0)
+        )
+        np.testing.assert_array_equal(items[offsets[tile] : offsets[tile + 1]], expected)
+
+
+def test_subset_keeps_selected_polygons():
+    features = FeatureSet(
+        polygon_xy=np.arange(18, dtype=float).reshape(9, 2),
+        polygon_offsets=np.array([0, 3, 7, 9]),
+        polygon_styles=np.array([0, 1, 0], dtype=np.int32),
+    )
+    subset = _subset(features, np.array([], dtype=int), np.array([0, 2]), np.array([], dtype=int))
+    assert subset.n_polygons == 2
+    np.testing.assert_array_equal(subset.polygon_rings()[1], features.polygon_rings()[2])
+    np.testing.assert_array_equal(subset.polygon_styles, [0, 0])
+
+
+def test_export_tiled_pdf_pages(long_survey, tmp_path):
+    output = tmp_path / "tiled.pdf"
+    assert export_tiled_pdf(long_survey, output, scale=500, title="Grotta") == output
+    # At 1:500 an A4 drawing area is about 95 m wide: 4 tiles, plus the index page
+    assert _n_pages(output) == 5
+
+    export_tiled_pdf(long_survey, output, scale=2000, title="Grotta")
+    assert _n_pages(output) == 2
+
+
+def test_tile_pages_at_true_scale(long_survey):
+    scale = 500
+    for fig in _tile_pages(long_survey, scale):
+        ax = fig.axes[0]
+        width_mm = ax.get_position().width * fig.get_size_inches()[0] * tiled_pdf.MM_PER_INCH
+        x0, x1 = ax.get_xlim()
+        assert (x1 - x0) * 1000 / width_mm == pytest.approx(scale)
+
+
+def test_tile_labels_readable_on_long_survey():
+    # Symbol sizes do not shrink with the length of the survey
+    for fig in _tile_pages(_gallery(2000.0), scale=500):
+        ax = fig.axes[0]
+        assert ax.texts
+        assert min(text.get_fontsize() for text in ax.texts) >= 4
+
+    zoomed = _tile_pages(_gallery(2000.0), scale=500, config=SurveyConfig(text_zoom=0.5))
+    assert next(zoomed).axes[0].texts[0].get_fontsize() == pytest.approx(
+        tiled_pdf.STATION_LABEL_PT * 10**0.5
+    )
+
+
+def _line_widths(fig):
+    return [
+        lc.get_linewidth()[0] for lc in fig.axes[0].collections if isinstance(lc, LineCollection)
+    ]
+
+
+def test_tile_line_widths_fixed_on_paper():
+    widths = _line_widths(next(_tile_pages(_gallery(200.0), scale=500)))
+    assert widths
+    assert _line_widths(next(_tile_pages(_gallery(2000.0), scale=500))) == widths
+
+    zoomed = _tile_pages(_gallery(200.0), scale=500, config=SurveyConfig(line_width_zoom=0.2))
+    assert _line_widths(next(zoomed)) == pytest.approx(np.clip(np.array(widths) * 10**0.2, 0.2, 4))
+
+
+def test_draw_survey_print_scale(long_survey, tmp_path, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("the single-page figure is rendered")
+
+    monkeypatch.setattr(sys.modules["cave_sketch.survey.survey"], "render_survey", fail)
+    output = tmp_path / "survey.pdf"
+    fig = draw_survey(
+        title="Grotta",
+        rule_length=20,
+        csv_map_path=long_survey,
+        output_path=str(output),
+        print_scale=500,
+    )
+    assert fig is None
+    assert _n_pages(output) == 5
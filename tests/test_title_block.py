@@ -1,6 +1,7 @@
 import matplotlib.pyplot as plt
 
 from cave_sketch.survey.graphics.title_block import draw_title_block
+from cave_sketch.survey.metrics import BranchStats, SurveyStats
 
 
 def test_draw_title_block_all_fields():
@@ -113,3 +114,38 @@ def test_draw_title_block_long_cave_name_wrapping():
     joined_fig_text = " ".join(texts)
     # Checks that it was split into lines
     assert "Abisso di Frasassi con Sviluppo\nEccezionale e Molto Lungo" in joined_fig_text
+
+
+def test_draw_title_block_with_survey_stats():
+    fig = plt.figure(figsize=(8.27, 11.69))
+    stats = SurveyStats(
+        length=160.4,
+        horizontal_length=154.3,
+        vertical_length=38.7,
+        depth=45.2,
+        n_stations=12,
+        n_legs=12,
+        n_loops=1,
+        branches=[
+            BranchStats(start="1", end="5", n_legs=4, length=60.2, horizontal_length=58.0),
+            BranchStats(start="5", end="5", n_legs=8, length=100.2, horizontal_length=96.3),
+        ],
+    )
+    draw_title_block(
+        fig=fig,
+        cave_name="Grotta del Vento",
+        surveyor_name="John Doe",
+        total_length=154.3,
+        total_depth=45.2,
+        stats=stats,
+    )
+
+    texts = [t.get_text() for ax in fig.axes for t in ax.texts]
+    joined_text = " ".join(texts)
+
+    assert len(fig.axes) == 2
+    assert "Sviluppo spaziale: 160.4 m" in joined_text
+    assert "Sviluppo verticale: 38.7 m" in joined_text
+    assert "Tratte: 12" in joined_text
+    assert "Anelli: 1" in joined_text
+    assert "Rami: 2 (max 100.2 m)" in joined_text
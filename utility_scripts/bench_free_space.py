@@ -0,0 +1,60 @@
+"""
+Benchmark of the free-space search for the scale rule and north arrow.
+
+Times cave_sketch.survey.graphics.placement.find_free_space and
+compute_dual_layout(free_space=True) on a random-walk survey (nodes and the
+segments between consecutive nodes) of 10k, 100k and 1M points, which blocks
+all four corners, and checks that the returned box holds no survey node.
+
+Usage:
+    uv run python utility_scripts/bench_free_space.py
+"""
+import time
+
+import numpy as np
+
+from cave_sketch.survey.graphics.placement import compute_dual_layout, find_free_space
+
+SIZES = [10_000, 100_000, 1_000_000]
+
+
+def build_survey(n_points, seed=0):
+    """Random walk looping around a ring, so the corners and the center stay clear."""
+    rng = np.random.default_rng(seed)
+    angle = np.linspace(0, 2 * np.pi, n_points)
+    radius = 100 + np.cumsum(rng.normal(size=n_points)) * 0.05
+    x, y = radius * np.cos(angle), radius * np.sin(angle)
+    # Side passages reaching every corner of the bounding box
+    for cx, cy in ((-1, -1), (1, -1), (-1, 1), (1, 1)):
+        t = np.linspace(0.7, 1.0, n_points // 100)
+        x = np.append(x, cx * 100 * t)
+        y = np.append(y, cy * 100 * t)
+    segments = np.stack([np.c_[x[:-1], y[:-1]], np.c_[x[1:], y[1:]]], axis=1)
+    return x, y, segments
+
+
+def timed(fn, *args, **kwargs):
+    t0 = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - t0
+
+
+def main():
+    print(f"{'points':>10} {'search [s]':>11} {'layout [s]':>11} {'expanded':>9}")
+    for n in SIZES:
+        x, y, segments = build_survey(n)
+        spot, t_search = timed(find_free_space, x, y, 30.0, 20.0, segments=segments)
+        assert spot is not None
+        inside = (x >= spot[0]) & (x <= spot[0] + 30) & (y >= spot[1]) & (y <= spot[1] + 20)
+        assert not inside.any()
+
+        ref_scale = max(np.ptp(x), np.ptp(y))
+        (_, _, expansion), t_layout = timed(
+            compute_dual_layout, x, y, 20.0, ref_scale * 0.07, ref_scale,
+            free_space=True, segments=segments,
+        )
+        print(f"{n:>10} {t_search:>11.4f} {t_layout:>11.4f} {expansion is not None!s:>9}")
+
+
+if __name__ == "__main__":
+    main()
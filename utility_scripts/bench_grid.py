@@ -0,0 +1,75 @@
+"""
+Benchmark for the survey grid overlay.
+
+Draws the grid of a 2 km x 1 km cave at 0.5 m, 2.5 m and 10 m spacing on an A4
+axes, with the former one axvline / axhline per grid line and with
+cave_sketch.survey.graphics.grid._add_grid (one Line2D per direction, spacing coarsened past
+MAX_GRID_LINES lines). Reports the number of grid lines, the build, PNG and PDF
+times and the PDF size.
+
+Usage:
+    uv run python utility_scripts/bench_grid.py
+"""
+import io
+import math
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from cave_sketch.survey.graphics.grid import _add_grid
+
+SPACINGS = [0.5, 2.5, 10.0]
+EXTENT = (0.0, 2000.0, 0.0, 1000.0)
+
+
+def legacy_grid(ax, x_min, x_max, y_min, y_max, grid_spacing):
+    """The former _add_grid: one Line2D per grid line."""
+    for k in range(math.ceil(x_min / grid_spacing), math.floor(x_max / grid_spacing) + 1):
+        ax.axvline(k * grid_spacing, color="lightgray", linestyle=":", zorder=0)
+    for k in range(math.ceil(y_min / grid_spacing), math.floor(y_max / grid_spacing) + 1):
+        ax.axhline(k * grid_spacing, color="lightgray", linestyle=":", zorder=0)
+    return len(ax.lines)
+
+
+def single_line_grid(ax, *args):
+    grid = _add_grid(ax, *args)
+    return sum((line.get_xydata()[:, 0].size + 1) // 3 for line in grid)
+
+
+def timed(draw, spacing):
+    fig, ax = plt.subplots(figsize=(8.27, 11.69))
+    ax.set_xlim(EXTENT[0], EXTENT[1])
+    ax.set_ylim(EXTENT[2], EXTENT[3])
+    t0 = time.perf_counter()
+    n_lines = draw(ax, *EXTENT, spacing)
+    t_build = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    fig.savefig(io.BytesIO(), format="png", dpi=150)
+    t_png = time.perf_counter() - t0
+    pdf = io.BytesIO()
+    t0 = time.perf_counter()
+    fig.savefig(pdf, format="pdf")
+    t_pdf = time.perf_counter() - t0
+    plt.close(fig)
+    return n_lines, t_build, t_png, t_pdf, pdf.tell() / 1024
+
+
+def main():
+    print(
+        f"{'spacing':>8} {'grid':>7} {'lines':>6} {'build [s]':>10} {'png [s]':>8}"
+        f" {'pdf [s]':>8} {'pdf [KiB]':>10}"
+    )
+    for spacing in SPACINGS:
+        for name, draw in (("legacy", legacy_grid), ("single", single_line_grid)):
+            n_lines, t_build, t_png, t_pdf, size = timed(draw, spacing)
+            print(
+                f"{spacing:>8} {name:>7} {n_lines:>6} {t_build:>10.3f} {t_png:>8.3f}"
+                f" {t_pdf:>8.3f} {size:>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
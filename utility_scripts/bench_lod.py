@@ -0,0 +1,93 @@
+"""
+Benchmark for the level-of-detail simplification of survey plots.
+
+Renders synthetic surveys of wall polylines densely sampled every 1 cm (100k,
+300k and 1M vertices over a 500 m cave) with render_survey on the A4 page, with
+and without SurveyConfig.lod. Reports the number of drawn segments, the
+render_survey, PNG and PDF times and the PDF size.
+
+Usage:
+    uv run python utility_scripts/bench_lod.py
+"""
+import io
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from matplotlib.collections import LineCollection
+
+from cave_sketch.survey.config import SurveyConfig
+from cave_sketch.survey.renderer import render_survey
+
+SIZES = [100_000, 300_000, 1_000_000]
+VERTICES_PER_WALL = 5_000
+
+
+def build_df(n_vertices, seed=0):
+    """Meandering walls with 1 cm steps, plus a station every 10 m."""
+    rng = np.random.default_rng(seed)
+    n_walls = n_vertices // VERTICES_PER_WALL
+    heading = np.cumsum(rng.normal(scale=0.01, size=(n_walls, VERTICES_PER_WALL)), axis=1)
+    steps = 0.01 * np.stack([np.cos(heading), np.sin(heading)], axis=-1)
+    xy = np.cumsum(steps, axis=1) + rng.uniform(0, 500, size=(n_walls, 1, 2))
+    xy = xy.reshape(-1, 2)
+
+    wall, vertex = np.divmod(np.arange(len(xy)), VERTICES_PER_WALL)
+    ids = np.char.add(np.char.add(wall.astype(str), "P"), vertex.astype(str))
+    prev = np.where(vertex > 0, np.roll(ids, 1), "")
+    nxt = np.where(vertex < VERTICES_PER_WALL - 1, np.roll(ids, -1), "")
+    links = np.char.add(np.char.add(prev, "-"), nxt)
+    links = np.char.strip(links, "-")
+    links[links == ""] = "-"
+
+    stations = xy[::1000]
+    station_ids = [str(i) for i in range(1, len(stations) + 1)]
+    return pd.DataFrame({
+        "Node_Id": list(ids) + station_ids,
+        "Links": list(links) + ["-"] * len(stations),
+        "X": np.concatenate([xy[:, 0], stations[:, 0]]),
+        "Y": np.concatenate([xy[:, 1], stations[:, 1]]),
+        "Type": ["L_wall"] * len(xy) + ["station"] * len(stations),
+    })
+
+
+def timed(df, lod):
+    t0 = time.perf_counter()
+    fig = render_survey(df, SurveyConfig(lod=lod, fast_labels=True))
+    t_render = time.perf_counter() - t0
+    segments = sum(
+        len(c.get_segments()) for ax in fig.axes for c in ax.collections
+        if isinstance(c, LineCollection)
+    )
+    t0 = time.perf_counter()
+    fig.savefig(io.BytesIO(), format="png", dpi=150)
+    t_png = time.perf_counter() - t0
+    pdf = io.BytesIO()
+    t0 = time.perf_counter()
+    fig.savefig(pdf, format="pdf")
+    t_pdf = time.perf_counter() - t0
+    plt.close(fig)
+    return segments, t_render, t_png, t_pdf, pdf.tell() / 1024
+
+
+def main():
+    print(
+        f"{'vertices':>9} {'lod':>5} {'segments':>9} {'render [s]':>11} {'png [s]':>8}"
+        f" {'pdf [s]':>8} {'pdf [KiB]':>10}"
+    )
+    for n in SIZES:
+        df = build_df(n)
+        for lod in (False, True):
+            segments, t_render, t_png, t_pdf, size = timed(df, lod)
+            print(
+                f"{n:>9} {str(lod):>5} {segments:>9} {t_render:>11.3f} {t_png:>8.3f}"
+                f" {t_pdf:>8.3f} {size:>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
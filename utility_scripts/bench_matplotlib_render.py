@@ -0,0 +1,122 @@
+"""
+Benchmark for render_to_matplotlib on surveys with many areas and line styles.
+
+Times the former renderer (one MplPolygon patch per area, per-line array and
+style construction feeding a single LineCollection) against
+cave_sketch.backend_renders.render_to_matplotlib (one PolyCollection, one
+LineCollection per style) on synthetic surveys with 1k, 5k and 20k water areas
+and 10 wall segments per area. Reports the build, PNG and PDF times and the PDF
+size.
+
+Usage:
+    uv run python utility_scripts/bench_matplotlib_render.py
+"""
+import io
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from matplotlib.collections import LineCollection
+from matplotlib.patches import Polygon as MplPolygon
+
+from cave_sketch.backend_renders import render_to_matplotlib
+from cave_sketch.features.render_features import extract_features_from_df
+
+SIZES = [1_000, 5_000, 20_000]
+WALL_TYPES = ["L_wall", "L_border", "L_pit", "L_chimney"]
+
+
+def legacy_render(features, ax, ref_scale):
+    """Polygons and lines part of the former render_to_matplotlib."""
+    for p in features["polygons"]:
+        coords = np.array(p["coords"], dtype=float)
+        ax.add_patch(
+            MplPolygon(
+                np.column_stack((coords[:, 1], coords[:, 0])),
+                closed=True,
+                facecolor=p["fill_color"],
+                edgecolor=p["edge_color"],
+                alpha=p["fill_opacity"],
+                linewidth=0.5,
+                zorder=1,
+            )
+        )
+    segments, colors, linewidths, linestyles = [], [], [], []
+    for line in features["lines"]:
+        coords = np.array(line["coords"], dtype=float)
+        segments.append([(coords[0, 1], coords[0, 0]), (coords[1, 1], coords[1, 0])])
+        colors.append(line["color"])
+        linewidths.append(np.clip(line["weight"] / ref_scale, 0.2, 4))
+        linestyles.append((0, tuple(line["dash"])) if line["dash"] else "solid")
+    ax.add_collection(
+        LineCollection(
+            segments, colors=colors, linewidths=linewidths, linestyles=linestyles,
+            alpha=0.9, zorder=2,
+        )
+    )
+    ax.autoscale_view()
+    ax.set_aspect("equal", "datalim")
+
+
+def build_df(n_areas, seed=0):
+    """Hexagonal water areas, each with a 10-segment wall of a random style."""
+    rng = np.random.default_rng(seed)
+    centres = rng.random((n_areas, 2)) * 5_000
+    angles = np.linspace(0, 2 * np.pi, 6, endpoint=False)
+    ring = np.column_stack([np.cos(angles), np.sin(angles)]) * 5
+    area_xy = (centres[:, None, :] + ring).reshape(-1, 2)
+    area_ids = [f"{a}P{k}" for a in range(n_areas) for k in range(6)]
+
+    wall_xy = (centres[:, None, :] + rng.normal(size=(n_areas, 11, 2)) * 8).reshape(-1, 2)
+    wall_ids = [f"W{a}_{k}" for a in range(n_areas) for k in range(11)]
+    wall_links = [f"W{a}_{k + 1}" if k < 10 else "-" for a in range(n_areas) for k in range(11)]
+    wall_types = np.repeat(rng.choice(WALL_TYPES, size=n_areas), 11)
+    return pd.DataFrame({
+        "Node_Id": area_ids + wall_ids,
+        "X": np.concatenate([area_xy[:, 0], wall_xy[:, 0]]),
+        "Y": np.concatenate([area_xy[:, 1], wall_xy[:, 1]]),
+        "Links": ["-"] * len(area_ids) + wall_links,
+        "Type": ["A_water"] * len(area_ids) + wall_types.tolist(),
+    })
+
+
+def timed_render(render, features):
+    fig, ax = plt.subplots(figsize=(8.27, 11.69))
+    t0 = time.perf_counter()
+    render(features, ax)
+    t_build = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    fig.savefig(io.BytesIO(), format="png", dpi=150)
+    t_png = time.perf_counter() - t0
+    pdf = io.BytesIO()
+    t0 = time.perf_counter()
+    fig.savefig(pdf, format="pdf")
+    t_pdf = time.perf_counter() - t0
+    plt.close(fig)
+    return t_build, t_png, t_pdf, pdf.tell() / 1024
+
+
+def main():
+    print(
+        f"{'areas':>7} {'renderer':>9} {'build [s]':>10} {'png [s]':>8} {'pdf [s]':>8}"
+        f" {'pdf [KiB]':>10}"
+    )
+    for n in SIZES:
+        features = extract_features_from_df(build_df(n))
+        renderers = {
+            "legacy": lambda f, ax: legacy_render(f, ax, ref_scale=1.0),
+            "batched": lambda f, ax: render_to_matplotlib(f, ax),
+        }
+        for name, render in renderers.items():
+            t_build, t_png, t_pdf, size = timed_render(render, features)
+            print(
+                f"{n:>7} {name:>9} {t_build:>10.3f} {t_png:>8.3f} {t_pdf:>8.3f} {size:>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark merging an expedition of many trips into one survey.
+
+Attaches N synthetic trips (numeric stations plus xxPyy wall vertices) to a root
+survey, once by chaining merge_surveys (which copies and rescans the growing merged
+DataFrame at every step) and once with a single merge_many call, checks that both
+give the same merged views and reports the timings.
+
+Usage:
+    uv run python utility_scripts/bench_merge_many.py
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from cave_sketch.survey.merger import SectionProtocol, SurveyJunction, merge_many, merge_surveys
+
+TRIPS = [10, 40, 80]
+ROWS_PER_TRIP = 5_000
+
+
+def build_trip(n_rows, seed):
+    rng = np.random.default_rng(seed)
+    ids = [str(i) if i % 10 == 0 else f"{i // 10}P{i % 10}" for i in range(n_rows)]
+    links = [f"{ids[i - 1]}-{ids[(i + 1) % n_rows]}" for i in range(n_rows)]
+    return pd.DataFrame(
+        {
+            "Node_Id": ids,
+            "X": rng.normal(size=n_rows).cumsum(),
+            "Y": rng.normal(size=n_rows).cumsum(),
+            "Links": links,
+            "Type": "L_wall",
+        }
+    )
+
+
+def chained(root, trips, stations):
+    merged_map, merged_section = root, root
+    for trip, station in zip(trips, stations):
+        merged_map, merged_section = merge_surveys(
+            merged_map, merged_section, trip, trip, station, "0", SectionProtocol.DISPLACEMENT
+        )
+    return merged_map, merged_section
+
+
+def tree(root, trips, stations):
+    junctions = [SurveyJunction(station, "0", trip, trip) for trip, station in zip(trips, stations)]
+    return merge_many(root, root, junctions, SectionProtocol.DISPLACEMENT)
+
+
+def main():
+    root = build_trip(ROWS_PER_TRIP, seed=0)
+    print(f"{'trips':>6} {'rows':>9} {'chained [s]':>12} {'merge_many [s]':>15} {'speedup':>8}")
+    for n_trips in TRIPS:
+        trips = [build_trip(ROWS_PER_TRIP, seed=k + 1) for k in range(n_trips)]
+        # Every trip hangs off a station of the root survey
+        stations = [str(10 * (k % (ROWS_PER_TRIP // 10))) for k in range(n_trips)]
+
+        t0 = time.perf_counter()
+        expected = chained(root, trips, stations)
+        t_chain = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        result = tree(root, trips, stations)
+        t_tree = time.perf_counter() - t0
+
+        for got, want in zip(result, expected):
+            pd.testing.assert_frame_equal(got, want)
+        rows = len(result[0])
+        print(f"{n_trips:>6} {rows:>9} {t_chain:>12.2f} {t_tree:>15.2f} {t_chain / t_tree:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
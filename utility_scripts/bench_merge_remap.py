@@ -0,0 +1,106 @@
+"""
+Benchmark the child ID remapping of cave_sketch.survey.merger._merge_single_view.
+
+Merges a synthetic TopoDroid-like child survey (one numeric station every ten rows,
+xxPyy wall vertices in between, two links per row) of 10k and 100k rows into a small
+parent survey and compares the timing with the former row-by-row implementation,
+checking that both produce the same merged DataFrame.
+
+Usage:
+    uv run python utility_scripts/bench_merge_remap.py
+"""
+import re
+import time
+
+import numpy as np
+import pandas as pd
+
+from cave_sketch.survey.merger import _merge_single_view
+
+SIZES = [10_000, 100_000]
+
+
+def legacy_remap(parent_df, child_df, parent_station, child_station):
+    """The former ID remapping step (numeric and xxPyy IDs, regex per row)."""
+    parent_df, child_df = parent_df.copy(), child_df.copy()
+    parent_df["Node_Id"] = parent_df["Node_Id"].astype(str)
+    child_df["Node_Id"] = child_df["Node_Id"].astype(str)
+
+    def numeric_ids(df):
+        return {int(nid) for nid in df["Node_Id"] if re.fullmatch(r"\d+", nid)}
+
+    def prefixes(df):
+        return {int(m.group(1)) for nid in df["Node_Id"] if (m := re.match(r"(\d+)P(\d+)", nid))}
+
+    p_row = parent_df[parent_df["Node_Id"] == parent_station].iloc[0]
+    c_row = child_df[child_df["Node_Id"] == child_station].iloc[0]
+    child_df["X"] = child_df["X"] + (p_row["X"] - c_row["X"])
+    child_df["Y"] = child_df["Y"] + (p_row["Y"] - c_row["Y"])
+
+    mapping = {child_station: parent_station}
+    child_ids = numeric_ids(child_df)
+    if child_ids:
+        offset = max(numeric_ids(parent_df) or {0}) + 1 - min(child_ids)
+        for cid in child_ids:
+            if str(cid) != child_station:
+                mapping[str(cid)] = str(cid + offset)
+    child_prefixes = prefixes(child_df)
+    pref_offset = max(prefixes(parent_df) or {0}) + 1 - min(child_prefixes) if child_prefixes else 0
+
+    def remap_id(nid):
+        nid = nid[:-2] if nid.endswith(".0") else nid
+        if nid in mapping:
+            return mapping[nid]
+        m = re.match(r"(\d+)P(\d+)", nid)
+        return f"{int(m.group(1)) + pref_offset}P{m.group(2)}" if m else nid
+
+    def remap_links(value):
+        if pd.isna(value) or not value or value == "-":
+            return "-"
+        text = str(value)
+        text = text[:-2] if text.endswith(".0") else text
+        return "-".join(remap_id(link) for link in text.split("-"))
+
+    child_df = child_df[child_df["Node_Id"] != child_station].reset_index(drop=True)
+    child_df["Node_Id"] = child_df["Node_Id"].apply(remap_id)
+    child_df["Links"] = child_df["Links"].apply(remap_links)
+    return pd.concat([parent_df, child_df], ignore_index=True)
+
+
+def build_df(n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    ids = [str(i) if i % 10 == 0 else f"{i // 10}P{i % 10}" for i in range(n_rows)]
+    links = [f"{ids[i - 1]}-{ids[(i + 1) % n_rows]}" for i in range(n_rows)]
+    return pd.DataFrame(
+        {
+            "Node_Id": ids,
+            "X": rng.normal(size=n_rows),
+            "Y": rng.normal(size=n_rows),
+            "Links": links,
+            "Type": "L_wall",
+        }
+    )
+
+
+def best_of(fn, *args, repeats=3):
+    best, result = float("inf"), None
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return result, best
+
+
+def main():
+    parent = build_df(1_000, seed=1)
+    print(f"{'child rows':>10} {'legacy [s]':>11} {'new [s]':>9} {'speedup':>8}")
+    for n in SIZES:
+        child = build_df(n)
+        old, t_old = best_of(legacy_remap, parent, child, "10", "0")
+        new, t_new = best_of(_merge_single_view, parent, child, "10", "0")
+        pd.testing.assert_frame_equal(old, new)
+        print(f"{n:>10} {t_old:>11.3f} {t_new:>9.3f} {t_old / t_new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
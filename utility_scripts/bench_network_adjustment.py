@@ -0,0 +1,110 @@
+"""
+Benchmark for the NETWORK loop-closure adjustment of merged surveys.
+
+Builds a synthetic child survey of 1k, 10k and 50k stations: a random tree of
+passages (branches of 5 to 40 legs) with extra legs closing loops, plus four wall
+points per station. A fifth of the branch ends are shared with the parent survey,
+with a random misclosure. The benchmark times
+cave_sketch.survey.adjustment.distribute_misclosure and a full
+merge_surveys(..., adjustment=MergeAdjustment.NETWORK), and checks that every
+shared child station was merged into its parent station.
+
+Usage:
+    uv run python utility_scripts/bench_network_adjustment.py
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from cave_sketch.survey.adjustment import MergeAdjustment, distribute_misclosure
+from cave_sketch.survey.merger import merge_surveys
+from cave_sketch.survey.metrics import _station_legs
+
+SIZES = [1_000, 10_000, 50_000]
+WALLS_PER_STATION = 4
+
+
+def build_network(n_stations, seed=0):
+    rng = np.random.default_rng(seed)
+    xy = np.zeros((n_stations, 2))
+    legs = []
+    ends = [0]
+    node = 1
+    while node < n_stations:
+        start = ends[rng.integers(len(ends))] if rng.random() < 0.7 else rng.integers(node)
+        heading = rng.uniform(0, 2 * np.pi)
+        prev = start
+        for _ in range(min(int(rng.integers(5, 40)), n_stations - node)):
+            heading += rng.normal(scale=0.3)
+            xy[node] = xy[prev] + rng.uniform(2, 10) * np.array([np.cos(heading), np.sin(heading)])
+            legs.append((prev, node))
+            prev, node = node, node + 1
+        ends.append(prev)
+    # Loops: join random pairs of branch ends
+    for a, b in rng.choice(ends, size=(len(ends) // 10, 2)):
+        if a != b:
+            legs.append((a, b))
+    return xy, np.array(legs, dtype=np.int64), np.array(ends, dtype=np.int64)
+
+
+def build_df(xy, legs, rng):
+    n = len(xy)
+    ids = np.arange(1, n + 1).astype(str)
+    neighbours = [[] for _ in range(n)]
+    for a, b in legs.tolist():
+        neighbours[a].append(ids[b])
+        neighbours[b].append(ids[a])
+    walls = np.repeat(xy, WALLS_PER_STATION, axis=0) + rng.normal(size=(n * WALLS_PER_STATION, 2))
+    wall_ids = [f"{i}P{j}" for i in range(n) for j in range(WALLS_PER_STATION)]
+    return pd.DataFrame({
+        "Node_Id": list(ids) + wall_ids,
+        "X": np.concatenate([xy[:, 0], walls[:, 0]]),
+        "Y": np.concatenate([xy[:, 1], walls[:, 1]]),
+        "Links": ["-".join(nb) or "-" for nb in neighbours] + ["-"] * len(wall_ids),
+        "Type": ["station"] * n + ["L_wall"] * len(wall_ids),
+    })
+
+
+def main():
+    print(f"{'stations':>9} {'anchors':>8} {'distribute [s]':>15} {'merge [s]':>10}")
+    for n in SIZES:
+        rng = np.random.default_rng(n)
+        xy, legs, ends = build_network(n)
+        shared = np.unique(np.concatenate([[0], rng.choice(ends, size=len(ends) // 5)]))
+        child = build_df(xy, legs, rng)
+
+        # Parent: the shared stations, offset by a misclosure of up to 2 m
+        parent_xy = xy[shared] + rng.uniform(-2, 2, size=(len(shared), 2))
+        parent_xy[0] = xy[0]
+        parent_ids = [f"p{i}" for i in range(len(shared))]
+        parent = pd.DataFrame({
+            "Node_Id": parent_ids,
+            "X": parent_xy[:, 0],
+            "Y": parent_xy[:, 1],
+            "Links": ["-"] * len(shared),
+            "Type": ["station"] * len(shared),
+        })
+
+        coords, station_legs = _station_legs(child)
+        anchors = coords.index.get_indexer((shared + 1).astype(str))
+        t0 = time.perf_counter()
+        distribute_misclosure(
+            coords.to_numpy(dtype=float), station_legs, anchors, parent_xy - xy[shared]
+        )
+        t_distribute = time.perf_counter() - t0
+
+        pairs = [(p, str(s + 1)) for p, s in zip(parent_ids[1:], shared[1:])]
+        t0 = time.perf_counter()
+        merged, _ = merge_surveys(
+            parent, None, child, None, "p0", "1",
+            shared_stations=pairs, adjustment=MergeAdjustment.NETWORK,
+        )
+        t_merge = time.perf_counter() - t0
+
+        assert len(merged) == len(parent) + len(child) - len(shared)
+        print(f"{n:>9} {len(shared):>8} {t_distribute:>15.3f} {t_merge:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
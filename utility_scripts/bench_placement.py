@@ -0,0 +1,79 @@
+"""
+Benchmark of the rule / north arrow corner placement.
+
+Times the former score_corners (eight boolean-mask passes over all the points)
+against cave_sketch.survey.graphics.placement.score_corners counting the eight
+zones in one pass, then a whole compute_dual_layout call, on random-walk surveys
+of 10k, 100k and 1M points, and checks that the scores match.
+
+Usage:
+    uv run python utility_scripts/bench_placement.py
+"""
+import time
+
+import numpy as np
+
+from cave_sketch.survey.graphics import placement
+from cave_sketch.survey.graphics.placement import compute_dual_layout, score_corners
+
+SIZES = [10_000, 100_000, 1_000_000]
+RULE_LENGTH = 20.0
+
+
+def legacy_score_corners(x, y, padding_x, padding_y, zone_fraction=0.20):
+    """Former score_corners with absolute padding: one mask pass per zone."""
+    x_min, x_max, y_min, y_max = placement.compute_data_bbox(x, y)
+    zone_w = (x_max - x_min) * zone_fraction
+    zone_h = (y_max - y_min) * zone_fraction
+    zones = {
+        "bottom-left": ((x_min, x_min + zone_w, y_min, y_min + zone_h),
+                        (x_min, x_min + padding_x, y_min, y_min + padding_y)),
+        "bottom-right": ((x_max - zone_w, x_max, y_min, y_min + zone_h),
+                         (x_max - padding_x, x_max, y_min, y_min + padding_y)),
+        "top-left": ((x_min, x_min + zone_w, y_max - zone_h, y_max),
+                     (x_min, x_min + padding_x, y_max - padding_y, y_max)),
+        "top-right": ((x_max - zone_w, x_max, y_max - zone_h, y_max),
+                      (x_max - padding_x, x_max, y_max - padding_y, y_max)),
+    }
+    scores = {}
+    for name, ((x0, x1, y0, y1), (px0, px1, py0, py1)) in zones.items():
+        count = np.sum((x >= x0) & (x <= x1) & (y >= y0) & (y <= y1))
+        if np.sum((x >= px0) & (x <= px1) & (y >= py0) & (y <= py1)) > 0:
+            count += 1000000
+        scores[name] = float(count)
+    return scores
+
+
+def build_points(n_points, seed=0):
+    rng = np.random.default_rng(seed)
+    steps = rng.normal(size=(n_points, 2))
+    xy = np.cumsum(steps, axis=0)
+    return xy[:, 0], xy[:, 1]
+
+
+def timed(fn, *args, **kwargs):
+    t0 = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - t0
+
+
+def main():
+    print(
+        f"{'points':>10} {'legacy [s]':>11} {'one pass [s]':>13} {'layout [s]':>11}"
+    )
+    for n in SIZES:
+        x, y = build_points(n)
+        padding_x = padding_y = 0.05 * max(np.ptp(x), np.ptp(y))
+        padding = {"padding_x_units": padding_x, "padding_y_units": padding_y}
+
+        old, t_old = timed(legacy_score_corners, x, y, padding_x, padding_y)
+        new, t_pass = timed(score_corners, x, y, **padding)
+        assert old == new, (old, new)
+
+        ref_scale = max(np.ptp(x), np.ptp(y))
+        _, t_layout = timed(compute_dual_layout, x, y, RULE_LENGTH, ref_scale * 0.07, ref_scale)
+        print(f"{n:>10} {t_old:>11.4f} {t_pass:>13.4f} {t_layout:>11.4f}")
+
+
+if __name__ == "__main__":
+    main()
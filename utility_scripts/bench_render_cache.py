@@ -0,0 +1,85 @@
+"""
+Benchmark for the survey render cache.
+
+Renders a synthetic survey (meandering walls with 10 cm steps and a station
+every 10 m, 10k, 100k and 300k rows) and exports it to PDF, the way
+draw_survey does: with render_survey, then with a RenderCache on a cold
+render, on a surveyor-name-only edit (only the title block is redrawn) and
+on an unchanged re-render (cached PDF bytes).
+
+Usage:
+    uv run python utility_scripts/bench_render_cache.py
+"""
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from cave_sketch.survey.config import SurveyConfig
+from cave_sketch.survey.pdf import export_pdf_bytes
+from cave_sketch.survey.render_cache import RenderCache
+from cave_sketch.survey.renderer import render_survey
+
+SIZES = [10_000, 100_000, 300_000]
+VERTICES_PER_WALL = 1_000
+
+
+def build_df(n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    n_walls = max(n_rows // VERTICES_PER_WALL, 1)
+    heading = np.cumsum(rng.normal(scale=0.05, size=(n_walls, VERTICES_PER_WALL)), axis=1)
+    steps = 0.1 * np.stack([np.cos(heading), np.sin(heading)], axis=-1)
+    xy = (np.cumsum(steps, axis=1) + rng.uniform(0, 300, size=(n_walls, 1, 2))).reshape(-1, 2)
+
+    wall, vertex = np.divmod(np.arange(len(xy)), VERTICES_PER_WALL)
+    ids = [f"{w}P{v}" for w, v in zip(wall, vertex)]
+    links = [
+        "-".join(f"{w}P{v + d}" for d in (-1, 1) if 0 <= v + d < VERTICES_PER_WALL) or "-"
+        for w, v in zip(wall, vertex)
+    ]
+    stations = xy[::100]
+    return pd.DataFrame({
+        "Node_Id": ids + [str(i) for i in range(1, len(stations) + 1)],
+        "Links": links + ["-"] * len(stations),
+        "X": np.concatenate([xy[:, 0], stations[:, 0]]),
+        "Y": np.concatenate([xy[:, 1], stations[:, 1]]),
+        "Type": ["L_wall"] * len(xy) + ["station"] * len(stations),
+    })
+
+
+def timed(fn, *args, **kwargs):
+    t0 = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - t0
+
+
+def render_and_export(render, pdf, df, surveyor):
+    fig = render(df, SurveyConfig(surveyor_name=surveyor, fast_labels=True), title="Grotta")
+    return fig, pdf(fig)
+
+
+def main():
+    print(
+        f"{'rows':>8} {'uncached [s]':>13} {'cold [s]':>9} {'title edit [s]':>15}"
+        f" {'unchanged [s]':>14}"
+    )
+    for n in SIZES:
+        df = build_df(n)
+        (fig, _), t_plain = timed(render_and_export, render_survey, export_pdf_bytes, df, "Ada")
+        plt.close(fig)
+
+        cache = RenderCache()
+        _, t_cold = timed(render_and_export, cache.render, cache.pdf_bytes, df, "Ada")
+        _, t_title = timed(render_and_export, cache.render, cache.pdf_bytes, df, "Bea")
+        _, t_same = timed(render_and_export, cache.render, cache.pdf_bytes, df, "Bea")
+        assert (cache.hits, cache.misses) == (2, 1)
+        cache.clear()
+        print(f"{n:>8} {t_plain:>13.3f} {t_cold:>9.3f} {t_title:>15.3f} {t_same:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Micro-benchmark for the survey feature extraction.
+
+Times the former row-by-row extract_features_from_df (itertuples, per-link
+STYLE_MAP lookups, list membership for excluded nodes) against
+cave_sketch.features.render_features.extract_features_from_df, the array
+extractor extract_segments_from_df and the FeatureSet extractor
+extract_feature_set_from_df on synthetic surveys of 10k, 100k and 1M rows
+with 100 excluded nodes, and checks that both extractors produce the same features.
+
+Usage:
+    uv run python utility_scripts/bench_render_features.py
+"""
+import time
+from typing import Any, Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+from cave_sketch.features.render_features import (
+    extract_feature_set_from_df,
+    extract_features_from_df,
+    extract_segments_from_df,
+)
+from cave_sketch.style import STYLE_MAP
+
+SIZES = [10_000, 100_000, 1_000_000]
+N_EXCLUDED = 100
+
+
+def legacy_lines_and_points(df, excluded_nodes, show_centerline=True):
+    """Lines and points part of the former extract_features_from_df."""
+    features: Dict[str, list] = {"lines": [], "points": []}
+    coord_index: Dict[Any, Tuple[float, float]] = {}
+    for row in df.itertuples(index=False):
+        if row.Node_Id not in coord_index:
+            coord_index[row.Node_Id] = (row.X, row.Y)
+
+    for row in df.itertuples(index=False):
+        nid, x, y, links, typ = row.Node_Id, row.X, row.Y, row.Links, row.Type
+        if nid in excluded_nodes or typ.startswith("A_"):
+            continue
+        if not show_centerline and typ == "station":
+            continue
+        style_type = STYLE_MAP.get(typ, {}).get("type", "line")
+        if style_type == "point":
+            style = STYLE_MAP.get(typ, {"color": "black", "marker": "o", "markersize": 6})
+            features["points"].append(
+                {
+                    "coords": [y, x],
+                    "color": style.get("color", "black"),
+                    "marker": style.get("marker", "o"),
+                    "size": style.get("markersize", 6),
+                    "popup": f"{typ} ({nid})",
+                }
+            )
+            continue
+        if pd.notna(links) and links != "-":
+            neighbors = [
+                nbr.strip() for nbr in links.split("-") if nbr.strip() and nbr not in excluded_nodes
+            ]
+            for nbr in neighbors:
+                if nbr not in coord_index:
+                    continue
+                x2, y2 = coord_index[nbr]
+                if style_type == "line":
+                    style = STYLE_MAP.get(typ, STYLE_MAP["L_wall"])
+                    features["lines"].append(
+                        {
+                            "coords": [[y, x], [y2, x2]],
+                            "color": style.get("color", "black"),
+                            "weight": style.get("weight", 1),
+                            "dash": None if style.get("linestyle", "solid") == "solid" else [3, 7],
+                            "popup": f"{typ} ({nid}-{nbr})",
+                        }
+                    )
+    return features
+
+
+def build_df(n_rows, seed=0):
+    """Wall polylines of 100 vertices, a station every 20 rows and 5% blocks."""
+    rng = np.random.default_rng(seed)
+    chain, vertex = np.divmod(np.arange(n_rows), 100)
+    ids = [f"{c}P{v}" for c, v in zip(chain, vertex)]
+    links = [
+        "-".join(f"{c}P{v + d}" for d in (-1, 1) if 0 <= v + d < 100)
+        for c, v in zip(chain, vertex)
+    ]
+    types = np.full(n_rows, "L_wall", dtype=object)
+    types[::20] = "station"
+    types[rng.random(n_rows) < 0.05] = "BLOCK"
+    return pd.DataFrame(
+        {
+            "Node_Id": ids,
+            "Links": links,
+            "X": rng.normal(size=n_rows),
+            "Y": rng.normal(size=n_rows),
+            "Type": types,
+        }
+    )
+
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - t0
+
+
+def main():
+    print(
+        f"{'rows':>10} {'legacy [s]':>11} {'dicts [s]':>10} {'arrays [s]':>11}"
+        f" {'feature set [s]':>16} {'speedup':>8}"
+    )
+    for n in SIZES:
+        df = build_df(n)
+        excluded = df["Node_Id"].sample(N_EXCLUDED, random_state=0).tolist()
+
+        old, t_old = timed(legacy_lines_and_points, df, excluded)
+        new, t_new = timed(extract_features_from_df, df, excluded)
+        assert old["lines"] == new["lines"] and old["points"] == new["points"]
+        segments, t_arr = timed(extract_segments_from_df, df, excluded)
+        assert len(segments) == len(old["lines"])
+        features, t_set = timed(extract_feature_set_from_df, df, excluded)
+        assert len(features.segments) == len(segments)
+        print(
+            f"{n:>10} {t_old:>11.3f} {t_new:>10.3f} {t_arr:>11.3f} {t_set:>16.3f}"
+            f" {t_old / t_arr:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
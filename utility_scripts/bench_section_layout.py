@@ -0,0 +1,71 @@
+"""
+Benchmark for DISPLACEMENT placement of many section views.
+
+Merges 12, 24 and 48 synthetic child sections (2k points each) into a root
+section with cave_sketch.survey.merger.merge_many and reports the merge time and
+the bounding box of the resulting page, compared with the former placement that
+lined every child up to the right of everything placed so far.
+
+Usage:
+    uv run python utility_scripts/bench_section_layout.py
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from cave_sketch.survey.merger import SectionProtocol, SurveyJunction, merge_many
+
+SIZES = [12, 24, 48]
+POINTS = 2_000
+PADDING = 50.0
+
+
+def build_section(length, depth, seed):
+    rng = np.random.default_rng(seed)
+    x = np.sort(rng.uniform(0.0, length, POINTS))
+    x[0] = 0.0
+    y = -depth * x / length + rng.normal(scale=5.0, size=POINTS)
+    y[0] = 0.0
+    ids = [str(i) for i in range(1, POINTS + 1)]
+    links = [str(i + 1) if i < POINTS else "-" for i in range(1, POINTS + 1)]
+    return pd.DataFrame(
+        {"Node_Id": ids, "X": x, "Y": y, "Links": links, "Type": ["station"] * POINTS}
+    )
+
+
+def legacy_extent(root, children):
+    """Page size when every child is shifted right of the current largest X."""
+    max_x, min_y, max_y = root["X"].max(), root["Y"].min(), root["Y"].max()
+    for child in children:
+        max_x += PADDING + child["X"].max() - child["X"].min()
+        min_y = min(min_y, child["Y"].min())
+        max_y = max(max_y, child["Y"].max())
+    return max_x - root["X"].min(), max_y - min_y
+
+
+def main():
+    root = build_section(3000.0, 400.0, seed=0)
+    print(f"{'children':>8} {'time [s]':>9} {'page now [m]':>16} {'page before [m]':>18}")
+    for n in SIZES:
+        rng = np.random.default_rng(n)
+        children = [
+            build_section(rng.uniform(100, 600), rng.uniform(20, 200), seed=i) for i in range(n)
+        ]
+        junctions = [
+            SurveyJunction(str(rng.integers(1, POINTS)), "1", child_section=child)
+            for child in children
+        ]
+
+        t0 = time.perf_counter()
+        _, merged = merge_many(None, root, junctions, SectionProtocol.DISPLACEMENT)
+        elapsed = time.perf_counter() - t0
+
+        width = merged["X"].max() - merged["X"].min()
+        height = merged["Y"].max() - merged["Y"].min()
+        old_w, old_h = legacy_extent(root, children)
+        print(f"{n:>8} {elapsed:>9.3f} {width:>7.0f} x {height:<6.0f} {old_w:>9.0f} x {old_h:<6.0f}")
+
+
+if __name__ == "__main__":
+    main()
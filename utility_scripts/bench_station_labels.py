@@ -0,0 +1,76 @@
+"""
+Benchmark for the station labels of create_survey.
+
+Draws a synthetic survey of 1k, 3k and 10k stations (a random walk centreline)
+on an A4 figure, once with one Text artist per station and once with
+``fast_labels`` (a single StationLabels artist culling overlapping labels on a
+spatial grid). Reports the create_survey, PNG and PDF times and how many labels
+the fast mode kept.
+
+Usage:
+    uv run python utility_scripts/bench_station_labels.py
+"""
+import io
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from cave_sketch.survey.graphics.labels import StationLabels
+from cave_sketch.survey.graphics.survey_plot import create_survey
+
+SIZES = [1_000, 3_000, 10_000]
+
+
+def build_df(n_stations, seed=0):
+    rng = np.random.default_rng(seed)
+    steps = rng.normal(size=(n_stations, 2)) * 5
+    xy = np.cumsum(steps, axis=0)
+    ids = [str(i) for i in range(1, n_stations + 1)]
+    links = [
+        "-".join(ids[j] for j in (i - 1, i + 1) if 0 <= j < n_stations)
+        for i in range(n_stations)
+    ]
+    return pd.DataFrame(
+        {"Node_Id": ids, "Links": links, "X": xy[:, 0], "Y": xy[:, 1], "Type": "station"}
+    )
+
+
+def timed_survey(df, fast_labels):
+    fig, ax = plt.subplots(figsize=(8.27, 11.69))
+    config = {"marker_zoom": 0.0, "text_zoom": 0.0, "fast_labels": fast_labels}
+    t0 = time.perf_counter()
+    create_survey(df, rule_flag=False, north_flag=False, config=config, ax=ax)
+    t_build = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    fig.savefig(io.BytesIO(), format="png", dpi=150)
+    t_png = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    fig.savefig(io.BytesIO(), format="pdf")
+    t_pdf = time.perf_counter() - t0
+    labels = [a for a in ax.artists if isinstance(a, StationLabels)]
+    n_labels = len(labels[0].drawn) if labels else len(ax.texts)
+    plt.close(fig)
+    return t_build, t_png, t_pdf, n_labels
+
+
+def main():
+    print(
+        f"{'stations':>9} {'mode':>6} {'build [s]':>10} {'png [s]':>8} {'pdf [s]':>8}"
+        f" {'labels':>7}"
+    )
+    for n in SIZES:
+        df = build_df(n)
+        for mode, fast in (("texts", False), ("fast", True)):
+            t_build, t_png, t_pdf, n_labels = timed_survey(df, fast)
+            print(
+                f"{n:>9} {mode:>6} {t_build:>10.3f} {t_png:>8.3f} {t_pdf:>8.3f} {n_labels:>7}"
+            )
+
+
+if __name__ == "__main__":
+    main()
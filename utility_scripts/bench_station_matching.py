@@ -0,0 +1,56 @@
+"""
+Benchmark station/leg matching in cave_sketch.dxf.parser._get_stations.
+
+Builds synthetic TopoDroid-like modelspaces (STATION TEXT+LINE pairs and LEG lines
+along a random walk) with 100 to 100k stations and times the matching. The time per
+station should stay roughly constant, i.e. the matching scales linearly.
+
+Usage:
+    uv run python utility_scripts/bench_station_matching.py
+"""
+import time
+
+import ezdxf
+import numpy as np
+
+from cave_sketch.dxf.parser import _get_stations, _scan_modelspace
+
+SIZES = [100, 1_000, 10_000, 100_000]
+
+
+def build_msp(n_stations, seed=0):
+    rng = np.random.default_rng(seed)
+    steps = rng.normal(scale=5.0, size=(n_stations, 2))
+    coords = np.cumsum(steps, axis=0)
+
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for idx, (x, y) in enumerate(coords):
+        msp.add_text(str(idx), dxfattribs={"layer": "STATION"})
+        msp.add_line((x, y), (x + 0.5, y), dxfattribs={"layer": "STATION"})
+    for (x1, y1), (x2, y2) in zip(coords[:-1], coords[1:]):
+        msp.add_line((x1, y1), (x2, y2), dxfattribs={"layer": "LEG"})
+    return msp
+
+
+def bench(n_stations, tolerance=0.0, repeats=3):
+    scan = _scan_modelspace(build_msp(n_stations))
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        stations = _get_stations(scan, tolerance=tolerance)
+        best = min(best, time.perf_counter() - t0)
+    linked = sum(1 for item in stations.values() if "links" in item)
+    return best, linked
+
+
+def main():
+    print(f"{'stations':>10} {'tolerance':>10} {'time [s]':>10} {'us/station':>11} {'linked':>8}")
+    for n in SIZES:
+        for tol in (0.0, 1e-3):
+            elapsed, linked = bench(n, tolerance=tol)
+            print(f"{n:>10} {tol:>10g} {elapsed:>10.4f} {elapsed / n * 1e6:>11.2f} {linked:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Micro-benchmark for the survey DataFrame <-> CaveSurvey converters.
+
+Times cave_sketch.survey.converters.survey_to_df against the former row-by-row
+conversion, and normalize_survey_df against the former CaveSurvey round trip of a
+DataFrame, on synthetic surveys of 10k, 100k and 1M rows, and checks that both
+produce the same result.
+
+Usage:
+    uv run python utility_scripts/bench_survey_converters.py
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from cave_sketch.dxf.models import CaveSurvey, SurveyPoint
+from cave_sketch.survey.converters import normalize_survey_df, survey_to_df
+
+SIZES = [10_000, 100_000, 1_000_000]
+
+
+def legacy_df_to_survey(df, name):
+    survey = CaveSurvey(name=name)
+    for _, row in df.iterrows():
+        links_str = row["Links"]
+        links = [link.strip() for link in str(links_str).split("-") if link.strip() and link != "-"]
+        survey.points.append(
+            SurveyPoint(
+                id=str(row["Node_Id"]),
+                x=float(row["X"]),
+                y=float(row["Y"]),
+                point_type=str(row["Type"]),
+                links=links,
+            )
+        )
+    return survey
+
+
+def legacy_survey_to_df(survey):
+    data = []
+    for p in survey.points:
+        links_str = "-".join(p.links) if p.links else "-"
+        data.append([p.id, links_str, p.x, p.y, p.point_type])
+    return pd.DataFrame(data, columns=["Node_Id", "Links", "X", "Y", "Type"])
+
+
+def build_df(n_rows, seed=0):
+    """Polyline-like survey: chains of 100 wall vertices plus a few blocks."""
+    rng = np.random.default_rng(seed)
+    chain, vertex = np.divmod(np.arange(n_rows), 100)
+    ids = [f"{c}P{v}" for c, v in zip(chain, vertex)]
+    links = []
+    for c, v in zip(chain, vertex):
+        nbrs = []
+        if v > 0:
+            nbrs.append(f"{c}P{v - 1}")
+        if v < 99:
+            nbrs.append(f"{c}P{v + 1}")
+        links.append("-".join(nbrs))
+    types = np.where(rng.random(n_rows) < 0.05, "BLOCK", "L_wall")
+    links = [link if t == "L_wall" else "-" for link, t in zip(links, types)]
+    return pd.DataFrame(
+        {
+            "Node_Id": ids,
+            "Links": links,
+            "X": rng.normal(size=n_rows),
+            "Y": rng.normal(size=n_rows),
+            "Type": types,
+        }
+    )
+
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - t0
+
+
+def main():
+    print(f"{'rows':>10} {'converter':>14} {'legacy [s]':>11} {'new [s]':>9} {'speedup':>8}")
+    for n in SIZES:
+        df = build_df(n)
+
+        survey = legacy_df_to_survey(df, "bench")
+        old_df, t_old = timed(legacy_survey_to_df, survey)
+        new_df, t_new = timed(survey_to_df, survey)
+        pd.testing.assert_frame_equal(old_df, new_df)
+        print(f"{n:>10} {'survey_to_df':>14} {t_old:>11.3f} {t_new:>9.3f} {t_old / t_new:>7.1f}x")
+
+        # Former path of a DataFrame to the renderer: a round trip through CaveSurvey
+        old_df, t_old = timed(lambda: legacy_survey_to_df(legacy_df_to_survey(df, "bench")))
+        new_df, t_new = timed(normalize_survey_df, df)
+        pd.testing.assert_frame_equal(old_df, new_df)
+        print(f"{n:>10} {'normalize':>14} {t_old:>11.3f} {t_new:>9.3f} {t_old / t_new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Memory benchmark for the survey point models.
+
+Allocates a 1M-point survey with the legacy dict-backed dataclasses (one fresh
+``links`` list per point) and with the slotted models of cave_sketch.dxf.models
+(shared NO_LINKS sentinel for points without links) and reports bytes per point.
+The mix mimics a TopoDroid export: mostly wall vertices with two links, some
+stations and link-less block points. ID and type strings are shared by both runs
+so only the per-point overhead is compared.
+
+Usage:
+    uv run python utility_scripts/bench_survey_memory.py
+"""
+import gc
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import List
+
+from cave_sketch.dxf.models import NO_LINKS, SurveyPoint
+
+N_POINTS = 1_000_000
+BLOCK_FRACTION = 0.3
+
+
+@dataclass
+class LegacySurveyPoint:
+    id: str
+    x: float
+    y: float
+    z: float = 0.0
+    point_type: str = "station"
+    links: List[str] = field(default_factory=list)
+
+
+def build(point_cls, ids, empty_links):
+    n_blocks = int(N_POINTS * BLOCK_FRACTION)
+    points = []
+    for i in range(N_POINTS):
+        if i < n_blocks:
+            links = empty_links()
+            ptype = "BLOCK"
+        else:
+            links = [ids[i - 1], ids[(i + 1) % N_POINTS]]
+            ptype = "L_wall"
+        points.append(point_cls(id=ids[i], x=float(i), y=float(i), point_type=ptype, links=links))
+    return points
+
+
+def measure(point_cls, ids, empty_links):
+    gc.collect()
+    tracemalloc.start()
+    points = build(point_cls, ids, empty_links)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del points
+    return current / N_POINTS
+
+
+def main():
+    ids = [f"{i // 100}P{i % 100}" for i in range(N_POINTS)]
+    before = measure(LegacySurveyPoint, ids, list)
+    after = measure(SurveyPoint, ids, lambda: NO_LINKS)
+    print(f"points: {N_POINTS:,} ({BLOCK_FRACTION:.0%} without links)")
+    print(f"before (dict dataclass): {before:8.1f} bytes/point")
+    print(f"after  (slots + NO_LINKS): {after:6.1f} bytes/point")
+    print(f"saving: {1 - after / before:.1%}")
+
+
+if __name__ == "__main__":
+    main()
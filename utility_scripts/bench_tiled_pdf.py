@@ -0,0 +1,82 @@
+"""
+Benchmark for the tiled multi-page PDF export.
+
+Exports a synthetic cave of 100k rows (meandering walls with 10 cm steps and a
+station every 10 m) spread over 300 m to 3 km with export_tiled_pdf at 1:500,
+and reports the number of pages, the export time, the peak traced memory of
+the export and the size of the survey frame it starts from. Pages are
+streamed, so the peak follows the survey arrays, not the number of pages.
+
+Usage:
+    uv run python utility_scripts/bench_tiled_pdf.py
+"""
+import re
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import matplotlib
+
+matplotlib.use("Agg")
+import numpy as np
+import pandas as pd
+
+from cave_sketch.survey.config import SurveyConfig
+from cave_sketch.survey.tiled_pdf import export_tiled_pdf
+
+N_ROWS = 100_000
+EXTENTS = [300, 1_000, 3_000]
+VERTICES_PER_WALL = 1_000
+SCALE = 500
+
+
+def build_df(n_rows, extent, seed=0):
+    rng = np.random.default_rng(seed)
+    n_walls = max(n_rows // VERTICES_PER_WALL, 1)
+    heading = np.cumsum(rng.normal(scale=0.05, size=(n_walls, VERTICES_PER_WALL)), axis=1)
+    steps = 0.1 * np.stack([np.cos(heading), np.sin(heading)], axis=-1)
+    start = rng.uniform(0, extent, size=(n_walls, 1, 2))
+    xy = (np.cumsum(steps, axis=1) + start).reshape(-1, 2)
+
+    wall, vertex = np.divmod(np.arange(len(xy)), VERTICES_PER_WALL)
+    ids = [f"{w}P{v}" for w, v in zip(wall, vertex)]
+    links = [
+        "-".join(f"{w}P{v + d}" for d in (-1, 1) if 0 <= v + d < VERTICES_PER_WALL) or "-"
+        for w, v in zip(wall, vertex)
+    ]
+    stations = xy[::100]
+    return pd.DataFrame({
+        "Node_Id": ids + [str(i) for i in range(1, len(stations) + 1)],
+        "Links": links + ["-"] * len(stations),
+        "X": np.concatenate([xy[:, 0], stations[:, 0]]),
+        "Y": np.concatenate([xy[:, 1], stations[:, 1]]),
+        "Type": ["L_wall"] * len(xy) + ["station"] * len(stations),
+    })
+
+
+def main():
+    print(
+        f"{'rows':>8} {'extent [m]':>11} {'pages':>6} {'export [s]':>11}"
+        f" {'peak [MB]':>10} {'frame [MB]':>11}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp) / "tiled.pdf"
+        for extent in EXTENTS:
+            df = build_df(N_ROWS, extent)
+            frame_mb = df.memory_usage(deep=True).sum() / 1e6
+            tracemalloc.start()
+            t0 = time.perf_counter()
+            export_tiled_pdf(df, output, scale=SCALE, config=SurveyConfig(fast_labels=True))
+            elapsed = time.perf_counter() - t0
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            pages = len(re.findall(rb"/Type /Page\b(?!s)", output.read_bytes()))
+            print(
+                f"{N_ROWS:>8} {extent:>11} {pages:>6} {elapsed:>11.2f}"
+                f" {peak / 1e6:>10.1f} {frame_mb:>11.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()